@@ -25,8 +25,11 @@ class JsonInterfaceGenerator(object):
 
 	"""
 
-	def __init__(self, protocol_version="1.2", debug_prints=False, *args, **kwargs):
-		""" init """
+	def __init__(self, protocol_version="1.2", debug_prints=False, async_mode=False, *args, **kwargs):
+		"""
+		If `async_mode` is true, the generated class is `AsyncChromeRemoteDebugInterface`, where each
+		remote method is a coroutine that awaits the command response from `AsyncChromeInterface`.
+		"""
 
 		super().__init__(*args, **kwargs)
 
@@ -38,6 +41,7 @@ class JsonInterfaceGenerator(object):
 		self.line_num = 0
 
 		self.do_debug_prints = debug_prints
+		self.async_mode      = async_mode
 
 		self.types = {}
 		self.protocol = self.__load_protocol(protocol_version)
@@ -101,9 +105,14 @@ class JsonInterfaceGenerator(object):
 
 		# print(body)
 
+		if self.async_mode:
+			class_name, base_name = "AsyncChromeRemoteDebugInterface", "AsyncChromeInterface"
+		else:
+			class_name, base_name = "ChromeRemoteDebugInterface", "ChromeInterface"
+
 		self.interface_class = ast.ClassDef(
-				name           = "ChromeRemoteDebugInterface",
-				bases          = [ast.Name(id="ChromeInterface", ctx=ast.Load())],
+				name           = class_name,
+				bases          = [ast.Name(id=base_name, ctx=ast.Load())],
 				body           = body,
 				keywords       = [],
 				decorator_list = [],
@@ -421,6 +430,9 @@ class JsonInterfaceGenerator(object):
 			raise RuntimeError("This script only functions on python 3.4, 3.5, 3.6, or 3.7. Active python version {}.{}".format(*sys.version_info))
 
 
+		if self.async_mode:
+			communicate_call = ast.Await(value=communicate_call)
+
 		do_communicate = ast.Assign(targets=[ast.Name(id='subdom_funcs', ctx=ast.Store())], value=communicate_call)
 		func_ret = ast.Return(value=ast.Name(id='subdom_funcs', ctx=ast.Load()))
 
@@ -448,7 +460,9 @@ class JsonInterfaceGenerator(object):
 					defaults=[],
 					kw_defaults=[])
 
-		func = ast.FunctionDef(
+		func_type = ast.AsyncFunctionDef if self.async_mode else ast.FunctionDef
+
+		func = func_type(
 			name = "{}_{}".format(full_name, func_name),
 			args = sig,
 			body = func_body,
@@ -461,11 +475,18 @@ class JsonInterfaceGenerator(object):
 
 	def __to_module(self):
 
-		module_components = [
-			ast.ImportFrom(module="ChromeController.transport",    names=[ast.alias('ChromeExecutionManager', None)], level=0),
-			ast.ImportFrom(module="ChromeController.manager_base", names=[ast.alias('ChromeInterface',     None)], level=0),
-			self.interface_class,
-		]
+		if self.async_mode:
+			module_components = [
+				ast.ImportFrom(module="ChromeController.async_transport", names=[ast.alias('AsyncChromeExecutionManager', None)], level=0),
+				ast.ImportFrom(module="ChromeController.manager_base",    names=[ast.alias('AsyncChromeInterface',        None)], level=0),
+				self.interface_class,
+			]
+		else:
+			module_components = [
+				ast.ImportFrom(module="ChromeController.transport",    names=[ast.alias('ChromeExecutionManager', None)], level=0),
+				ast.ImportFrom(module="ChromeController.manager_base", names=[ast.alias('ChromeInterface',     None)], level=0),
+				self.interface_class,
+			]
 
 		if sys.version_info >= (3, 8):
 			mod = ast.Module(module_components, [], lineno=self.__get_line(), col_offset=1)
@@ -487,16 +508,16 @@ class JsonInterfaceGenerator(object):
 		mod = self.__to_module()
 		code = compile(self.__to_module(), "no filename", "exec")
 		exec(code)
-		built_class = locals()['ChromeRemoteDebugInterface']
+		built_class = locals()[self.interface_class.name]
 
 		return built_class
 
-def get_source(protocol_version=None):
-	instance = JsonInterfaceGenerator(protocol_version=protocol_version)
+def get_source(protocol_version=None, async_mode=False):
+	instance = JsonInterfaceGenerator(protocol_version=protocol_version, async_mode=async_mode)
 	return instance.dump_class()
 
-def get_class_def(protocol_version=None):
-	instance = JsonInterfaceGenerator(protocol_version=protocol_version)
+def get_class_def(protocol_version=None, async_mode=False):
+	instance = JsonInterfaceGenerator(protocol_version=protocol_version, async_mode=async_mode)
 	ret = instance.compile_class()
 	return ret
 
@@ -516,14 +537,17 @@ def print_file_ast():
 	print(astor.dump_tree(this_ast))
 
 def update_generated_class(output_diff, protocolversion="1.2"):
+	_update_generated_file("Generated.py",      output_diff, protocolversion, async_mode=False)
+	_update_generated_file("AsyncGenerated.py", output_diff, protocolversion, async_mode=True)
+
+def _update_generated_file(gen_filename, output_diff, protocolversion, async_mode):
 	log = logging.getLogger("Main.ChromeController.WrapperGenCaller")
-	gen_filename = "Generated.py"
 	cur_file = os.path.abspath(__file__)
 	cur_dir  = os.path.dirname(cur_file)
 
 	fname = os.path.join(cur_dir, gen_filename)
 
-	cls_def = get_source(protocol_version=protocolversion)
+	cls_def = get_source(protocol_version=protocolversion, async_mode=async_mode)
 	try:
 		with open(fname, "r", encoding='utf-8') as fp:
 			have = fp.read()
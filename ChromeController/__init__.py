@@ -1,9 +1,15 @@
 
 from .tab_pool import TabPooledChromium
+from .tab_pool import ShardedTabPooledChromium
+from .process_pool import ChromiumProcessPool
+from .worker_pool import ChromiumWorkerPool
 from .chrome_context import ChromeContext
 
 from .transport import ChromeExecutionManager
 from .manager import ChromeRemoteDebugInterface
+from .async_transport import AsyncChromeExecutionManager
+from .async_manager import AsyncChromeRemoteDebugInterface
+from .wire_trace import WireTrace
 from .Generator import gen
 
 from .cr_exceptions import ChromeControllerException
@@ -0,0 +1,355 @@
+
+import time
+
+import ChromeController.filter_funcs as filter_funcs
+
+from ChromeController.cr_exceptions import ChromeResponseNotReceived
+from ChromeController.cr_exceptions import ChromeNavigateTimedOut
+from ChromeController.cr_exceptions import ChromeError
+from ChromeController import b64_decode
+
+# We use the generated wrapper. If you want a different version, use the CLI interface to update.
+from ChromeController.Generator.AsyncGenerated import AsyncChromeRemoteDebugInterface as AsyncChromeRemoteDebugInterface_base
+
+DEFAULT_TIMEOUT_SECS = 10
+
+
+class AsyncChromeRemoteDebugInterface(AsyncChromeRemoteDebugInterface_base):
+	'''
+	asyncio remote control class for Chromium.
+
+	All the generated remote methods, as well as the higher level calls here are
+	coroutines. Because the debug interface setup requires sending commands, the
+	instance must be started (`await cr.start()`) before use. Using the instance as
+	an async context manager does this automatically:
+
+	```
+		async with AsyncChromeRemoteDebugInterface(binary="google-chrome") as cr:
+			resp = await cr.blocking_navigate_and_get_source("http://www.google.com")
+	```
+
+	All tabs (from `new_tab()`) share the same event loop, so driving many tabs
+	concurrently is simply a matter of `asyncio.gather()`-ing their coroutines.
+	'''
+
+	def __init__(self,
+		binary                = None,
+		dbg_port              = None,
+		use_execution_manager = None,
+		additional_options    = [],
+		visible_size          = None,
+		disable_page          = False,
+		disable_dom           = False,
+		disable_network       = False,
+		*args,
+		**kwargs):
+		super().__init__(
+			binary                = binary,
+			dbg_port              = dbg_port,
+			use_execution_manager = use_execution_manager,
+			additional_options    = additional_options,
+			*args, **kwargs)
+
+		if visible_size:
+			assert isinstance(visible_size, tuple), "visible_size must be a 2-tuple containing 2 integers"
+			assert len(visible_size) == 2, "visible_size must be a 2-tuple containing 2 integers"
+			assert all([isinstance(val, int) for val in visible_size]), "visible_size must be a 2-tuple containing 2 integers"
+
+		self.__visible_size    = visible_size
+		self.__disable_page    = disable_page
+		self.__disable_dom     = disable_dom
+		self.__disable_network = disable_network
+
+	async def start(self):
+		'''
+		Enable the debug interfaces for the tab. This is the async equivalent of the
+		setup `ChromeRemoteDebugInterface.__init__()` does.
+		'''
+		setup_commands = []
+
+		if self.__disable_page:
+			self.log.debug("Not enabling page debug interface")
+		else:
+			setup_commands.append(("Page.enable", None))
+
+		if self.__disable_dom:
+			self.log.debug("Not enabling DOM debug interface")
+		else:
+			setup_commands.append(("DOM.enable", None))
+
+		if self.__disable_network:
+			self.log.debug("Not enabling Network debug interface")
+		else:
+			setup_commands.append(("Network.enable", None))
+
+		if self.__visible_size:
+			self.log.debug("Visible size overridden to %sx%s", *self.__visible_size)
+			width, height = self.__visible_size
+		else:
+			width, height = 1024, 1366
+		setup_commands.append(("Emulation.setVisibleSize", {"width" : width, "height" : height}))
+
+		await self.batch_command(setup_commands)
+
+		return self
+
+	async def __aenter__(self):
+		return await self.start()
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
+
+	async def new_tab(self, *args, **kwargs):
+		'''
+		Create and start a new tab sharing this instance's chromium process and event loop.
+		'''
+		tab = super().new_tab(*args, **kwargs)
+		return await tab.start()
+
+	async def update_headers(self, header_args):
+		'''
+		Given a set of headers, update both the user-agent
+		and additional headers for the remote browser.
+
+		See `ChromeRemoteDebugInterface.update_headers()`.
+		'''
+		assert isinstance(header_args, dict), "header_args must be a dict, passed type was %s" \
+			% (type(header_args), )
+
+		ua = header_args.pop('User-Agent', None)
+		ret_1 = None
+		if ua:
+			ret_1 = await self.Network_setUserAgentOverride(userAgent=ua)
+
+		ret_2 = await self.Network_setExtraHTTPHeaders(headers = header_args)
+		return (ret_1, ret_2)
+
+	async def get_current_url(self):
+		'''
+		Probe the remote session for the current window URL.
+		'''
+		res = await self.Page_getNavigationHistory()
+		assert 'result' in res
+		assert 'currentIndex' in res['result']
+		assert 'entries' in res['result']
+
+		return res['result']['entries'][res['result']['currentIndex']]['url']
+
+	async def get_unpacked_response_body(self, requestId, mimetype="application/unknown"):
+		'''
+		Return a unpacked, decoded resposne body from Network_getResponseBody()
+		'''
+		content = await self.Network_getResponseBody(requestId)
+
+		assert 'result' in content
+		result = content['result']
+
+		assert 'base64Encoded' in result
+		assert 'body' in result
+
+		if result['base64Encoded']:
+			content = b64_decode.decode(result['body'])
+		else:
+			content = result['body']
+
+		self.log.info("Navigate complete. Received %s byte response with type %s.", len(content), mimetype)
+
+		return {'binary' : result['base64Encoded'],  'mimetype' : mimetype, 'content' : content}
+
+	async def handle_page_location_changed(self, timeout=None):
+		'''
+		If the chrome tab has internally redirected, walk the page navigation responses and
+		fetch the response body for the tab's latest location.
+
+		See `ChromeRemoteDebugInterface.handle_page_location_changed()`.
+		'''
+		if not timeout:
+			timeout = 0.1
+
+		self.log.debug("We may have redirected. Checking.")
+
+		messages = await self.transport.recv_all_filtered(filter_funcs.capture_loading_events, tab_key=self.tab_id)
+		if not messages:
+			raise ChromeError("Couldn't track redirect! No idea what to do!")
+
+		last_message = messages[-1]
+		self.log.info("Probably a redirect! New content url: '%s'", last_message['params']['documentURL'])
+
+		resp = await self.transport.recv_filtered(
+				filter_funcs.network_response_recieved_for_url(last_message['params']['documentURL'], last_message['params']['frameId']),
+				tab_key=self.tab_id)
+		resp = resp['params']
+
+		ctype = self.__get_content_type(resp['response'])
+
+		return await self.get_unpacked_response_body(last_message['params']['requestId'], mimetype=ctype)
+
+	def __get_content_type(self, resp_response):
+		ctype = 'application/unknown'
+
+		if 'mimeType' in resp_response:
+			ctype = resp_response['mimeType']
+		if 'headers' in resp_response and 'content-type' in resp_response['headers']:
+			ctype = resp_response['headers']['content-type'].split(";")[0]
+
+		return ctype
+
+	async def blocking_navigate_and_get_source(self, url, timeout=DEFAULT_TIMEOUT_SECS):
+		'''
+		Navigate to url `url`, and then extract the response body and return that.
+
+		See `ChromeRemoteDebugInterface.blocking_navigate_and_get_source()`.
+		'''
+		# `handle_page_location_changed()` needs the loading events from the navigation.
+		with self.subscribe(["Network.requestWillBeSent", "Network.responseReceived"]):
+			resp = await self.blocking_navigate(url, timeout)
+			assert 'requestId' in resp
+			assert 'response' in resp
+
+			ctype = self.__get_content_type(resp['response'])
+
+			self.log.debug("Trying to get response body")
+			try:
+				ret = await self.get_unpacked_response_body(resp['requestId'], mimetype=ctype)
+			except ChromeError:
+				ret = await self.handle_page_location_changed(timeout)
+
+		return ret
+
+	async def get_rendered_page_source(self, dom_idle_requirement_secs=3, max_wait_timeout=30):
+		'''
+		Get the HTML markup for the current page, after the DOM has been idle for
+		`dom_idle_requirement_secs` seconds.
+
+		See `ChromeRemoteDebugInterface.get_rendered_page_source()`.
+		'''
+		target_events = [
+			"Page.frameResized",
+			"Page.frameStartedLoading",
+			"Page.frameNavigated",
+			"Page.frameAttached",
+			"Page.frameStoppedLoading",
+			"Page.frameScheduledNavigation",
+			"Page.domContentEventFired",
+			"Page.frameClearedScheduledNavigation",
+			"Page.loadEventFired",
+			"DOM.documentUpdated",
+			"DOM.childNodeInserted",
+			"DOM.childNodeRemoved",
+			"DOM.childNodeCountUpdated",
+		]
+
+		with self.subscribe(target_events):
+			start_time = time.time()
+			try:
+				while 1:
+					if time.time() - start_time > max_wait_timeout:
+						self.log.debug("Page was not idle after waiting %s seconds. Giving up and extracting content now.", max_wait_timeout)
+						break
+					await self.transport.recv_filtered(
+							filter_funcs.wait_for_methods(target_events),
+							tab_key = self.tab_id,
+							timeout = dom_idle_requirement_secs
+						)
+
+			except ChromeResponseNotReceived:
+				# We timed out, the DOM is probably idle.
+				pass
+
+		dom_attr = await self.DOM_getDocument(depth=-1, pierce=False)
+		assert 'result' in dom_attr
+		assert 'root' in dom_attr['result']
+		assert 'nodeId' in dom_attr['result']['root']
+
+		root_node_id = dom_attr['result']['root']['nodeId']
+
+		response = await self.DOM_getOuterHTML(nodeId=root_node_id)
+
+		assert 'result' in response
+		assert 'outerHTML' in response['result']
+		return response['result']['outerHTML']
+
+	async def take_screeshot(self, into=None, fileobj=None):
+		'''
+		Take a screenshot of the virtual viewport content.
+
+		Return value is a png image as a bytestring.
+
+		To avoid allocating a new buffer for each screenshot, a writable buffer can be passed
+		as `into`. The image is decoded straight into it (see `b64_decode.decode_into()`), and
+		the return value is a `memoryview` of the image within the buffer. A `bytearray` is
+		grown if it's too small, so a single one can be reused for every screenshot (growing it
+		requires the views returned by previous calls to have been released).
+
+		If `fileobj` is passed, the image is instead decoded straight into the file object,
+		and the return value is the size of the image.
+		'''
+		resp = await self.Page_captureScreenshot()
+		assert 'result' in resp
+		assert 'data' in resp['result']
+		data = resp['result']['data']
+
+		if fileobj is not None:
+			return b64_decode.decode_to_file(data, fileobj)
+		if into is not None:
+			size = b64_decode.decode_into(data, into)
+			return memoryview(into)[:size]
+		return b64_decode.decode(data)
+
+	async def blocking_navigate(self, url, timeout=DEFAULT_TIMEOUT_SECS):
+		'''
+		Navigate to url `url`, and wait for the browser to claim the page has
+		finished loading.
+
+		See `ChromeRemoteDebugInterface.blocking_navigate()`.
+		'''
+		# Events that arrive before we get around to waiting for them would
+		# otherwise be discarded, if the transport is filtering events.
+		navigate_events = [
+			"Page.frameNavigated",
+			"Page.frameStartedLoading",
+			"Page.frameStoppedLoading",
+			"Network.responseReceived",
+		]
+
+		with self.subscribe(navigate_events):
+			self.transport.flush(tab_key=self.tab_id)
+
+			self.log.debug("Blocking navigate to URL: '%s'", url)
+			ret = await self.Page_navigate(url = url)
+
+			assert("result"   in ret),           "Missing return content"
+			assert("frameId"  in ret['result']), "Missing 'frameId' in return content"
+			assert("loaderId" in ret['result']), "Missing 'loaderId' in return content"
+
+			expected_id = ret['result']['frameId']
+			loader_id   = ret['result']['loaderId']
+
+			try:
+				self.log.debug("Waiting for frame navigated command response.")
+				await self.transport.recv_filtered(filter_funcs.check_frame_navigated_command(expected_id), tab_key=self.tab_id, timeout=timeout)
+				self.log.debug("Waiting for frameStartedLoading response.")
+				await self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStartedLoading"), tab_key=self.tab_id, timeout=timeout)
+				self.log.debug("Waiting for frameStoppedLoading response.")
+				await self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStoppedLoading"), tab_key=self.tab_id, timeout=timeout)
+
+				self.log.debug("Waiting for responseReceived response.")
+				resp = await self.transport.recv_filtered(filter_funcs.network_response_recieved_for_url(url=None, expected_id=expected_id), tab_key=self.tab_id, timeout=timeout)
+
+				if resp is None:
+					raise ChromeNavigateTimedOut("Blocking navigate timed out!")
+
+				return resp['params']
+
+			# The `Page.frameNavigated ` event does not get fired for non-markup responses.
+			except ChromeResponseNotReceived:
+				self.log.warning("Failed to receive expected response to navigate command. Checking if response is a binary object.")
+				resp = await self.transport.recv_filtered(
+					keycheck = filter_funcs.check_frame_loader_command(
+							method_name = "Network.responseReceived",
+							loader_id   = loader_id
+						),
+					tab_key  = self.tab_id,
+					timeout  = timeout)
+
+				return resp['params']
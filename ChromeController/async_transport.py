@@ -0,0 +1,420 @@
+
+import time
+import asyncio
+import logging
+import functools
+
+
+from . import cr_exceptions
+from . import filter_funcs
+from .transport import ChromeExecutionManager
+from .transport import _short_repr
+from .transport import _weak_callback
+
+try:
+	import websockets
+except ImportError:
+	websockets = None
+
+
+class AsyncChromeExecutionManager(ChromeExecutionManager):
+	"""
+	asyncio sibling of `ChromeExecutionManager`.
+
+	Chromium process management (startup, liveness checks, shutdown) is inherited from
+	`ChromeExecutionManager`. All communication with the tabs is done with coroutines,
+	so many tabs can be multiplexed on one event loop without needing a thread per tab.
+
+	Each tab websocket has a reader task, which decodes incoming frames and either
+	completes the future for the command the frame is a response to, or passes it
+	to the tab's `MessageStore` for `recv_filtered()`. Tabs are created and closed with
+	`Target` commands sent over the browser websocket, which has a reader task of its own.
+
+	This requires the `websockets` package.
+
+	"""
+
+	def __init__(self, *args, **kwargs):
+		if websockets is None:
+			raise ImportError("AsyncChromeExecutionManager requires the `websockets` package!")
+		assert not kwargs.get("flatten_sessions"), "AsyncChromeExecutionManager does not support flattened sessions!"
+		assert not kwargs.get("debug_pipe"), "AsyncChromeExecutionManager does not support the debugging pipe!"
+
+		super().__init__(*args, **kwargs)
+
+		self.reader_tasks = {}
+
+		# Per tab key locks, so coroutines racing to connect the same tab (or the browser
+		# socket) make a single connection. See `connect()`.
+		self.connect_locks = {}
+
+	async def _run_blocking(self, func, *args, **kwargs):
+		loop = asyncio.get_event_loop()
+		return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+	async def connect(self, tab_key):
+		"""
+		Open a websocket connection to the tab corresponding to `tab_key`,
+		creating the tab if it doesn't already exist.
+
+		As with `ChromeExecutionManager`, tabs are created and closed with `Target`
+		commands sent over the browser websocket, which is connected first.
+
+		This is safe to call from several coroutines at once. Each tab key is only connected
+		once, and different tabs are created concurrently.
+		"""
+		lock = self.connect_locks.get(tab_key)
+		if lock is None:
+			lock = self.connect_locks.setdefault(tab_key, asyncio.Lock())
+
+		async with lock:
+			if tab_key in self.soclist:
+				return
+			if tab_key == self.browser_key:
+				await self.__connect_to_browser()
+				return
+			if self.browser_key not in self.soclist:
+				await self.connect(self.browser_key)
+			await self.__connect(tab_key)
+
+	async def __connect(self, tab_key):
+		for fails in range(9999):
+			try:
+				if tab_key not in self.tab_id_map:
+					self.log.debug("Creating new tab (%s active)", len(self.tab_id_map))
+					await self.__create_new_tab(tab_key)
+
+				await self.__connect_to_tab(tab_key)
+				break
+
+			except cr_exceptions.ChromeConnectFailure as e:
+				if fails > 6:
+					self.log.error("Failed to fetch tab websocket URL after %s retries. Aborting!", fails)
+					raise e
+				self.log.info("Tab may not have started yet (%s tabs active). Recreating.", len(self.tab_id_map))
+				await self.__close_tab(tab_key)
+
+	async def __create_new_tab(self, tab_key):
+		self.log.debug("Creating new target (%s active)", len(self.tab_id_map))
+		ret = await self.__browser_command("Target.createTarget", url="about:blank")
+
+		# The tab is bound to the target id chromium returned for it, so concurrently
+		# created tabs can't end up attached to each other's targets.
+		self.log.debug("New tab created with ID: '%s'", ret['targetId'])
+		self.tab_id_map[tab_key] = self._index_target({'targetId' : ret['targetId'], 'type' : 'page', 'url' : "about:blank"})
+
+	async def __connect_to_tab(self, tab_key):
+		assert tab_key not in self.soclist
+
+		cr_tab_meta = self._get_cr_tab_meta_for_key(tab_key)
+
+		if cr_tab_meta is None or not 'webSocketDebuggerUrl' in cr_tab_meta:
+			raise cr_exceptions.ChromeConnectFailure("Tab %s has no 'webSocketDebuggerUrl' (%s)" % (tab_key, cr_tab_meta))
+
+		self.log.info("Setting up websocket connection for key '%s'", tab_key)
+		await self.__open_socket(tab_key, cr_tab_meta['webSocketDebuggerUrl'])
+
+	async def __connect_to_browser(self):
+		'''
+		Connect to the browser websocket, and start tracking the browser's targets from
+		the `Target` events (see `ChromeExecutionManager`).
+		'''
+		response = await self._run_blocking(self._http_get, "/json/version", "Failed to fetch browser websocket URL from remote chromium!")
+
+		wsurl = self.codec.loads(response.text).get('webSocketDebuggerUrl')
+		if not wsurl:
+			raise cr_exceptions.ChromeConnectFailure("Browser has no 'webSocketDebuggerUrl' (%s)" % (response.text, ))
+
+		self.log.info("Setting up browser websocket connection")
+		await self.__open_socket(self.browser_key, wsurl)
+
+		callback = _weak_callback(self._on_target_event)
+		store = self.messages[self.browser_key]
+		for method in ("Target.targetCreated", "Target.targetInfoChanged", "Target.targetDestroyed"):
+			store.add_callback(method, callback)
+
+		await self.__browser_command("Target.setDiscoverTargets", discover=True)
+
+	async def __open_socket(self, tab_key, wsurl):
+		try:
+			self.soclist[tab_key] = await asyncio.wait_for(
+					websockets.connect(wsurl, max_size=None, ping_interval=None),
+					timeout = self.websocket_timeout
+				)
+		except asyncio.TimeoutError:
+			raise cr_exceptions.ChromeCommunicationsError("Could not connect to remote chromium.")
+
+		self.messages.setdefault(tab_key, self._new_message_store(tab_key))
+		self.reader_errors.pop(tab_key, None)
+		self.reader_tasks[tab_key] = asyncio.ensure_future(self.__reader(tab_key, self.soclist[tab_key]))
+
+	async def __browser_command(self, command, **params):
+		ret = await self.synchronous_command(command, tab_key=self.browser_key, **params)
+		if not ret or 'error' in ret:
+			raise cr_exceptions.ChromeCommunicationsError("%s failed: %s" % (command, ret))
+		return ret['result']
+
+	async def __reader(self, tab_key, sock):
+		try:
+			while 1:
+				tmp = await sock.recv()
+				self._dispatch_frame(tab_key, tmp)
+		except asyncio.CancelledError:
+			raise
+		except Exception as e:
+			self._reader_failed(tab_key, e)
+
+	def _dispatch(self, tab_key, message):
+		self._check_console_log(message)
+
+		if 'id' in message:
+			pending = self._pending.get(message['id'])
+			if pending:
+				dummy_key, future = pending
+				if not future.done():
+					future.set_result(message)
+				return
+
+		self.messages[tab_key].put(message)
+
+	def _reader_failed(self, tab_key, exc):
+		self.log.error("Reader task for tab %s failed: %s", tab_key, exc)
+		self.reader_errors[tab_key] = exc
+
+		for msg_id, (pending_key, future) in list(self._pending.items()):
+			if pending_key == tab_key:
+				self._pending.pop(msg_id)
+				if not future.done():
+					future.set_exception(cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+						" remote chromium instance dead?"))
+
+		self.messages[tab_key].fail_waiters(cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+				" remote chromium instance dead?"))
+
+	def __check_reader(self, tab_key):
+		if tab_key in self.reader_errors:
+			raise cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+				" remote chromium instance dead? (%s)" % (self.reader_errors[tab_key], ))
+
+	async def __check_open_socket(self, tab_key):
+		self.__check_reader(tab_key)
+		if not tab_key in self.soclist:
+			await self.connect(tab_key=tab_key)
+		if not tab_key in self.messages:
+			self.messages[tab_key] = self._new_message_store()
+
+	async def __stop_reader(self, tab_key):
+		task = self.reader_tasks.pop(tab_key, None)
+		if task:
+			task.cancel()
+			try:
+				await task
+			except asyncio.CancelledError:
+				pass
+
+		sock = self.soclist.pop(tab_key, None)
+		if sock:
+			await sock.close()
+
+	async def __close_tab(self, tab_key):
+		cr_tab_id = self.tab_id_map.pop(tab_key)['id']
+		self.targets.pop(cr_tab_id, None)
+		await self.__browser_command("Target.closeTarget", targetId=cr_tab_id)
+
+		self.log.info("Closing websocket connecton %s (%s)", tab_key, len(self.soclist))
+		await self.__stop_reader(tab_key)
+
+	async def close_tab(self, tab_key):
+		self.log.info("Closing tab %s (cr ID: %s)", tab_key, self.tab_id_map[tab_key]['id'])
+		await self.__close_tab(tab_key)
+		self.connect_locks.pop(tab_key, None)
+		self.messages.pop(tab_key, None)
+		self.reader_errors.pop(tab_key, None)
+
+		# If we've closed all the chrome tabs, shut down the interface.
+		if not len(self.tab_id_map):
+			self.log.info("All tabs are closed. Closing chromium!")
+			await self.close_websockets()
+			await self._run_blocking(self.close_chromium)
+
+	async def close_all(self):
+		self.log.info("Closing all tabs.")
+		for tab_key in list(self.tab_id_map.keys()):
+			self.log.info("Closing tab %s (cr ID: %s)", tab_key, self.tab_id_map[tab_key]['id'])
+			await self.__close_tab(tab_key)
+
+		self.log.info("All tabs are closed. Closing chromium!")
+		await self.close_websockets()
+		await self._run_blocking(self.close_chromium)
+
+	def __enter__(self):
+		raise TypeError("AsyncChromeExecutionManager must be used with `async with`!")
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *args):
+		if self._finalizer.alive:
+			await self.close_all()
+
+	async def close_websockets(self):
+		""" Close websocket connection to remote browser."""
+		self.log.info("Websocket Teardown called")
+		for key in list(self.soclist.keys()):
+			await self.__stop_reader(key)
+
+	async def synchronous_command(self, command, tab_key, **params):
+		"""
+		Execute command `command` with params `params` in the
+		remote chrome instance, returning the response from the chrome instance.
+
+		"""
+		debug = self.log.isEnabledFor(logging.DEBUG)
+		if debug:
+			self.log.debug("Synchronous_command to tab %s (%s):", tab_key, self._get_cr_tab_meta_for_key(tab_key))
+			self.log.debug("	command: '%s'", command)
+			self.log.debug("	params:  '%s'", _short_repr(params))
+
+		send_id = await self.send(command=command, tab_key=tab_key, params=params)
+		resp = await self.recv(message_id=send_id, tab_key=tab_key)
+
+		if debug:
+			self.log.debug("	Response: '%s'", _short_repr(resp))
+		return resp
+
+	async def batch_command(self, commands, tab_key, timeout=30):
+		'''
+		Pipeline a batch of `(command, params)` commands, writing them all before
+		waiting on any response.
+
+		Return value is a list of the responses, in the same order as `commands`.
+		'''
+		sent_ids = [await self.send(command=command, tab_key=tab_key, params=params) for command, params in commands]
+		return await asyncio.gather(*[self.recv(message_id=sent_id, tab_key=tab_key, timeout=timeout) for sent_id in sent_ids])
+
+	async def send(self, command, tab_key, params=None):
+		'''
+		Send command `command` with optional parameters `params` to the
+		remote chrome instance.
+
+		Return value is the command id, which can be passed to `recv()` to
+		wait for the response.
+		'''
+		await self.__check_open_socket(tab_key)
+
+		sent_id = self._next_msg_id()
+
+		command = {
+				"id": sent_id,
+				"method": command,
+			}
+
+		if params:
+			command["params"] = params
+		navcom = self.codec.dumps(command)
+
+		if self.wire_trace is not None:
+			self.wire_trace("send", tab_key, navcom)
+
+		# The future has to exist before the command goes out, as the
+		# reader can receive the response before anyone waits on it.
+		self._pending[sent_id] = (tab_key, asyncio.get_event_loop().create_future())
+
+		try:
+			await self.soclist[tab_key].send(navcom)
+		except websockets.exceptions.ConnectionClosed:
+			self._pending.pop(sent_id, None)
+			raise cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+				" remote chromium instance dead?")
+
+		return sent_id
+
+	async def recv(self, tab_key, message_id=None, timeout=30):
+		'''
+		Receive a message, optionally filtering for a specified message id.
+
+		If `message_id` is none, the first message in the receive queue is returned.
+		Otherwise, waits for the response to the command with id `message_id`, and
+		raises `ChromeResponseNotReceived` if it is not received within `timeout` seconds.
+		'''
+		await self.__check_open_socket(tab_key)
+
+		if message_id is not None and message_id in self._pending:
+			dummy_key, future = self._pending[message_id]
+			try:
+				return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+			except asyncio.TimeoutError:
+				raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv() (message id %s)" % (message_id, ))
+			finally:
+				self._pending.pop(message_id, None)
+
+		def check_func(message):
+			if message_id is None:
+				return True
+			if "id" in message:
+				return message['id'] == message_id
+			return False
+
+		if message_id is not None:
+			# A response to a command never has a method, so this can't match any event.
+			check_func = filter_funcs.for_methods()(check_func)
+
+		return await self.recv_filtered(check_func, tab_key, timeout)
+
+	async def recv_filtered(self, keycheck, tab_key, timeout=30, message=None):
+		'''
+		Receive a filtered message, using the callable `keycheck` to filter received messages
+		for content.
+
+		`keycheck` is expected to be a callable that takes a single parameter (the decoded response
+		from chromium), and returns a boolean (true, if the command is the one filtered for, or false
+		if the command is not the one filtered for).
+		'''
+		await self.__check_open_socket(tab_key)
+
+		store = self.messages[tab_key]
+		future = asyncio.get_event_loop().create_future()
+
+		tmp, waiter = store.pop_first_or_wait(keycheck, future)
+		if waiter is None:
+			return tmp
+
+		try:
+			self.__check_reader(tab_key)
+			return await asyncio.wait_for(future, timeout=timeout)
+		except asyncio.TimeoutError:
+			store.cancel_waiter(waiter)
+			if message:
+				raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv_filtered() (%s)" % message)
+			else:
+				raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv_filtered()")
+		except cr_exceptions.ChromeCommunicationsError:
+			store.cancel_waiter(waiter)
+			raise
+
+	async def recv_all_filtered(self, keycheck, tab_key, timeout=0.5):
+		'''
+		Receive all messages matching a filter, using the callable `keycheck` to filter received messages
+		for content.
+
+		This function will *ALWAYS* block for `timeout` seconds.
+		'''
+		await self.__check_open_socket(tab_key)
+		await asyncio.sleep(timeout)
+
+		return self.messages[tab_key].pop_all(keycheck)
+
+	def flush(self, tab_key):
+		'''
+		Flush the pending RX buffer for a specific tab key.
+		'''
+		if tab_key in self.messages:
+			self.messages[tab_key].clear()
+
+	def drain(self, tab_key):
+		'''
+		Return all messages in waiting for the websocket connection.
+		'''
+		ret = self.messages[tab_key].drain() if tab_key in self.messages else []
+		self.log.debug("Drained %s messages", len(ret))
+		return ret
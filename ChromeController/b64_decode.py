@@ -0,0 +1,72 @@
+
+import binascii
+
+# Binary payloads (screenshots, response bodies, etc...) arrive as base64 strings inside
+# the decoded frames. `base64.b64decode()` first copies the whole string to `bytes`, and
+# then allocates the decoded result, so these functions instead decode the string with
+# `binascii` (which reads an ASCII `str` in place) a slice at a time, directly into the
+# destination buffer or file. The only temporary allocations are per slice.
+
+# Number of base64 characters decoded per slice. Must be a multiple of 4.
+CHUNK_CHARS = 256 * 1024
+
+
+def decoded_size(data):
+	'''
+	Return the size of the data the (padded, whitespace-free) base64 string `data` decodes to.
+	'''
+	padding = 0
+	if data.endswith("=="):
+		padding = 2
+	elif data.endswith("="):
+		padding = 1
+	return len(data) // 4 * 3 - padding
+
+
+def decode(data):
+	'''
+	Decode the base64 string `data` to `bytes`, without making an intermediate copy of it.
+	'''
+	return binascii.a2b_base64(data)
+
+
+def decode_into(data, buf, offset=0):
+	'''
+	Decode the base64 string `data` into the writable buffer `buf` (a `bytearray`,
+	`memoryview`, `mmap`, etc...), starting at `offset`.
+
+	`buf` must have room for `decoded_size(data)` bytes after `offset`, or a `ValueError` is
+	raised, unless it's a `bytearray`, in which case it's grown to fit.
+
+	Return value is the number of bytes written.
+	'''
+	size = decoded_size(data)
+	if len(buf) - offset < size:
+		if not isinstance(buf, bytearray):
+			raise ValueError("Buffer too small for decoded data (%s bytes free, %s needed)" % (len(buf) - offset, size))
+		buf.extend(bytes(size - (len(buf) - offset)))
+
+	view = memoryview(buf)
+	pos  = offset
+	for start in range(0, len(data), CHUNK_CHARS):
+		chunk = binascii.a2b_base64(data[start:start + CHUNK_CHARS])
+		view[pos:pos + len(chunk)] = chunk
+		pos += len(chunk)
+	view.release()
+
+	return pos - offset
+
+
+def decode_to_file(data, fileobj):
+	'''
+	Decode the base64 string `data`, writing the result to the file object `fileobj`
+	a slice at a time.
+
+	Return value is the number of bytes written.
+	'''
+	written = 0
+	for start in range(0, len(data), CHUNK_CHARS):
+		chunk = binascii.a2b_base64(data[start:start + CHUNK_CHARS])
+		fileobj.write(chunk)
+		written += len(chunk)
+	return written
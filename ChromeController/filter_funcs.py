@@ -1,5 +1,35 @@
 
-
+# Filters can declare the set of event methods they are able to match by having a `methods`
+# attribute. The transport then only checks buffered events with those methods (and command
+# responses, which have no method) against the filter (see `message_store.MessageStore`).
+# Filters without the attribute are checked against every message.
+
+def for_methods(*methods):
+	def decorator(func):
+		func.methods = frozenset(methods)
+		return func
+	return decorator
+
+
+# With `lazy_decode`, the transport hands the filters `LazyMessage` events, which
+# only decode their frame when the payload is accessed. The method, and the leading
+# scalar params (`requestId`, `frameId`, `loaderId`, etc...) are available without
+# decoding, so filters should check those first, via `get_param()`.
+
+def get_param(message, key, default=None):
+	'''
+	Return `message['params'][key]`, or `default` if it's not present, without decoding
+	the message if it's a `LazyMessage` and the param can be peeked from the raw frame.
+	'''
+	if hasattr(message, 'peek_param'):
+		return message.peek_param(key, default)
+	params = message.get('params')
+	if not isinstance(params, dict):
+		return default
+	return params.get(key, default)
+
+
+@for_methods('Network.requestWillBeSent')
 def capture_loading_events(message):
 	if not message:
 		return False
@@ -24,6 +54,7 @@ def capture_loading_events(message):
 
 
 def check_frame_navigated_command(expected_id):
+	@for_methods("Page.frameNavigated")
 	def check_frame_navigated(message):
 		if not message:
 			return False
@@ -45,6 +76,7 @@ def check_frame_navigated_command(expected_id):
 	return check_frame_navigated
 
 def check_frame_load_command(method_name):
+	@for_methods(method_name)
 	def frame_loading_tracker(message):
 		if not message:
 			return False
@@ -70,6 +102,7 @@ def check_frame_load_command(method_name):
 
 
 def wait_for_methods(method_list):
+	@for_methods(*method_list)
 	def wait_for_methods_tracker(message):
 		if not message:
 			return False
@@ -86,6 +119,7 @@ def wait_for_methods(method_list):
 
 
 def check_frame_loader_command(method_name, loader_id):
+	@for_methods(method_name)
 	def frame_loading_tracker_with_loader(message):
 		if not message:
 			return False
@@ -95,9 +129,8 @@ def check_frame_loader_command(method_name, loader_id):
 			return False
 		if 'params' not in message:
 			return False
-		if 'loaderId' not in message['params']:
-			return False
-		if message['params']["loaderId"] == loader_id:
+		loader = get_param(message, "loaderId")
+		if loader is not None and loader == loader_id:
 			return True
 
 		return False
@@ -105,6 +138,7 @@ def check_frame_loader_command(method_name, loader_id):
 
 	return frame_loading_tracker_with_loader
 
+@for_methods('Page.loadEventFired')
 def check_load_event_fired(message):
 	if not message:
 		return False
@@ -117,6 +151,7 @@ def check_load_event_fired(message):
 
 
 def network_response_recieved_for_url(url, expected_id):
+	@for_methods('Network.responseReceived')
 	def network_response_recieved_tracker(message):
 		if not message:
 			return False
@@ -126,9 +161,9 @@ def network_response_recieved_for_url(url, expected_id):
 			return False
 		if 'params' not in message:
 			return False
-		params = message['params']
-		if 'frameId' not in params:
+		if get_param(message, 'frameId') != expected_id:
 			return False
+		params = message['params']
 		if 'frameId' in params:
 			if params['frameId'] == expected_id and 'response' in params:
 				# Checking the url in the response breaks if
@@ -142,3 +177,16 @@ def network_response_recieved_for_url(url, expected_id):
 
 		return False
 	return network_response_recieved_tracker
+
+def check_request_paused(resource_type):
+	@for_methods('Fetch.requestPaused')
+	def request_paused_tracker(message):
+		if not message:
+			return False
+		if "method" not in message:
+			return False
+		if message['method'] != 'Fetch.requestPaused':
+			return False
+		return get_param(message, "resourceType") == resource_type
+
+	return request_paused_tracker
@@ -0,0 +1,235 @@
+
+import re
+import json
+import collections.abc
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	import ujson
+except ImportError:
+	ujson = None
+
+
+class JsonCodec(object):
+	'''
+	Encoder/decoder for the frames sent to and received from chromium.
+
+	`dumps()` has to return a `str`, as the frames are sent as websocket text frames.
+	`loads()` accepts either a `str` or `bytes`.
+	'''
+	name = "json"
+
+	def dumps(self, obj):
+		return json.dumps(obj)
+
+	def loads(self, data):
+		return json.loads(data)
+
+	def __repr__(self):
+		return "<%s codec>" % (self.name, )
+
+
+class OrjsonCodec(JsonCodec):
+	name = "orjson"
+
+	def dumps(self, obj):
+		return orjson.dumps(obj).decode("utf-8")
+
+	def loads(self, data):
+		return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+	name = "ujson"
+
+	def dumps(self, obj):
+		return ujson.dumps(obj)
+
+	def loads(self, data):
+		return ujson.loads(data)
+
+
+CODECS = collections.OrderedDict([
+		("orjson", (OrjsonCodec, lambda: orjson is not None)),
+		("ujson",  (UjsonCodec,  lambda: ujson  is not None)),
+		("json",   (JsonCodec,   lambda: True)),
+	])
+
+def get_codec(codec="auto"):
+	'''
+	Return a codec instance for `codec`.
+
+	`codec` is either the name of a codec (`"orjson"`, `"ujson"` or `"json"`), `"auto"`
+	(or None) to pick the fastest installed one, or an object with `dumps()` and `loads()`
+	methods, which is returned as-is.
+	'''
+	if codec is None or codec == "auto":
+		for cls, available in CODECS.values():
+			if available():
+				return cls()
+
+	if not isinstance(codec, str):
+		assert hasattr(codec, "dumps") and hasattr(codec, "loads"), \
+			"Codec objects must have dumps() and loads() methods. Passed: %s" % (codec, )
+		return codec
+
+	if codec not in CODECS:
+		raise ValueError("Unknown json codec '%s'. Available codecs: %s" % (codec, list(CODECS.keys())))
+
+	cls, available = CODECS[codec]
+	if not available():
+		raise ImportError("The '%s' json codec is not installed!" % (codec, ))
+	return cls()
+
+
+EVENT_PREFIX  = '{"method":"'
+PARAMS_PREFIX = '","params":{'
+
+# A leading `params` member with a scalar value. Strings containing escapes are not matched.
+LEADING_PARAM = re.compile(r'"(\w+)":(?:"([^"\\]*)"|(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|(true|false|null))([,}])')
+LITERALS      = {'true' : True, 'false' : False, 'null' : None}
+
+def peek_params(frame, method, max_params=8):
+	'''
+	Extract the scalar members at the start of the `params` of the raw event frame
+	`frame` (with method `method`), without decoding it.
+
+	Chromium serializes event parameters in protocol order, so the identifiers most
+	events are matched on (`requestId`, `frameId`, `loaderId`) come first. Scanning stops
+	at the first member with an object or array value, or after `max_params` members.
+
+	Return value is a 2-tuple of `(params, complete)`. `params` is a dict of the members
+	found, or None if the frame isn't laid out as expected (in which case nothing is known
+	about its params). `complete` is true if `params` holds every member of the event params.
+	'''
+	pos = len(EVENT_PREFIX) + len(method)
+	if not frame.startswith(EVENT_PREFIX) or not frame.startswith(PARAMS_PREFIX, pos):
+		return None, False
+	pos += len(PARAMS_PREFIX)
+
+	params = {}
+	if frame.startswith("}", pos):
+		return params, True
+
+	for dummy_x in range(max_params):
+		match = LEADING_PARAM.match(frame, pos)
+		if not match:
+			break
+		key, string, number, literal, terminator = match.groups()
+		if string is not None:
+			params[key] = string
+		elif number is not None:
+			params[key] = float(number) if any(c in number for c in ".eE") else int(number)
+		else:
+			params[key] = LITERALS[literal]
+		if terminator == "}":
+			return params, True
+		pos = match.end()
+
+	return params, False
+
+
+class LazyMessage(collections.abc.Mapping):
+	'''
+	Read-only mapping for an event received from chromium, which only decodes the
+	raw frame when something other than the envelope is accessed.
+
+	`envelope` is a dict of the top level keys that are already known without decoding
+	(an event always has a `method`, and never has an `id`). `message['method']`,
+	`message.get('id')`, `'id' in message` and the like are answered from the envelope.
+
+	`params`, if not None, is a dict of the members of the event `params` that are known
+	without decoding (see `peek_params()`), and implies the event has a `params` key.
+	These can be read with `peek_param()`. If `params_complete` is true, `params` holds
+	every member, so missing members are known to be missing without decoding either.
+
+	Anything else (`message['params']`, iteration, comparison, etc...) decodes the
+	frame (once), after which the raw frame is released.
+	'''
+	__slots__ = ('envelope', 'params', 'params_complete', '_raw', '_loads', '_decoded')
+
+	# Keys whose presence or absence is known from the envelope.
+	ENVELOPE_KEYS = ('id', 'method')
+
+	def __init__(self, raw, loads, envelope, params=None, params_complete=False):
+		self.envelope        = envelope
+		self.params          = params
+		self.params_complete = params_complete
+		self._raw            = raw
+		self._loads          = loads
+		self._decoded        = None
+
+	@classmethod
+	def from_event(cls, frame, loads, method):
+		'''
+		Wrap the raw event frame `frame`, whose method has already been peeked.
+		'''
+		params, complete = peek_params(frame, method)
+		return cls(frame, loads, {'method' : method}, params, complete)
+
+	@property
+	def is_decoded(self):
+		return self._decoded is not None
+
+	def decode(self):
+		'''
+		Return the fully decoded message, as a plain dict.
+		'''
+		if self._decoded is None:
+			self._decoded = self._loads(self._raw)
+			self._raw = None
+		return self._decoded
+
+	def peek_param(self, key, default=None):
+		'''
+		Return `message['params'][key]` (or `default`, if missing), decoding the frame
+		only if the member wasn't peeked from the raw frame.
+		'''
+		if self._decoded is None and self.params is not None:
+			if key in self.params:
+				return self.params[key]
+			if self.params_complete:
+				return default
+		params = self.decode().get('params')
+		if not isinstance(params, dict):
+			return default
+		return params.get(key, default)
+
+	def __getitem__(self, key):
+		if self._decoded is None and key in self.envelope:
+			return self.envelope[key]
+		return self.decode()[key]
+
+	def __contains__(self, key):
+		if self._decoded is None:
+			if key in self.envelope:
+				return True
+			if key == 'params' and self.params is not None:
+				return True
+			if key in self.ENVELOPE_KEYS:
+				return False
+		return key in self.decode()
+
+	def get(self, key, default=None):
+		if self._decoded is None and (key in self.envelope or key in self.ENVELOPE_KEYS):
+			return self.envelope.get(key, default)
+		return self.decode().get(key, default)
+
+	def __bool__(self):
+		# An event is never empty, so there's no need to decode it to find out.
+		return True
+
+	def __iter__(self):
+		return iter(self.decode())
+
+	def __len__(self):
+		return len(self.decode())
+
+	def __repr__(self):
+		if self._decoded is None:
+			return "<LazyMessage %s, params %s (not decoded)>" % (self.envelope, self.params)
+		return repr(self._decoded)
@@ -6,7 +6,6 @@ import subprocess
 import pprint
 import types
 import json
-import base64
 import signal
 import pprint
 import time
@@ -17,6 +16,7 @@ import ChromeController.filter_funcs as filter_funcs
 from ChromeController.cr_exceptions import ChromeResponseNotReceived
 from ChromeController.cr_exceptions import ChromeNavigateTimedOut
 from ChromeController.cr_exceptions import ChromeError
+from ChromeController import b64_decode
 from ChromeController.resources import js
 
 
@@ -25,6 +25,9 @@ from ChromeController.Generator.Generated import ChromeRemoteDebugInterface as C
 
 DEFAULT_TIMEOUT_SECS = 10
 
+# Maximum size of the chunks a streamed response body is read in.
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+
 class RemoteObject():
 	def __init__(self, object_meta):
 		self.object_meta = object_meta
@@ -33,6 +36,84 @@ class RemoteObject():
 	def __repr__(self):
 		return "<(Unimplemented) RemoteObject for JS object: '%s'>" % (self.object_meta, )
 
+class ResponseBodyStream():
+	'''
+	A response body being read from chromium in chunks, returned by
+	`ChromeRemoteDebugInterface.stream_navigate_response_body()`.
+
+	`url`, `status`, `headers` and `mimetype` describe the response. Iterating over the stream
+	yields the body as `bytes` chunks of at most `chunk_size` bytes, each fetched with a separate
+	`IO.read`, so the body is never held in memory (or in a message) all at once. `write_to()`
+	copies the body into a file object. `size` is the number of bytes read so far.
+
+	The stream must be closed once it's no longer needed, which releases the stream handle and
+	aborts the intercepted request. It can be used as a context manager.
+	'''
+
+	def __init__(self, tab, navigate_id, paused, handle, chunk_size):
+		self.tab         = tab
+		self.navigate_id = navigate_id
+		self.request_id  = paused['requestId']
+		self.handle      = handle
+		self.chunk_size  = chunk_size
+
+		self.url         = paused['request']['url']
+		self.status      = paused.get('responseStatusCode')
+		self.headers     = {header['name'].lower() : header['value'] for header in paused.get('responseHeaders', [])}
+		self.mimetype    = self.headers.get('content-type', 'application/unknown').split(";")[0]
+
+		self.size        = 0
+		self.eof         = False
+		self.closed      = False
+
+	def __iter__(self):
+		while not self.eof:
+			assert not self.closed, "The stream has been closed!"
+			resp = self.tab.IO_read(handle=self.handle, size=self.chunk_size)
+			result = resp['result']
+			self.eof = result.get('eof', False)
+
+			if result.get('base64Encoded'):
+				chunk = b64_decode.decode(result['data'])
+			else:
+				chunk = result['data'].encode("utf-8")
+			if chunk:
+				self.size += len(chunk)
+				yield chunk
+
+	def write_to(self, fileobj):
+		'''
+		Write the (rest of the) body to the file object `fileobj`.
+
+		Return value is the total size of the body, in bytes.
+		'''
+		for chunk in self:
+			fileobj.write(chunk)
+		return self.size
+
+	def close(self):
+		if self.closed:
+			return
+		self.closed = True
+		try:
+			self.tab.IO_close(handle=self.handle)
+			# The body has been taken, so the request can't be continued.
+			self.tab.synchronous_command("Fetch.failRequest", requestId=self.request_id, errorReason="Aborted")
+		finally:
+			self.tab.synchronous_command("Fetch.disable")
+			# Page.navigate only responds once the navigation has failed.
+			try:
+				self.tab.transport.recv(message_id=self.navigate_id, tab_key=self.tab.tab_id, timeout=DEFAULT_TIMEOUT_SECS)
+			except ChromeResponseNotReceived:
+				self.tab.log.warning("No response to the navigation for streamed response %s", self.url)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+
 class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 	'''
 	Remote control class for Chromium.
@@ -56,32 +137,42 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 			additional_options    = additional_options,
 			*args, **kwargs)
 
+		# The setup commands are pipelined, so tab setup costs a single round-trip.
+		setup_commands = []
+
 		if disable_page:
 			self.log.debug("Not enabling page debug interface")
 		else:
-			self.Page_enable()
+			setup_commands.append(("Page.enable", None))
 
 		if disable_dom:
 			self.log.debug("Not enabling DOM debug interface")
 		else:
-			self.DOM_enable()
+			setup_commands.append(("DOM.enable", None))
 
 		if disable_network:
 			self.log.debug("Not enabling Network debug interface")
 		else:
-			self.Network_enable()
+			setup_commands.append(("Network.enable", None))
 
 		if visible_size:
 			assert isinstance(visible_size, tuple), "visible_size must be a 2-tuple containing 2 integers"
 			assert len(visible_size) == 2, "visible_size must be a 2-tuple containing 2 integers"
 			assert all([isinstance(val, int) for val in visible_size]), "visible_size must be a 2-tuple containing 2 integers"
-			self.log.debug("Visible size overridden to %sx%s" % visible_size)
-			self.Emulation_setVisibleSize(*visible_size)
+			self.log.debug("Visible size overridden to %sx%s", *visible_size)
+			width, height = visible_size
 		else:
-			self.Emulation_setVisibleSize(1024, 1366)
+			width, height = 1024, 1366
+		setup_commands.append(("Emulation.setVisibleSize", {"width" : width, "height" : height}))
+
+		self.batch_command(setup_commands)
 
 		self.__new_tab_scripts = []
 
+		# Origins the tab has made requests to since it was last reset (see `track_origins()`).
+		self.visited_origins  = None
+		self.__origin_tracker = None
+
 		# cr_ver = self.Browser_getVersion()
 		# self.log.debug("Remote browser version info:")
 		# self.log.debug(str(cr_ver))
@@ -444,6 +535,9 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		Return value is a list of http.cookiejar.Cookie() instances.
 		These can be directly used with the various http.cookiejar.XXXCookieJar
 		cookie management classes.
+
+		Only the cookies of the tab's browser context are returned, so for a tab created
+		with `new_tab(isolated=True)` these are the tab's own cookies.
 		'''
 		ret = self.Network_getAllCookies()
 
@@ -515,6 +609,8 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		Add a cookie to the remote chromium instance.
 
 		Passed value `cookie` must be an instance of `http.cookiejar.Cookie()`.
+
+		The cookie is set in the tab's browser context (see `get_cookies()`).
 		'''
 
 		# Function path: Network.setCookie
@@ -592,6 +688,60 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		'''
 		self.Network_clearBrowserCookies()
 
+	def track_origins(self):
+		'''
+		Start recording the origin of every request the tab makes (including those made by
+		frames and for subresources) in `visited_origins`, so `reset_tab()` can clear the storage
+		of every origin that may have written some, rather than only that of the current page.
+
+		Calling this more than once has no further effect.
+		'''
+		if self.__origin_tracker is not None:
+			return
+
+		# The callback only references the set, so it doesn't keep the tab alive.
+		origins = self.visited_origins = set()
+		def record_origin(message):
+			parts = urllib.parse.urlsplit(message['params']['request']['url'])
+			if parts.scheme in ("http", "https"):
+				origins.add("%s://%s" % (parts.scheme, parts.netloc.rpartition("@")[2]))
+
+		self.__origin_tracker = self.on("Network.requestWillBeSent", record_origin)
+
+	def reset_tab(self):
+		'''
+		Reset the tab to a blank state, so it can be reused for unrelated browsing without
+		the cost of closing it and opening a new one.
+
+		The tab is navigated to `about:blank`, and the storage (including the cookies) of the
+		origin it was on is cleared, along with that of every origin it visited since it was last
+		reset, if `track_origins()` has been called. Any headers set with `update_headers()` are
+		removed, and the buffered events for the tab are discarded.
+
+		Note that unless the tab is in a browser context of its own (see `new_tab()`), the storage
+		of an origin is shared with every other tab in the default context, so clearing it clears
+		it for them as well, and anything they store is visible to the reset tab.
+		'''
+		ret = self.Runtime_evaluate(expression="location.origin", returnByValue=True)
+		origin = ret['result']['result'].get('value')
+
+		origins = set(self.visited_origins or ())
+		if origin and origin.startswith("http"):
+			origins.add(origin)
+
+		commands = [("Page.navigate", {"url" : "about:blank"})]
+		commands += [("Storage.clearDataForOrigin", {"origin" : visited, "storageTypes" : "all"}) for visited in sorted(origins)]
+		commands += [
+				("Network.setExtraHTTPHeaders", {"headers" : {}}),
+				# An empty user agent removes the override.
+				("Network.setUserAgentOverride", {"userAgent" : ""}),
+			]
+		self.batch_command(commands)
+
+		self.transport.flush(self.tab_id)
+		if self.visited_origins is not None:
+			self.visited_origins.clear()
+
 
 
 	def navigate_to(self, url):
@@ -828,7 +978,7 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		assert 'body' in result
 
 		if result['base64Encoded']:
-			content = base64.b64decode(result['body'])
+			content = b64_decode.decode(result['body'])
 		else:
 			content = result['body']
 
@@ -837,6 +987,60 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		return {'binary' : result['base64Encoded'],  'mimetype' : mimetype, 'content' : content}
 
 
+	def stream_navigate_response_body(self, url, chunk_size=DEFAULT_STREAM_CHUNK_SIZE, timeout=DEFAULT_TIMEOUT_SECS):
+		'''
+		Navigate to `url`, and return a `ResponseBodyStream` for the response body, which can
+		then be read in chunks rather than all at once.
+
+		This is intended for large (generally binary) downloads. `get_unpacked_response_body()`
+		fetches the whole body in a single `Network.getResponseBody` response, base64 encoded,
+		and decodes it in one piece, so the peak memory use is several times the body size.
+
+		The navigation request is intercepted with the `Fetch` domain once its response headers
+		have been received, and the body is taken over as a stream with `Fetch.takeResponseBodyAsStream`,
+		which `ResponseBodyStream` reads with `IO.read`. Redirects are followed.
+
+		The request is aborted once the body has been taken, so the tab is left on an error
+		page (rather than rendering the content) after the stream is closed.
+		'''
+		self.synchronous_command("Fetch.enable", patterns=[{"urlPattern" : "*", "resourceType" : "Document", "requestStage" : "Response"}])
+		navigate_id = None
+		try:
+			with self.subscribe(["Fetch.requestPaused"]):
+				# Page.navigate doesn't respond until the intercepted request is resolved, so we
+				# can't wait for the response before handling the interception.
+				navigate_id = self.transport.send(command="Page.navigate", tab_key=self.tab_id, params={"url" : url})
+
+				while 1:
+					try:
+						paused = self.transport.recv_filtered(filter_funcs.check_request_paused("Document"), tab_key=self.tab_id, timeout=timeout)
+					except ChromeResponseNotReceived:
+						raise ChromeNavigateTimedOut("Timed out waiting for the response to %s!" % (url, ))
+					paused = paused['params']
+
+					if paused.get('responseErrorReason'):
+						self.synchronous_command("Fetch.continueRequest", requestId=paused['requestId'])
+						raise ChromeError("Request for %s failed: %s" % (url, paused['responseErrorReason']))
+
+					# Let redirects through, and wait for the request to the new location.
+					if 300 <= paused.get('responseStatusCode', 0) < 400 and \
+							any(header['name'].lower() == 'location' for header in paused.get('responseHeaders', [])):
+						self.synchronous_command("Fetch.continueRequest", requestId=paused['requestId'])
+						continue
+					break
+
+			ret = self.synchronous_command("Fetch.takeResponseBodyAsStream", requestId=paused['requestId'])
+		except Exception:
+			try:
+				self.synchronous_command("Fetch.disable")
+			finally:
+				# Nothing is going to wait on the navigation now.
+				if navigate_id is not None:
+					self.transport.discard_response(self.tab_id, navigate_id)
+			raise
+
+		return ResponseBodyStream(self, navigate_id, paused, ret['result']['stream'], chunk_size)
+
 	def handle_page_location_changed(self, timeout=None):
 		'''
 		If the chrome tab has internally redirected (generally because jerberscript), this
@@ -877,11 +1081,16 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		# I have no idea what this would do if there are non-html documents (or if that can even happen.)
 		return self.get_unpacked_response_body(last_message['params']['requestId'], mimetype=ctype)
 
-	def blocking_navigate_and_get_source(self, url, timeout=DEFAULT_TIMEOUT_SECS):
+	def blocking_navigate_and_get_source(self, url, timeout=DEFAULT_TIMEOUT_SECS, fileobj=None):
 		'''
 		Do a blocking navigate to url `url`, and then extract the
 		response body and return that.
 
+		If `fileobj` is passed, the response body is instead streamed into it in chunks (see
+		`stream_navigate_response_body()`), so large downloads don't have to fit in memory.
+		The return value then has a `size` key (the number of bytes written) in place of
+		`content`, and `binary` is always true.
+
 		This effectively returns the *unrendered* page content that's sent over the wire. As such,
 		if the page does any modification of the contained markup during rendering (via javascript), this
 		function will not reflect the changes made by the javascript.
@@ -900,26 +1109,33 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 
 		'''
 
+		if fileobj is not None:
+			with self.stream_navigate_response_body(url, timeout=timeout) as stream:
+				size = stream.write_to(fileobj)
+				self.log.info("Navigate complete. Streamed %s byte response with type %s.", size, stream.mimetype)
+				return {'binary' : True, 'mimetype' : stream.mimetype, 'size' : size}
 
-		resp = self.blocking_navigate(url, timeout)
-		assert 'requestId' in resp
-		assert 'response' in resp
-		# self.log.debug('blocking_navigate Response %s', pprint.pformat(resp))
+		# `handle_page_location_changed()` needs the loading events from the navigation.
+		with self.subscribe(["Network.requestWillBeSent", "Network.responseReceived"]):
+			resp = self.blocking_navigate(url, timeout)
+			assert 'requestId' in resp
+			assert 'response' in resp
+			# self.log.debug('blocking_navigate Response %s', pprint.pformat(resp))
 
-		ctype = 'application/unknown'
+			ctype = 'application/unknown'
 
-		resp_response = resp['response']
+			resp_response = resp['response']
 
-		if 'mimeType' in resp_response:
-			ctype = resp_response['mimeType']
-		if 'headers' in resp_response and 'content-type' in resp_response['headers']:
-			ctype = resp_response['headers']['content-type'].split(";")[0]
+			if 'mimeType' in resp_response:
+				ctype = resp_response['mimeType']
+			if 'headers' in resp_response and 'content-type' in resp_response['headers']:
+				ctype = resp_response['headers']['content-type'].split(";")[0]
 
-		self.log.debug("Trying to get response body")
-		try:
-			ret = self.get_unpacked_response_body(resp['requestId'], mimetype=ctype)
-		except ChromeError:
-			ret = self.handle_page_location_changed(timeout)
+			self.log.debug("Trying to get response body")
+			try:
+				ret = self.get_unpacked_response_body(resp['requestId'], mimetype=ctype)
+			except ChromeError:
+				ret = self.handle_page_location_changed(timeout)
 
 		return ret
 
@@ -958,20 +1174,22 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 			"DOM.childNodeCountUpdated",
 		]
 
-		start_time = time.time()
-		try:
-			while 1:
-				if time.time() - start_time > max_wait_timeout:
-					self.log.debug("Page was not idle after waiting %s seconds. Giving up and extracting content now.", max_wait_timeout)
-				self.transport.recv_filtered(
-						filter_funcs.wait_for_methods(target_events),
-						tab_key = self.tab_id,
-						timeout = dom_idle_requirement_secs
-					)
+		with self.subscribe(target_events):
+			start_time = time.time()
+			try:
+				while 1:
+					if time.time() - start_time > max_wait_timeout:
+						self.log.debug("Page was not idle after waiting %s seconds. Giving up and extracting content now.", max_wait_timeout)
+						break
+					self.transport.recv_filtered(
+							filter_funcs.wait_for_methods(target_events),
+							tab_key = self.tab_id,
+							timeout = dom_idle_requirement_secs
+						)
 
-		except ChromeResponseNotReceived:
-			# We timed out, the DOM is probably idle.
-			pass
+			except ChromeResponseNotReceived:
+				# We timed out, the DOM is probably idle.
+				pass
 
 
 
@@ -992,17 +1210,32 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 		return response['result']['outerHTML']
 
 
-	def take_screeshot(self):
+	def take_screeshot(self, into=None, fileobj=None):
 		'''
 		Take a screenshot of the virtual viewport content.
 
 		Return value is a png image as a bytestring.
+
+		To avoid allocating a new buffer for each screenshot, a writable buffer can be passed
+		as `into`. The image is decoded straight into it (see `b64_decode.decode_into()`), and
+		the return value is a `memoryview` of the image within the buffer. A `bytearray` is
+		grown if it's too small, so a single one can be reused for every screenshot (growing it
+		requires the views returned by previous calls to have been released).
+
+		If `fileobj` is passed, the image is instead decoded straight into the file object,
+		and the return value is the size of the image.
 		'''
 		resp = self.Page_captureScreenshot()
 		assert 'result' in resp
 		assert 'data' in resp['result']
-		imgdat = base64.b64decode(resp['result']['data'])
-		return imgdat
+		data = resp['result']['data']
+
+		if fileobj is not None:
+			return b64_decode.decode_to_file(data, fileobj)
+		if into is not None:
+			size = b64_decode.decode_into(data, into)
+			return memoryview(into)[:size]
+		return b64_decode.decode(data)
 
 
 	def blocking_navigate(self, url, timeout=DEFAULT_TIMEOUT_SECS):
@@ -1028,57 +1261,67 @@ class ChromeRemoteDebugInterface(ChromeRemoteDebugInterface_base):
 
 		'''
 
-		self.transport.flush(tab_key=self.tab_id)
-
-		self.log.debug("Blocking navigate to URL: '%s'", url)
-		ret = self.Page_navigate(url = url)
-
-		assert("result"   in ret),           "Missing return content"
-		assert("frameId"  in ret['result']), "Missing 'frameId' in return content"
-		assert("loaderId" in ret['result']), "Missing 'loaderId' in return content"
-
-		expected_id = ret['result']['frameId']
-		loader_id   = ret['result']['loaderId']
+		# Events that arrive before we get around to waiting for them would
+		# otherwise be discarded, if the transport is filtering events.
+		navigate_events = [
+			"Page.frameNavigated",
+			"Page.frameStartedLoading",
+			"Page.frameStoppedLoading",
+			"Network.responseReceived",
+		]
 
-		try:
-			self.log.debug("Waiting for frame navigated command response.")
-			self.transport.recv_filtered(filter_funcs.check_frame_navigated_command(expected_id), tab_key=self.tab_id, timeout=timeout)
-			self.log.debug("Waiting for frameStartedLoading response.")
-			self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStartedLoading"), tab_key=self.tab_id, timeout=timeout)
-			self.log.debug("Waiting for frameStoppedLoading response.")
-			self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStoppedLoading"), tab_key=self.tab_id, timeout=timeout)
-			# self.transport.recv_filtered(check_load_event_fired, tab_key=self.tab_id, timeout=timeout)
-
-			self.log.debug("Waiting for responseReceived response.")
-			resp = self.transport.recv_filtered(filter_funcs.network_response_recieved_for_url(url=None, expected_id=expected_id), tab_key=self.tab_id, timeout=timeout)
-
-			if resp is None:
-				raise ChromeNavigateTimedOut("Blocking navigate timed out!")
-
-			return resp['params']
-		# The `Page.frameNavigated ` event does not get fired for non-markup responses.
-		# Therefore, if we timeout on waiting for that, check to see if we received a binary response.
-		except ChromeResponseNotReceived:
-			# So this is basically broken, fix is https://bugs.chromium.org/p/chromium/issues/detail?id=831887
-			# but that bug report isn't fixed yet.
-			# Siiiigh.
-			self.log.warning("Failed to receive expected response to navigate command. Checking if response is a binary object.")
-			resp = self.transport.recv_filtered(
-				keycheck = filter_funcs.check_frame_loader_command(
-						method_name = "Network.responseReceived",
-						loader_id   = loader_id
-					),
-				tab_key  = self.tab_id,
-				timeout  = timeout)
-
-			return resp['params']
+		with self.subscribe(navigate_events):
+			self.transport.flush(tab_key=self.tab_id)
+
+			self.log.debug("Blocking navigate to URL: '%s'", url)
+			ret = self.Page_navigate(url = url)
+
+			assert("result"   in ret),           "Missing return content"
+			assert("frameId"  in ret['result']), "Missing 'frameId' in return content"
+			assert("loaderId" in ret['result']), "Missing 'loaderId' in return content"
+
+			expected_id = ret['result']['frameId']
+			loader_id   = ret['result']['loaderId']
+
+			try:
+				self.log.debug("Waiting for frame navigated command response.")
+				self.transport.recv_filtered(filter_funcs.check_frame_navigated_command(expected_id), tab_key=self.tab_id, timeout=timeout)
+				self.log.debug("Waiting for frameStartedLoading response.")
+				self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStartedLoading"), tab_key=self.tab_id, timeout=timeout)
+				self.log.debug("Waiting for frameStoppedLoading response.")
+				self.transport.recv_filtered(filter_funcs.check_frame_load_command("Page.frameStoppedLoading"), tab_key=self.tab_id, timeout=timeout)
+				# self.transport.recv_filtered(check_load_event_fired, tab_key=self.tab_id, timeout=timeout)
+
+				self.log.debug("Waiting for responseReceived response.")
+				resp = self.transport.recv_filtered(filter_funcs.network_response_recieved_for_url(url=None, expected_id=expected_id), tab_key=self.tab_id, timeout=timeout)
+
+				if resp is None:
+					raise ChromeNavigateTimedOut("Blocking navigate timed out!")
+
+				return resp['params']
+			# The `Page.frameNavigated ` event does not get fired for non-markup responses.
+			# Therefore, if we timeout on waiting for that, check to see if we received a binary response.
+			except ChromeResponseNotReceived:
+				# So this is basically broken, fix is https://bugs.chromium.org/p/chromium/issues/detail?id=831887
+				# but that bug report isn't fixed yet.
+				# Siiiigh.
+				self.log.warning("Failed to receive expected response to navigate command. Checking if response is a binary object.")
+				resp = self.transport.recv_filtered(
+					keycheck = filter_funcs.check_frame_loader_command(
+							method_name = "Network.responseReceived",
+							loader_id   = loader_id
+						),
+					tab_key  = self.tab_id,
+					timeout  = timeout)
+
+				return resp['params']
 
 	def new_tab(self, *args, **kwargs):
 
 		tab = super().new_tab(*args, **kwargs)
 
-		for script in self.__new_tab_scripts:
-			tab.Page_addScriptToEvaluateOnNewDocument(script)
+		if self.__new_tab_scripts:
+			tab.batch_command([("Page.addScriptToEvaluateOnNewDocument", {"source" : script}) for script in self.__new_tab_scripts])
 		return tab
 
 
@@ -2,12 +2,12 @@
 import time
 import traceback
 import pprint
-import gc
 import uuid
 import logging
 
 from . import cr_exceptions
 from .transport import ChromeExecutionManager
+from .async_transport import AsyncChromeExecutionManager
 
 
 
@@ -34,15 +34,11 @@ class ChromeInterface():
 		of chromium instances, if you are not trying to instantiate multiple instances of chromium
 		at once.
 
-		"""
-
-		# Force cleanup of dangling processes (if any)
-		# This is needed because the deletion of active chromium processes
-		# can occur dignificantly after the corresponding object goes out-of-scope, which
-		# leads to connecting to the wrong process, and then when it is GC'ed,
-		# you get a connection-died error.
-		gc.collect()
+		The interface can be used as a context manager, which calls `close()` on exit. An
+		interface that is never closed has its chromium instance shut down by the transport's
+		finalizer once it's garbage collected.
 
+		"""
 
 		self.log = logging.getLogger("Main.ChromeController.Interface")
 		if use_execution_manager:
@@ -98,9 +94,24 @@ class ChromeInterface():
 		ret = self.transport.synchronous_command(tab_key=self.tab_id, *args, **kwargs)
 		self.transport.check_process_ded()
 		self.__check_ret(ret)
-		self.transport.check_process_ded()
 		return ret
 
+	def batch_command(self, commands):
+		'''
+		Pipeline a sequence of `(command, params)` 2-tuples to the remote chrome
+		instance, sending them all before waiting for any of the responses.
+
+		Each response is checked for errors as in `synchronous_command()`.
+		Return value is a list of the responses, in the order of `commands`.
+
+		'''
+		self.transport.check_process_ded()
+		rets = self.transport.batch_command(commands, tab_key=self.tab_id)
+		self.transport.check_process_ded()
+		for ret in rets:
+			self.__check_ret(ret)
+		return rets
+
 	def drain_transport(self):
 		'''
 		"Drain" the transport connection.
@@ -116,11 +127,59 @@ class ChromeInterface():
 		self.transport.check_process_ded()
 		return ret
 
-	def new_tab(self, *args, **kwargs):
-		new = self.__class__(use_execution_manager=(self.transport, uuid.uuid4()), *args, **kwargs)
+	def subscribe(self, methods):
+		'''
+		Keep the events in the list `methods` for this tab until they are consumed,
+		even if nothing is waiting on them when they arrive.
+
+		This only matters if the interface was created with `filter_events=True`, in which
+		case every event that has no subscription, callback or pending waiter is discarded
+		as it is received, mostly without ever being decoded.
+
+		Returns a subscription handle, which can be closed to remove the subscription,
+		or used as a context manager:
+
+		```
+			with cr.subscribe(["Network.requestWillBeSent"]):
+				...
+		```
+
+		'''
+		return self.transport.subscribe(self.tab_id, methods)
+
+	def on(self, method, callback):
+		'''
+		Call `callback(message)` for every event with method `method` this tab receives.
+
+		The callback may be called from a background thread, so it should not block,
+		or send commands itself.
+
+		Returns a handle which can be closed to remove the callback.
+		'''
+		return self.transport.on(self.tab_id, method, callback)
+
+	def new_tab(self, *args, isolated=False, **kwargs):
+		'''
+		Open a new tab in the same chromium instance.
+
+		If `isolated` is true, the tab is created in a new browser context of its own (see
+		`ChromeExecutionManager.create_browser_context()`), so its cookies and storage are
+		separate from those of every other tab. The context is disposed of when the tab is closed.
+		'''
+		tab_key = uuid.uuid4()
+		if isolated:
+			self.transport.create_browser_context(tab_key)
+		new = self.__class__(use_execution_manager=(self.transport, tab_key), *args, **kwargs)
 		self.transport.check_process_ded()
 		return new
 
+	@property
+	def browser_context_id(self):
+		'''
+		The id of the browser context the tab was created in, or None for the default context.
+		'''
+		return self.transport.tab_contexts.get(self.tab_id)
+
 	def close(self):
 		# The process shouldn't be dead before we explicitly kill it.
 		self.transport.check_process_ded()
@@ -130,8 +189,131 @@ class ChromeInterface():
 		else:
 			self.transport.close_tab(tab_key=self.tab_id)
 
-		gc.collect()
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+
+
+class AsyncChromeInterface():
+	"""
+	asyncio sibling of `ChromeInterface`.
+
+	Construction launches chromium (which blocks), but all commands are coroutines,
+	sent through a `AsyncChromeExecutionManager`.
+	"""
+
+	def __init__(self, binary, dbg_port, use_execution_manager, additional_options, *args, **kwargs):
+		"""
+		Base async chromium transport initialization.
+
+		Arguments are as for `ChromeInterface()`.
+
+		"""
+
+		self.log = logging.getLogger("Main.ChromeController.AsyncInterface")
+		if use_execution_manager:
+			self.is_root_session = False
+			self.transport, self.tab_id = use_execution_manager
+
+		else:
+			self.is_root_session = True
+			self.log.debug("Binary: %s", binary)
+			self.log.debug("Args: %s", args)
+			self.log.debug("Kwargs: %s", kwargs)
+
+			self.tab_id = uuid.uuid4()
+
+			self.transport = AsyncChromeExecutionManager(
+					binary             = binary,
+					port               = dbg_port,
+					base_tab_key       = self.tab_id,
+					additional_options = additional_options,
+					*args,
+					**kwargs
+				)
+			self.transport.check_process_ded()
+
+
+	def __check_ret(self, ret):
+		if ret is False or ret is None:
+			raise cr_exceptions.ChromeError("Null response from Chromium (or timed out)!")
+
+		if 'error' in ret:
+			err = pprint.pformat(ret)
+			raise cr_exceptions.ChromeError("Error in response: \n{}".format(err))
+
+
+	async def synchronous_command(self, *args, **kwargs):
+		'''
+		Forward a command to the remote chrome instance via the transport
+		connection, wait for the response, and check the return for an error.
+
+		Errors are raised as a `ChromeController.ChromeError`, as for
+		`ChromeInterface.synchronous_command()`.
+		'''
+
+		self.transport.check_process_ded()
+		ret = await self.transport.synchronous_command(tab_key=self.tab_id, *args, **kwargs)
+		self.transport.check_process_ded()
+		self.__check_ret(ret)
+		return ret
+
+	async def batch_command(self, commands):
+		'''
+		Pipeline a sequence of `(command, params)` 2-tuples, as for
+		`ChromeInterface.batch_command()`.
+		'''
+		self.transport.check_process_ded()
+		rets = await self.transport.batch_command(commands, tab_key=self.tab_id)
+		self.transport.check_process_ded()
+		for ret in rets:
+			self.__check_ret(ret)
+		return rets
+
+	def drain_transport(self):
+		'''
+		Return all messages received from the remote chrome instance that have
+		not been consumed by a command or filter.
+		'''
+		self.transport.check_process_ded()
+		return self.transport.drain(tab_key=self.tab_id)
+
+	def subscribe(self, methods):
+		'''
+		Keep the events in the list `methods` for this tab. See `ChromeInterface.subscribe()`.
+		'''
+		return self.transport.subscribe(self.tab_id, methods)
+
+	def on(self, method, callback):
+		'''
+		Call `callback(message)` for every event with method `method` this tab receives.
+
+		The callback is called from the transport's reader task, so it must not block.
+		'''
+		return self.transport.on(self.tab_id, method, callback)
+
+	def new_tab(self, *args, **kwargs):
+		new = self.__class__(use_execution_manager=(self.transport, uuid.uuid4()), *args, **kwargs)
+		self.transport.check_process_ded()
+		return new
+
+	async def close(self):
+		# The process shouldn't be dead before we explicitly kill it.
+		self.transport.check_process_ded()
+
+		if self.is_root_session:
+			await self.transport.close_all()
+		else:
+			await self.transport.close_tab(tab_key=self.tab_id)
+
+	async def __aenter__(self):
+		return self
 
+	async def __aexit__(self, *args):
+		await self.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,424 @@
+
+import heapq
+import logging
+import itertools
+import threading
+import collections
+
+
+class _Waiter(object):
+	__slots__ = ('keycheck', 'methods', 'future')
+
+	def __init__(self, keycheck, future):
+		self.keycheck = keycheck
+		self.methods  = getattr(keycheck, 'methods', None)
+		self.future   = future
+
+
+class Subscription(object):
+	'''
+	Handle for a subscription (or callback) registered with a `MessageStore`.
+
+	Calling `close()` (or leaving the `with` block, if used as a context manager)
+	removes the subscription. Closing an already closed subscription does nothing.
+	'''
+
+	def __init__(self, store, methods, callback=None):
+		self.store    = store
+		self.methods  = methods
+		self.callback = callback
+		self.closed   = False
+
+	def close(self):
+		if self.closed:
+			return
+		self.closed = True
+		if self.callback:
+			self.store.remove_callback(self.methods[0], self.callback)
+		else:
+			self.store.unsubscribe(self.methods)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+
+class MessageStore(object):
+	'''
+	Buffer for the messages received from a tab that have not been consumed yet.
+
+	Messages are kept in arrival order, and are additionally indexed by their `id`
+	(for command responses) and by their `method` (for events). Filter functions can
+	declare the set of event methods they are able to match with a `methods`
+	attribute (see `filter_funcs`). Lookups with such a filter only walk the buckets
+	for those methods (and any buffered command responses), rather than every
+	buffered message.
+
+	A consumer that has to block for a message can register a waiter with a future.
+	New messages are offered to the waiters before being buffered, so a message is
+	only ever checked against a waiting filter once.
+
+	If `capacity` is not None, at most `capacity` events are retained. When the store
+	is full, an event is evicted according to `drop_policy`:
+
+	 - `"oldest"` drops the oldest buffered event.
+	 - A sequence of method names or prefixes (e.g. `["Network.dataReceived", "DOM."]`)
+	   drops the oldest event matching the first entry for which there are any buffered
+	   events, and falls back to the oldest event if nothing matches.
+
+	Command responses do not count towards the capacity, and are never evicted.
+
+	If `filter_events` is true, events are only kept if there is a subscription for
+	their method (see `subscribe()`), a callback for it (see `add_callback()`), or a
+	waiter that could match them. Everything else is discarded. The transport calls
+	`admit()` with the method name before decoding a frame, so discarded events are
+	never deserialized at all if it can be avoided.
+
+	Callbacks are called for every event with a matching method, regardless of
+	`filter_events`, from whichever thread passed the event to `put()`.
+
+	All operations are atomic, so a store can be shared between a reader thread and
+	the threads consuming from it.
+	'''
+
+	def __init__(self, capacity=None, drop_policy="oldest", filter_events=False):
+		assert capacity is None or capacity > 0, "capacity must be None or a positive integer"
+		assert drop_policy == "oldest" or (isinstance(drop_policy, (list, tuple)) and all(isinstance(tmp, str) for tmp in drop_policy)), \
+			"drop_policy must be 'oldest', or a list of method names or prefixes. Passed: %s" % (drop_policy, )
+
+		self.capacity      = capacity
+		self.drop_policy   = drop_policy
+		self.filter_events = filter_events
+
+		self.log = logging.getLogger("Main.ChromeController.MessageStore")
+
+		self.lock        = threading.Lock()
+		self.__seq       = itertools.count()
+		self.__ordered   = collections.OrderedDict()
+		self.__by_id     = {}
+		self.__by_method = {}
+		self.__waiters   = []
+		self.__ignored   = set()
+
+		self.__subscriptions = collections.Counter()
+		self.__callbacks     = {}
+
+		self.__events            = 0
+		self.__peak              = 0
+		self.__dropped           = 0
+		self.__dropped_by_method = collections.Counter()
+		self.__filtered          = 0
+
+	def __len__(self):
+		return len(self.__ordered)
+
+	def stats(self):
+		'''
+		Return the buffer accounting for the store, as a dict:
+
+		 - `capacity`: The configured event capacity (or None, if unbounded).
+		 - `retained`: The number of events currently buffered.
+		 - `peak`: The largest number of events that have been buffered at once.
+		 - `dropped`: The number of events evicted because the store was full.
+		 - `dropped_by_method`: A dict of evicted event counts, keyed by event method.
+		 - `filtered`: The number of events discarded because nothing was subscribed to them.
+		'''
+		with self.lock:
+			return {
+					'capacity'          : self.capacity,
+					'retained'          : self.__events,
+					'peak'              : self.__peak,
+					'dropped'           : self.__dropped,
+					'dropped_by_method' : dict(self.__dropped_by_method),
+					'filtered'          : self.__filtered,
+				}
+
+	def subscribe(self, methods):
+		'''
+		Keep events with a method in `methods`, even if nothing is waiting on them.
+
+		Subscriptions are reference counted, so overlapping subscriptions to the same method
+		can be added and removed independently.
+		'''
+		with self.lock:
+			self.__subscriptions.update(methods)
+		return Subscription(self, list(methods))
+
+	def unsubscribe(self, methods):
+		with self.lock:
+			self.__subscriptions.subtract(methods)
+			for method in methods:
+				if self.__subscriptions[method] <= 0:
+					del self.__subscriptions[method]
+
+	def add_callback(self, method, callback):
+		'''
+		Call `callback(message)` for every event with method `method`.
+		'''
+		with self.lock:
+			self.__callbacks.setdefault(method, []).append(callback)
+		return Subscription(self, [method], callback)
+
+	def remove_callback(self, method, callback):
+		with self.lock:
+			callbacks = self.__callbacks.get(method, [])
+			if callback in callbacks:
+				callbacks.remove(callback)
+			if not callbacks:
+				self.__callbacks.pop(method, None)
+
+	def __wants(self, method):
+		if method in self.__subscriptions or method in self.__callbacks:
+			return True
+		return any(waiter.methods is None or method in waiter.methods for waiter in self.__waiters)
+
+	def admit(self, method):
+		'''
+		Return whether an event with method `method` would be kept (or passed to a callback)
+		by the store. If not, the event is counted as filtered, and the caller can discard it
+		without decoding it.
+		'''
+		if not self.filter_events:
+			return True
+
+		with self.lock:
+			if self.__wants(method):
+				return True
+			self.__filtered += 1
+			return False
+
+	def __matches(self, keycheck, methods, message):
+		if methods is not None and 'method' in message and message['method'] not in methods:
+			return False
+		return keycheck(message)
+
+	def __insert(self, message):
+		seq = next(self.__seq)
+		self.__ordered[seq] = message
+		if 'id' in message:
+			self.__by_id[message['id']] = seq
+		if 'method' in message:
+			self.__by_method.setdefault(message['method'], collections.OrderedDict())[seq] = message
+			self.__events += 1
+
+			if self.capacity is not None and self.__events > self.capacity:
+				victim = self.__remove(self.__select_victim())
+				self.__dropped += 1
+				self.__dropped_by_method[victim['method']] += 1
+
+			self.__peak = max(self.__peak, self.__events)
+
+	def __remove(self, seq):
+		message = self.__ordered.pop(seq)
+		if 'id' in message:
+			self.__by_id.pop(message['id'], None)
+		if 'method' in message:
+			bucket = self.__by_method[message['method']]
+			bucket.pop(seq)
+			if not bucket:
+				self.__by_method.pop(message['method'])
+			self.__events -= 1
+		return message
+
+	def __oldest_event(self, methods):
+		'''
+		Return the sequence number of the oldest buffered event with a method in `methods`, or None.
+		'''
+		oldest = None
+		for method in methods:
+			seq = next(iter(self.__by_method[method]))
+			if oldest is None or seq < oldest:
+				oldest = seq
+		return oldest
+
+	def __select_victim(self):
+		if self.drop_policy != "oldest":
+			for prefix in self.drop_policy:
+				seq = self.__oldest_event([method for method in self.__by_method if method.startswith(prefix)])
+				if seq is not None:
+					return seq
+
+		return self.__oldest_event(self.__by_method)
+
+	def __candidates(self, methods):
+		'''
+		Iterate over the (seq, message) pairs that could match a filter for `methods`, in arrival order.
+		'''
+		if methods is None:
+			return self.__ordered.items()
+
+		buckets = [self.__by_method[method].items() for method in methods if method in self.__by_method]
+
+		# Command responses have no method, so they're always candidates.
+		if self.__by_id:
+			buckets.append([(seq, self.__ordered[seq]) for seq in self.__by_id.values()])
+
+		if len(buckets) == 1:
+			return buckets[0]
+
+		# Sequence numbers are unique, so the merge never has to compare the messages themselves.
+		return heapq.merge(*buckets)
+
+	def __find(self, keycheck):
+		methods = getattr(keycheck, 'methods', None)
+		for seq, message in self.__candidates(methods):
+			if keycheck(message):
+				return seq
+		return None
+
+	def put(self, message):
+		'''
+		Add `message` to the store.
+
+		If a registered waiter's filter matches the message, the message is handed to
+		that waiter's future instead of being buffered.
+		'''
+		if not message:
+			return
+
+		method = message.get('method')
+		with self.lock:
+			if 'id' in message and message['id'] in self.__ignored:
+				self.__ignored.discard(message['id'])
+				return
+			callbacks = list(self.__callbacks.get(method, [])) if method else []
+			self.__deliver(message, method, bool(callbacks))
+
+		self.__run_callbacks(message, method, callbacks)
+
+	def dispatch(self, message):
+		'''
+		Call the callbacks registered for the method of `message`, without storing it.
+
+		This is for messages that are handed straight to whoever was reading the socket,
+		rather than going through `put()`, so callbacks still see every event.
+		'''
+		if not message:
+			return
+
+		method = message.get('method')
+		if not method:
+			return
+		with self.lock:
+			callbacks = list(self.__callbacks.get(method, []))
+		self.__run_callbacks(message, method, callbacks)
+
+	def __run_callbacks(self, message, method, callbacks):
+		for callback in callbacks:
+			try:
+				callback(message)
+			except Exception:
+				self.log.exception("Exception in callback for event %s", method)
+
+	def __deliver(self, message, method, has_callbacks):
+		for waiter in list(self.__waiters):
+			if waiter.future.done():
+				self.__waiters.remove(waiter)
+				continue
+			if self.__matches(waiter.keycheck, waiter.methods, message):
+				self.__waiters.remove(waiter)
+				waiter.future.set_result(message)
+				return
+
+		if method and self.filter_events and method not in self.__subscriptions:
+			if not has_callbacks:
+				self.__filtered += 1
+			return
+
+		self.__insert(message)
+
+	def pop_id(self, message_id):
+		'''
+		Remove and return the buffered response with id `message_id`, or None if it hasn't been received.
+		'''
+		with self.lock:
+			seq = self.__by_id.get(message_id)
+			if seq is None:
+				return None
+			return self.__remove(seq)
+
+	def ignore_id(self, message_id):
+		'''
+		Discard the response with id `message_id`, which nobody is going to wait for. If it
+		has already been received, it's removed, otherwise it's dropped when it arrives.
+		'''
+		with self.lock:
+			seq = self.__by_id.get(message_id)
+			if seq is not None:
+				self.__remove(seq)
+			else:
+				self.__ignored.add(message_id)
+
+	def pop_first(self, keycheck):
+		'''
+		Remove and return the earliest buffered message for which `keycheck(message)` is true,
+		or None if there is no such message.
+		'''
+		with self.lock:
+			seq = self.__find(keycheck)
+			if seq is None:
+				return None
+			return self.__remove(seq)
+
+	def pop_all(self, keycheck):
+		'''
+		Remove and return all buffered messages for which `keycheck(message)` is true, in arrival order.
+		'''
+		with self.lock:
+			methods = getattr(keycheck, 'methods', None)
+			matched = [seq for seq, message in self.__candidates(methods) if keycheck(message)]
+			return [self.__remove(seq) for seq in matched]
+
+	def pop_first_or_wait(self, keycheck, future):
+		'''
+		Atomically either pop the earliest message matching `keycheck`, or, if there is
+		none, register `future` to receive the next matching message.
+
+		Return value is a 2-tuple of `(message, waiter)`. Exactly one of the two is not None.
+		The waiter should be passed to `cancel_waiter()` if the caller gives up on it.
+		'''
+		with self.lock:
+			seq = self.__find(keycheck)
+			if seq is not None:
+				return self.__remove(seq), None
+
+			waiter = _Waiter(keycheck, future)
+			self.__waiters.append(waiter)
+			return None, waiter
+
+	def cancel_waiter(self, waiter):
+		'''
+		Unregister `waiter`. Returns False if a message had already been delivered to it.
+		'''
+		with self.lock:
+			if waiter in self.__waiters:
+				self.__waiters.remove(waiter)
+				return True
+			return False
+
+	def fail_waiters(self, exc):
+		'''
+		Raise `exc` in everything currently waiting on the store.
+		'''
+		with self.lock:
+			waiters, self.__waiters = self.__waiters, []
+		for waiter in waiters:
+			if not waiter.future.done():
+				waiter.future.set_exception(exc)
+
+	def drain(self):
+		'''
+		Remove and return all buffered messages, in arrival order.
+		'''
+		with self.lock:
+			ret = list(self.__ordered.values())
+			self.__ordered.clear()
+			self.__by_id.clear()
+			self.__by_method.clear()
+			self.__events = 0
+			return ret
+
+	def clear(self):
+		self.drain()
@@ -0,0 +1,202 @@
+
+import os
+import queue
+import logging
+import threading
+import contextlib
+import concurrent.futures
+
+from ChromeController.manager import ChromeRemoteDebugInterface
+
+
+class _PooledBrowser(object):
+	'''
+	A chromium instance owned by a `ChromiumProcessPool`.
+
+	`root` is the interface the instance was started with. It is held open for the lifetime
+	of the instance, so chromium doesn't exit when the last handed out tab is closed.
+	'''
+
+	def __init__(self, root):
+		self.root = root
+		self.uses = 0
+
+	def close(self):
+		self.root.close()
+
+
+class ChromiumProcessPool(object):
+
+	def __init__(self, *args, pool_size=2, max_uses=20, **kwargs):
+		'''
+		Create a pool of pre-started chromium instances.
+
+		`pool_size` idle chromium instances are kept booted in the background. `acquire()`
+		(or the `tab()` context manager) hands out a new tab in an idle instance, which
+		is then reserved for the caller until the tab is released. Each instance is shut
+		down and replaced after it's been handed out `max_uses` times, since tabs of the
+		same instance share cookies and cache.
+
+		Each instance gets its own debug port. All other parameters are forwarded through to
+		the underlying ChromeRemoteDebugInterface() constructor.
+
+		If no instance is idle when one is requested (e.g. the pool is still booting, or more
+		then `pool_size` instances are in use), one is started synchronously instead.
+		'''
+		assert pool_size > 0, "pool_size must be a positive integer"
+		assert max_uses is None or max_uses > 0, "max_uses must be None or a positive integer"
+
+		self.args      = args
+		self.kwargs    = kwargs
+		self.pool_size = pool_size
+		self.max_uses  = max_uses
+		self.alive     = True
+
+		self.log = logging.getLogger("Main.ChromeController.ProcessPool")
+
+		self.__lock         = threading.Lock()
+		self.__idle         = queue.Queue()
+		self.__checked_out  = {}
+		self.__starting     = 0
+		self.__executor     = concurrent.futures.ThreadPoolExecutor(max_workers=pool_size)
+		self.__started_pid  = os.getpid()
+
+		self.__refill()
+
+	def __boot(self):
+		self.log.debug("Starting pooled chromium instance")
+		return _PooledBrowser(ChromeRemoteDebugInterface(*self.args, **self.kwargs))
+
+	def __boot_background(self):
+		try:
+			browser = self.__boot()
+		except Exception:
+			self.log.exception("Failed to start pooled chromium instance!")
+			return
+		finally:
+			with self.__lock:
+				self.__starting -= 1
+
+		# Released instances may have refilled the pool while we were starting.
+		if self.alive and self.__idle.qsize() < self.pool_size:
+			self.__idle.put(browser)
+		else:
+			self.__retire(browser)
+
+	def __refill(self):
+		'''
+		Start enough instances in the background to bring the pool back up to `pool_size` idle instances.
+		'''
+		with self.__lock:
+			if not self.alive:
+				return
+			needed = self.pool_size - self.__idle.qsize() - self.__starting
+			self.__starting += max(needed, 0)
+
+		for dummy_x in range(needed):
+			self.__executor.submit(self.__boot_background)
+
+	def __retire(self, browser):
+		try:
+			browser.close()
+		except Exception:
+			self.log.exception("Error closing pooled chromium instance")
+
+	def idle_count(self):
+		'''
+		Return the number of booted instances waiting to be handed out.
+		'''
+		return self.__idle.qsize()
+
+	def active_count(self):
+		'''
+		Return the number of instances currently handed out.
+		'''
+		return len(self.__checked_out)
+
+	def acquire(self):
+		'''
+		Return a new tab (a `ChromeRemoteDebugInterface`) in an idle chromium instance.
+
+		The tab must be returned with `release()` when the caller is done with it.
+		'''
+		assert self.alive, "The process pool has been shut down! Cannot continue!"
+		if self.__started_pid != os.getpid():
+			raise RuntimeError("ChromiumProcessPool instances are not safe to share across multiple processes.")
+
+		try:
+			browser = self.__idle.get_nowait()
+		except queue.Empty:
+			self.log.warning("No idle chromium instances in pool. Starting one synchronously.")
+			browser = self.__boot()
+
+		self.__refill()
+
+		browser.uses += 1
+		try:
+			tab = browser.root.new_tab()
+		except Exception:
+			self.__retire(browser)
+			raise
+
+		with self.__lock:
+			self.__checked_out[tab.tab_id] = browser
+		return tab
+
+	def release(self, tab):
+		'''
+		Close a tab returned by `acquire()`, and return its chromium instance to the pool
+		(or shut it down, if it has been used `max_uses` times).
+		'''
+		with self.__lock:
+			browser = self.__checked_out.pop(tab.tab_id)
+
+		try:
+			tab.close()
+		except Exception:
+			self.log.exception("Error closing pooled tab. Discarding chromium instance.")
+			self.__retire(browser)
+			self.__refill()
+			return
+
+		if not self.alive or (self.max_uses is not None and browser.uses >= self.max_uses) or self.__idle.qsize() >= self.pool_size:
+			self.log.debug("Retiring pooled chromium instance after %s uses", browser.uses)
+			self.__retire(browser)
+			self.__refill()
+		else:
+			self.__idle.put(browser)
+
+	@contextlib.contextmanager
+	def tab(self):
+		'''
+		Context manager wrapping `acquire()` and `release()`.
+		'''
+		tab = self.acquire()
+		try:
+			yield tab
+		finally:
+			self.release(tab)
+
+	def close(self):
+		'''
+		Shut down the idle instances, and stop refilling the pool. Instances that are
+		handed out are shut down when they're released.
+		'''
+		if not self.alive:
+			return
+
+		with self.__lock:
+			self.alive = False
+
+		self.__executor.shutdown(wait=True)
+		while True:
+			try:
+				self.__retire(self.__idle.get_nowait())
+			except queue.Empty:
+				break
+
+	def __del__(self):
+		try:
+			self.close()
+		except Exception:
+			pass
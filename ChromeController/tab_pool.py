@@ -2,23 +2,50 @@
 import logging
 import urllib.parse
 import os
+import bisect
+import hashlib
 import contextlib
+import concurrent.futures
 
 import cachetools
 import threading
 
 
 from ChromeController.manager import ChromeRemoteDebugInterface
+from ChromeController import cr_exceptions
+
+
+def _pool_key(netloc=None, url=None, extra_id=None, use_tid=False):
+	'''
+	Build the tab pool key for a `tab()` call (see `TabPooledChromium.tab()`).
+	'''
+	if not netloc and url:
+		netloc = urllib.parse.urlparse(url).netloc
+	# Coerce to string type so even if it's none, it doesn't hurt anything.
+	key = str(netloc)
+	if extra_id:
+		key += " " + str(extra_id)
+	if use_tid or not key:
+		key += " " + str(threading.get_ident())
+	return key
 
 
 class _TabStore(cachetools.LRUCache):
-	def __init__(self, chrome_interface, *args, **kwargs):
+	'''
+	LRU cache of `(lock, tab)` tuples.
+
+	This only does the bookkeeping. Tabs are created by the caller (outside the cache),
+	and evicted tabs are handed to `on_evict(key, value)` to be closed, so neither ever
+	happens inside a cache operation. The store is not thread-safe, so the caller has to
+	serialize access to it.
+	'''
+	def __init__(self, on_evict, *args, **kwargs):
 		assert "maxsize" in kwargs
 		assert kwargs['maxsize']
 		super().__init__(*args, **kwargs)
 		assert self.maxsize
 
-		self.chrome_interface = chrome_interface
+		self.on_evict = on_evict
 		self.log = logging.getLogger("Main.ChromeController.TabPool.Store")
 
 	def __getitem__(self, key):
@@ -26,17 +53,10 @@ class _TabStore(cachetools.LRUCache):
 		assert key is not None, "You have to pass a key to __getitem__!"
 		return super().__getitem__(key)
 
-	def __missing__(self, key):
-		self.log.debug("__missing__: %s", key)
-		assert key is not None, "You have to pass a key to __missing__!"
-		self[key] = (threading.Lock(), self.chrome_interface.new_tab())
-		return self[key]
-
 	def popitem(self):
 		key, value = super().popitem()
 		self.log.debug('Key "%s" evicted with value "%s"', key, value)
-		dummy_lock, tab = value
-		tab.close()
+		self.on_evict(key, value)
 		return None
 
 	def tab_count(self):
@@ -45,47 +65,183 @@ class _TabStore(cachetools.LRUCache):
 
 class TabPooledChromium(object):
 
-	def __init__(self, *args, tab_pool_max_size = None, **kwargs):
+	def __init__(self, *args, tab_pool_max_size = None, recycle_tabs = False, isolate_contexts = False, **kwargs):
 		'''
 		Create a chromium tab pool instance.
 
 		This will start a chromium instance, from which new tabs will be created as
 		needed with the tab() context manager.
 
+		If `recycle_tabs` is true, tabs evicted from the pool are reset (see
+		`ChromeRemoteDebugInterface.reset_tab()`) rather than closed, and handed out again
+		for the next new key, which saves the cost of closing and opening a tab. The pool's tabs
+		then track the origins they make requests to, and the reset clears the storage of all
+		of them. All the tabs still share the default browser context, though, so this doesn't
+		isolate keys from each other. Use `isolate_contexts` for that.
+
+		If `isolate_contexts` is true, each key's tab is created in a browser context of its
+		own (see `ChromeRemoteDebugInterface.new_tab()`), so every key gets a separate cookie
+		jar, cache and storage, without needing a chromium instance per key. A key's cookies
+		last as long as its tab, so they are lost once the tab is evicted from the pool. This
+		cannot be combined with `recycle_tabs`, as a recycled tab would carry its context over
+		to the next key.
+
 		Note that the destruction of the `TabPooledChromium` object will kill the associated chromium
 		execution. This will render any checked-out tabs invalid (though saving the tabs considering
 		they're constructed in a context-manager is pretty obviously wrong anyways).
 		'''
 		if tab_pool_max_size is None:
 			tab_pool_max_size = 10
+		assert not (recycle_tabs and isolate_contexts), "recycle_tabs and isolate_contexts cannot be used together!"
 
-		self.alive = True
-
-		self.chrome_interface = ChromeRemoteDebugInterface(*args, **kwargs)
-
-		# We hold a tab open to prevent chrome from closing
-		# when all user tabs are closed.
-		self.root_tab = self.chrome_interface.new_tab()
+		# Only set once everything is constructed, so `close()` (from `__del__()`) is a no-op
+		# on a pool whose chromium instance failed to start.
+		self.alive = False
 
 		self.tab_pool_max_size = tab_pool_max_size
+		self.recycle_tabs      = recycle_tabs
+		self.isolate_contexts  = isolate_contexts
 
 		self.log = logging.getLogger("Main.ChromeController.TabPool")
 
-		# We pass a tab to the tabstore, because otherwise it might wind up evicting the root tab,
+		# The root tab isn't in the tabstore, because otherwise it might wind up being evicted,
 		# which would take the entire chrome instance down with it when it's closed.
-		self.__tab_cache = _TabStore(maxsize=tab_pool_max_size, chrome_interface=self.chrome_interface)
+		self.__tab_cache = _TabStore(maxsize=tab_pool_max_size, on_evict=self.__on_evict)
+
+		# `__cache_lock` is only ever held for cache bookkeeping. Tabs are created under a
+		# per-key lock from `__creation_locks` instead, so a slow tab open only blocks callers
+		# waiting on the same key. Evicted tabs are closed in the background by `__closer`.
+		# Evicted tabs that are still checked out are parked in `__deferred` (keyed by the tab
+		# lock), and handed back to `__closer` once they're released, rather than having the
+		# closer wait on them.
+		self.__cache_lock     = threading.Lock()
+		self.__creation_locks = {}
+		self.__closer         = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+		self.__deferred       = {}
+
+		# Reset tabs waiting to be reused, if `recycle_tabs` is set.
+		self.__free_tabs      = []
 
 		self.__counter_lock = threading.Lock()
 		self.__active_tabs = {}
 
 		self.__started_pid = os.getpid()
 
+		self.chrome_interface = ChromeRemoteDebugInterface(*args, **kwargs)
+
+		# We hold a tab open to prevent chrome from closing
+		# when all user tabs are closed.
+		self.root_tab = self.chrome_interface.new_tab()
+
+		self.alive = True
+
 
 	def close(self):
 		if self.alive:
+			self.alive = False
+			self.__closer.shutdown(wait=True)
 			self.root_tab.close()
 			self.chrome_interface.close()
-			self.alive = False
+
+	def __when_released(self, func, key, value):
+		'''
+		Call `func(key, value)` with the lock of the tab in `value` held.
+
+		If the tab is checked out, this doesn't wait for it, but parks `func` until the tab
+		is released (see `tab()`), so one long-held tab doesn't hold up every other eviction.
+		'''
+		lock, tab = value
+		with self.__cache_lock:
+			if not lock.acquire(blocking=False):
+				self.__deferred[lock] = (func, key, value)
+				return
+		try:
+			func(key, value)
+		finally:
+			lock.release()
+
+	def __close_tab(self, key, value):
+		lock, tab = value
+		try:
+			tab.close()
+		except Exception:
+			self.log.exception("Error closing evicted tab for key %s", key)
+
+	def __recycle_tab(self, key, value):
+		lock, tab = value
+		try:
+			tab.reset_tab()
+		except Exception:
+			self.log.exception("Error resetting evicted tab for key %s. Closing it instead.", key)
+			self.__close_tab(key, value)
+			return
+
+		with self.__cache_lock:
+			if len(self.__free_tabs) < self.tab_pool_max_size:
+				self.__free_tabs.append(tab)
+				return
+		self.__close_tab(key, value)
+
+	def __on_evict(self, key, value):
+		# Called with the cache lock held, so the close is deferred.
+		if self.recycle_tabs:
+			self.__closer.submit(self.__when_released, self.__recycle_tab, key, value)
+		else:
+			self.__closer.submit(self.__when_released, self.__close_tab, key, value)
+
+	def __release(self, lock):
+		'''
+		Hand an evicted tab that was checked out when it was evicted back to the closer,
+		now that it's been released.
+		'''
+		with self.__cache_lock:
+			job = self.__deferred.pop(lock, None)
+		if job is not None and self.alive:
+			self.__closer.submit(self.__when_released, *job)
+
+	def __new_tab(self):
+		with self.__cache_lock:
+			if self.__free_tabs:
+				return self.__free_tabs.pop()
+		tab = self.chrome_interface.new_tab(isolated=self.isolate_contexts)
+		if self.recycle_tabs:
+			tab.track_origins()
+		return tab
+
+	def __get_tab(self, key):
+		'''
+		Return the `(lock, tab)` tuple for `key`, creating the tab if needed.
+		'''
+		with self.__cache_lock:
+			value = self.__tab_cache.get(key)
+			if value is not None:
+				return value
+			creation_lock = self.__creation_locks.setdefault(key, threading.Lock())
+
+		with creation_lock:
+			# Someone else may have created the tab while we were waiting.
+			with self.__cache_lock:
+				value = self.__tab_cache.get(key)
+				if value is not None:
+					return value
+
+			try:
+				self.log.debug("Creating tab for key: %s", key)
+				value = (threading.Lock(), self.__new_tab())
+				with self.__cache_lock:
+					existing = self.__tab_cache.get(key)
+					if existing is not None:
+						# Only possible if a previous creation for the key failed while there were
+						# several callers waiting on it. Keep the first tab, and discard ours.
+						self.__on_evict(key, value)
+						return existing
+					self.__tab_cache[key] = value
+			finally:
+				with self.__cache_lock:
+					if self.__creation_locks.get(key) is creation_lock:
+						self.__creation_locks.pop(key)
+
+		return value
 
 	def __del__(self):
 		self.close()
@@ -98,18 +254,26 @@ class TabPooledChromium(object):
 		'''
 		Close all open tabs (but the management tab).
 
-		If some of the tabs are being used, this may cause errors
+		Tabs that are checked out are closed once they're released.
 		'''
-		with self.__counter_lock:
-			while self.__tab_cache.tab_count():
-				self.__tab_cache.popitem()
+		# Wait for any evicted tabs that are still being closed.
+		self.__closer.submit(lambda: None).result()
+
+		with self.__cache_lock:
+			values = [(key, self.__tab_cache.pop(key)) for key in list(self.__tab_cache.keys())]
+			values += [(None, (threading.Lock(), tab)) for tab in self.__free_tabs]
+			self.__free_tabs = []
+
+		for key, value in values:
+			self.__when_released(self.__close_tab, key, value)
 
 	def active_tabs(self):
 		'''
 		Return the number of currently active tabs.
 		'''
 
-		return self.__tab_cache.tab_count()
+		with self.__cache_lock:
+			return self.__tab_cache.tab_count()
 
 
 	@contextlib.contextmanager
@@ -127,15 +291,8 @@ class TabPooledChromium(object):
 
 		'''
 		assert self.alive, "Chrome has been shut down! Cannot continue!"
-		if not netloc and url:
-			netloc = urllib.parse.urlparse(url).netloc
-			self.log.debug("Getting tab for netloc: %s (url: %s)", netloc, url)
-		# Coerce to string type so even if it's none, it doesn't hurt anything.
-		key = str(netloc)
-		if extra_id:
-			key += " " + str(extra_id)
-		if use_tid or not key:
-			key += " " + str(threading.get_ident())
+		key = _pool_key(netloc, url, extra_id, use_tid)
+		self.log.debug("Getting tab for key: %s (url: %s)", key, url)
 
 		if self.__started_pid != os.getpid():
 			self.log.error("TabPooledChromium instances are not safe to share across multiple processes.")
@@ -149,12 +306,239 @@ class TabPooledChromium(object):
 				self.log.warning("Tab with key %s checked out more then once simultaneously", key)
 
 		try:
-			lock, tab = self.__tab_cache[key]
-			with lock:
-				yield tab
+			lock, tab = self.__get_tab(key)
+			try:
+				with lock:
+					yield tab
+			finally:
+				self.__release(lock)
 		finally:
 
 			with self.__counter_lock:
 				self.__active_tabs[key] -= 1
 				if self.__active_tabs[key] == 0:
 					self.__active_tabs.pop(key)
+
+
+class ShardedTabPooledChromium(object):
+
+	def __init__(self, *args, shards=None, ring_replicas=64, **kwargs):
+		'''
+		Create a tab pool spread over several chromium instances.
+
+		A single chromium instance (and its browser process) tops out well before a multi-core
+		machine does. This runs `shards` `TabPooledChromium` instances (one per CPU, by default),
+		and assigns each `tab()` key to one of them by consistent hashing, so a key always maps to
+		the same instance (and therefore the same warm tab).
+
+		If an instance dies, it is dropped from the hash ring, which moves only its keys onto the
+		remaining instances, and a replacement is started in the background. The replacement takes
+		over the same points on the ring, so the keys move back once it's up, and the keys of the
+		other instances never move. `recycle_shard()` does the same for a live instance.
+
+		`ring_replicas` is the number of points each instance gets on the hash ring. All other
+		parameters (including `tab_pool_max_size`, which is per instance) are forwarded through to
+		the `TabPooledChromium()` constructor.
+		'''
+		if shards is None:
+			shards = os.cpu_count() or 1
+		assert shards > 0, "shards must be a positive integer"
+		assert "dbg_port" not in kwargs, "Each chromium instance needs its own debug port, so dbg_port cannot be specified!"
+
+		self.args          = args
+		self.kwargs        = kwargs
+		self.shard_count   = shards
+		self.ring_replicas = ring_replicas
+		self.alive         = True
+
+		self.log = logging.getLogger("Main.ChromeController.ShardedTabPool")
+
+		self.__lock         = threading.Lock()
+		self.__boot_lock    = threading.Lock()
+		self.__shards       = {}
+		self.__ring         = []
+		self.__ring_keys    = []
+		self.__executor     = concurrent.futures.ThreadPoolExecutor(max_workers=shards)
+		self.__started_pid  = os.getpid()
+
+		# The instances are started in parallel, as each takes a few seconds.
+		try:
+			futures = [self.__executor.submit(self.__boot) for dummy_x in range(shards)]
+			for shard_id, future in enumerate(futures):
+				self.__add_shard(shard_id, future.result())
+		except Exception:
+			self.close()
+			raise
+
+	@staticmethod
+	def _hash(value):
+		return int(hashlib.md5(value.encode("utf-8")).hexdigest()[:16], 16)
+
+	def __boot(self):
+		self.log.debug("Starting chromium shard")
+		return TabPooledChromium(*self.args, **self.kwargs)
+
+	def __rebuild_ring(self):
+		# Called with the lock held.
+		ring = sorted((self._hash("%s-%s" % (shard_id, replica)), shard_id)
+				for shard_id in self.__shards
+				for replica in range(self.ring_replicas))
+		self.__ring      = [shard_id for dummy_point, shard_id in ring]
+		self.__ring_keys = [point for point, dummy_shard_id in ring]
+
+	def __add_shard(self, shard_id, shard):
+		with self.__lock:
+			# The slot may have been filled by a synchronous start (see `__shard_for()`).
+			if not self.alive or shard_id in self.__shards:
+				shard.close()
+				return
+			self.__shards[shard_id] = shard
+			self.__rebuild_ring()
+		self.log.info("Added chromium shard %s (%s active)", shard_id, len(self.__shards))
+
+	def __add_shard_background(self, shard_id):
+		try:
+			self.__add_shard(shard_id, self.__boot())
+		except Exception:
+			self.log.exception("Failed to start replacement chromium shard!")
+
+	def __remove_shard(self, shard_id):
+		with self.__lock:
+			shard = self.__shards.pop(shard_id, None)
+			if shard is None:
+				return False
+			self.__rebuild_ring()
+
+		self.log.info("Removed chromium shard %s (%s remaining)", shard_id, len(self.__shards))
+		try:
+			shard.close()
+		except Exception:
+			self.log.exception("Error closing chromium shard %s", shard_id)
+
+		if self.alive:
+			self.__executor.submit(self.__add_shard_background, shard_id)
+		return True
+
+	def __shard_for(self, key):
+		while 1:
+			with self.__lock:
+				if not self.alive:
+					raise cr_exceptions.ChromeControllerException("Chrome has been shut down! Cannot continue!")
+				if self.__ring:
+					idx = bisect.bisect(self.__ring_keys, self._hash(key)) % len(self.__ring)
+					shard_id = self.__ring[idx]
+					return shard_id, self.__shards[shard_id]
+
+			# Every shard is dead, and the replacements are still starting. Only one caller
+			# starts an instance, and the others wait for it (or for a replacement) to come up.
+			with self.__boot_lock:
+				with self.__lock:
+					if self.__ring or not self.alive:
+						continue
+				self.log.warning("No live chromium shards. Starting one synchronously.")
+				self.__add_shard(0, self.__boot())
+
+	@staticmethod
+	def _shard_alive(shard):
+		return shard.alive and not shard.chrome_interface.transport.process_monitor.exited.is_set()
+
+	def shard_ids(self):
+		'''
+		Return the ids of the live shards.
+		'''
+		with self.__lock:
+			return list(self.__shards.keys())
+
+	def shard_for(self, netloc=None, url=None, extra_id=None, use_tid=False):
+		'''
+		Return the id of the shard that `tab()` would use for the passed parameters.
+		'''
+		shard_id, dummy_shard = self.__shard_for(_pool_key(netloc, url, extra_id, use_tid))
+		return shard_id
+
+	def check_shards(self):
+		'''
+		Replace any shards whose chromium instance has died.
+
+		Return value is the number of shards replaced.
+		'''
+		with self.__lock:
+			dead = [shard_id for shard_id, shard in self.__shards.items() if not self._shard_alive(shard)]
+		for shard_id in dead:
+			self.log.warning("Chromium shard %s has died. Replacing.", shard_id)
+			self.__remove_shard(shard_id)
+		return len(dead)
+
+	def recycle_shard(self, shard_id):
+		'''
+		Shut down shard `shard_id`, and replace it with a new chromium instance. Its keys are
+		spread over the other shards until the replacement has started.
+
+		Tabs checked out from the shard become invalid.
+		'''
+		return self.__remove_shard(shard_id)
+
+	def active_tabs(self):
+		'''
+		Return the number of currently active tabs, across all shards.
+		'''
+		with self.__lock:
+			shards = list(self.__shards.values())
+		return sum(shard.active_tabs() for shard in shards)
+
+	def close_tabs(self):
+		'''
+		Close all open tabs (but the management tabs) in every shard.
+		'''
+		with self.__lock:
+			shards = list(self.__shards.values())
+		for shard in shards:
+			shard.close_tabs()
+
+	@contextlib.contextmanager
+	def tab(self, netloc=None, url=None, extra_id=None, use_tid=False):
+		'''
+		Get a chromium tab from the shard the pool key maps to. Parameters are as for
+		`TabPooledChromium.tab()`.
+
+		If the shard's chromium instance turns out to have died, it is replaced (and the
+		error is re-raised).
+		'''
+		assert self.alive, "Chrome has been shut down! Cannot continue!"
+		if self.__started_pid != os.getpid():
+			raise RuntimeError("ShardedTabPooledChromium instances are not safe to share across multiple processes.")
+
+		key = _pool_key(netloc, url, extra_id, use_tid)
+		shard_id, shard = self.__shard_for(key)
+
+		try:
+			with shard.tab(netloc=key) as tab:
+				yield tab
+		except (cr_exceptions.ChromeCommunicationsError, cr_exceptions.ChromeError):
+			if not self._shard_alive(shard):
+				self.log.warning("Chromium shard %s has died. Replacing.", shard_id)
+				self.__remove_shard(shard_id)
+			raise
+
+	def close(self):
+		if not self.alive:
+			return
+
+		with self.__lock:
+			self.alive = False
+			shards = list(self.__shards.values())
+			self.__shards = {}
+			self.__rebuild_ring()
+
+		self.__executor.shutdown(wait=True)
+		for shard in shards:
+			try:
+				shard.close()
+			except Exception:
+				self.log.exception("Error closing chromium shard")
+
+	def __del__(self):
+		try:
+			self.close()
+		except Exception:
+			pass
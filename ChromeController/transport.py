@@ -5,26 +5,349 @@
 
 """
 import os
-import json
 import sys
+import uuid
 import socket
+import select
 import time
 import pprint
+import reprlib
 import logging
 import os.path
 import requests
 import traceback
 import signal
 import websocket
+import weakref
+import threading
 import subprocess
+import collections
 import distutils.spawn
+import concurrent.futures
 from . import cr_exceptions
+from . import filter_funcs
+from .message_store import MessageStore
+from .json_codec import get_codec
+from .json_codec import LazyMessage
+from .json_codec import EVENT_PREFIX
 
 if 'win' in sys.platform:
 	import win32con
 	import win32api
 
 ACTIVE_PORTS = set()
+# Chromium instances can be started from several threads at once (see `ChromiumProcessPool`).
+ACTIVE_PORTS_LOCK = threading.Lock()
+
+def _peek_method(frame):
+	'''
+	Extract the method name from a raw event frame without decoding it.
+
+	Chromium serializes the `method` key first for events, so this only has to look
+	at the start of the frame. Returns None for anything else (including command responses),
+	in which case the frame has to be decoded to find out what it is.
+	'''
+	if not isinstance(frame, str) or not frame.startswith(EVENT_PREFIX):
+		return None
+	end = frame.find('"', len(EVENT_PREFIX))
+	if end < 0:
+		return None
+	return frame[len(EVENT_PREFIX):end]
+
+SESSION_KEY = ',"sessionId":"'
+
+def _peek_session(frame):
+	'''
+	Extract the flattened target session id from a raw frame without decoding it.
+
+	Chromium appends the `sessionId` key to the end of each frame sent on behalf of an
+	attached session. A nested `sessionId` can't be mistaken for it, as the frame would
+	then end with the closing brace of the nested object. Returns None if there is no
+	top-level `sessionId` at the end of the frame.
+	'''
+	if not isinstance(frame, str) or not frame.endswith('"}'):
+		return None
+	start = frame.rfind(SESSION_KEY, max(len(frame) - 128, 0))
+	if start < 0:
+		return None
+	return frame[start + len(SESSION_KEY):-2]
+
+
+class _SocketReader(threading.Thread):
+	'''
+	Background reader for a single websocket connection.
+
+	Every raw frame received from the socket is handed to `on_frame`. If the
+	socket fails (or is closed out from under the reader), `on_error` is called with
+	the exception, and the thread exits.
+	'''
+
+	def __init__(self, name, sock, on_frame, on_error):
+		super().__init__(name=name, daemon=True)
+		self.sock     = sock
+		self.on_frame = on_frame
+		self.on_error = on_error
+		self.running  = True
+
+	def run(self):
+		while self.running:
+			try:
+				tmp = self.sock.recv()
+			except (socket.timeout, websocket.WebSocketTimeoutException):
+				continue
+			except Exception as e:
+				if self.running:
+					self.on_error(e)
+				return
+
+			# The websocket library returns an empty frame when the
+			# connection is closed from the other end.
+			if not tmp:
+				if self.running:
+					self.on_error(websocket.WebSocketConnectionClosedException("Socket closed by remote"))
+				return
+
+			self.on_frame(tmp)
+
+	def stop(self):
+		self.running = False
+		try:
+			self.sock.close()
+		except Exception:
+			pass
+
+		if threading.current_thread() is not self:
+			self.join(timeout=1)
+
+
+class _PipeConnection(object):
+	'''
+	Connection to chromium's `--remote-debugging-pipe` endpoint.
+
+	Chromium reads commands from the pipe on its file descriptor 3, and writes responses
+	and events to the pipe on its file descriptor 4. Each message is a JSON document
+	terminated by a NUL byte.
+
+	This has the same interface (and raises the same exceptions) as the subset of
+	`websocket.WebSocket` used by the transport, so it can stand in for the browser websocket.
+
+	`close()` can be called while another thread is blocked in `recv()`. It wakes the reader
+	through a self-pipe, and only closes the file descriptors once the reader is out of
+	`recv()`, so a reader can never end up reading a descriptor number that has been reused.
+	'''
+
+	def __init__(self, read_fd, write_fd, timeout=None):
+		self.read_fd    = read_fd
+		self.write_fd   = write_fd
+		self.timeout    = timeout
+		self.connected  = True
+		self.closed     = False
+		self.frames     = collections.deque()
+		self.partial    = b''
+		self.send_lock  = threading.Lock()
+		self.recv_lock  = threading.Lock()
+		self.close_lock = threading.Lock()
+
+		self.wake_read, self.wake_write = os.pipe()
+
+	def settimeout(self, timeout):
+		self.timeout = timeout
+
+	def send(self, frame):
+		data = frame.encode("utf-8") + b'\0'
+		with self.send_lock:
+			if self.closed:
+				raise websocket.WebSocketConnectionClosedException("Debugging pipe closed")
+			try:
+				while data:
+					data = data[os.write(self.write_fd, data):]
+			except OSError as e:
+				self.connected = False
+				raise websocket.WebSocketConnectionClosedException("Debugging pipe closed (%s)" % (e, ))
+
+	def recv(self):
+		'''
+		Return the next message received from chromium, as a `str`.
+
+		Raises `socket.timeout` if nothing is received within the timeout.
+		'''
+		with self.recv_lock:
+			return self.__recv()
+
+	def __recv(self):
+		timeout_at = time.time() + self.timeout if self.timeout is not None else None
+		while not self.frames:
+			if self.closed or not self.connected:
+				raise websocket.WebSocketConnectionClosedException("Debugging pipe closed")
+
+			wait = None
+			if timeout_at is not None:
+				wait = timeout_at - time.time()
+				if wait <= 0:
+					raise socket.timeout("Timed out reading from the debugging pipe")
+
+			try:
+				readable, dummy_w, dummy_x = select.select([self.read_fd, self.wake_read], [], [], wait)
+				if self.wake_read in readable:
+					# Woken up by `close()`.
+					continue
+				if not readable:
+					continue
+				chunk = os.read(self.read_fd, 1024 * 1024)
+			except (OSError, ValueError) as e:
+				self.connected = False
+				raise websocket.WebSocketConnectionClosedException("Debugging pipe closed (%s)" % (e, ))
+
+			if not chunk:
+				self.connected = False
+				raise websocket.WebSocketConnectionClosedException("Debugging pipe closed by remote")
+
+			*frames, self.partial = (self.partial + chunk).split(b'\0')
+			self.frames.extend(frames)
+
+		return self.frames.popleft().decode("utf-8")
+
+	def close(self):
+		with self.close_lock:
+			if self.closed:
+				return
+			self.closed = True
+		self.connected = False
+
+		# Wake up any reader blocked in `select()`, and wait for it to leave `recv()`
+		# (and any writer to finish) before the descriptors are released.
+		os.write(self.wake_write, b'\0')
+		with self.recv_lock, self.send_lock:
+			for fd in (self.write_fd, self.read_fd, self.wake_read, self.wake_write):
+				try:
+					os.close(fd)
+				except OSError:
+					pass
+
+
+def _pipe_preexec(preexec_fn, cmd_read, resp_write):
+	'''
+	Wrap `preexec_fn` to also move the debugging pipe ends to file descriptors 3 and 4 in
+	the chromium process. The ends are first duplicated above 4, so they can't be clobbered
+	by each other when being moved into place, and the duplicates are closed again afterwards.
+
+	Any other inherited descriptors are closed by `subprocess` after this runs, as long as
+	3 and 4 are passed as `pass_fds`.
+	'''
+	def move_pipe_fds():
+		import fcntl
+		if preexec_fn:
+			preexec_fn()
+		cmd_read_tmp   = fcntl.fcntl(cmd_read,   fcntl.F_DUPFD, 5)
+		resp_write_tmp = fcntl.fcntl(resp_write, fcntl.F_DUPFD, 5)
+		os.dup2(cmd_read_tmp,   3)
+		os.dup2(resp_write_tmp, 4)
+		os.close(cmd_read_tmp)
+		os.close(resp_write_tmp)
+	return move_pipe_fds
+
+
+# Bounded repr for logging commands and responses, so a multi-megabyte response
+# body or screenshot doesn't get stringified in its entirety.
+_short_repr = reprlib.Repr()
+_short_repr.maxstring = 200
+_short_repr.maxother  = 200
+_short_repr = _short_repr.repr
+
+
+def _release_chromium(cr_proc, pipe, http=None, port=None):
+	'''
+	Release the resources a `ChromeExecutionManager` holds outside of python: the chromium
+	process, the debugging pipe, and (if passed) the HTTP session and the debug port reservation.
+
+	This is the last step of `close_chromium()`, and is also run by the manager's finalizer if
+	it's garbage collected (or the interpreter exits) without being closed. It must not
+	reference the manager itself, or the finalizer would keep the manager alive.
+	'''
+	if cr_proc is not None and cr_proc.poll() is None:
+		cr_proc.kill()
+		try:
+			cr_proc.wait(timeout=5)
+		except subprocess.TimeoutExpired:
+			pass
+	if pipe is not None:
+		pipe.close()
+	if http is not None:
+		http.close()
+	ACTIVE_PORTS.discard(port)
+
+
+def _weak_callback(method, *args):
+	'''
+	Wrap the bound method `method` in a callback which doesn't keep its instance alive.
+
+	The callback calls `method(*args, message)`, or does nothing once the instance is gone.
+	'''
+	ref = weakref.WeakMethod(method)
+	def callback(message):
+		func = ref()
+		if func is not None:
+			func(*args, message)
+	return callback
+
+
+DEVTOOLS_LISTENING = "DevTools listening on "
+
+class _OutputReader(threading.Thread):
+	'''
+	Drains the (combined stdout and stderr) output of a chromium process.
+
+	Chromium announces its DevTools endpoint with a `DevTools listening on <url>` line
+	once the debug port is open, at which point `listening` is set. It's also set if the
+	output is closed (i.e. chromium exited) without the line ever showing up, so nothing
+	waits on it forever. The last `keep` lines of output are retained, for error reporting.
+
+	Draining the pipe also stops chromium from blocking on a full pipe buffer.
+	'''
+
+	def __init__(self, stream, keep=200):
+		super().__init__(name="ChromeController output reader", daemon=True)
+		self.stream       = stream
+		self.lines        = collections.deque(maxlen=keep)
+		self.listening    = threading.Event()
+		self.devtools_url = None
+
+	def run(self):
+		try:
+			for line in iter(self.stream.readline, b''):
+				line = line.decode("utf-8", "replace").rstrip()
+				self.lines.append(line)
+				if line.startswith(DEVTOOLS_LISTENING):
+					self.devtools_url = line[len(DEVTOOLS_LISTENING):].strip()
+					self.listening.set()
+		except (ValueError, OSError):
+			# The pipe was closed out from under us.
+			pass
+		finally:
+			self.listening.set()
+
+	def output(self):
+		return "\n".join(self.lines)
+
+
+class _ProcessMonitor(threading.Thread):
+	'''
+	Waits on a chromium process in the background, and sets `exited` once it has exited.
+
+	This lets the liveness checks on the command path test a flag, rather than
+	making a `waitpid()` syscall for every command.
+	'''
+
+	def __init__(self, proc):
+		super().__init__(name="ChromeController process monitor", daemon=True)
+		self.proc   = proc
+		self.exited = threading.Event()
+
+	def run(self):
+		try:
+			self.proc.wait()
+		finally:
+			self.exited.set()
 
 
 class ChromeExecutionManager():
@@ -43,6 +366,17 @@ class ChromeExecutionManager():
 			enable_gpu         = False,
 			headless           = False,
 			additional_options = [],
+			use_reader_thread  = False,
+			event_buffer_size  = None,
+			event_drop_policy  = "oldest",
+			filter_events      = False,
+			json_codec         = "auto",
+			lazy_decode        = False,
+			flatten_sessions   = False,
+			http_timeout       = 5,
+			startup_timeout    = 20,
+			debug_pipe         = False,
+			wire_trace         = None,
 			):
 		"""
 
@@ -56,19 +390,77 @@ class ChromeExecutionManager():
 
 		base_tab_key is any hashable python object that is used for multi-tab interfacing.
 
+		If `use_reader_thread` is true, each tab websocket gets a background reader thread which
+		decodes incoming frames as they arrive, and routes command responses directly to the
+		caller waiting on them, rather than the caller polling the socket.
+
+		Events that nothing is waiting for are buffered per tab. If `event_buffer_size` is
+		not None, each tab retains at most that many events, and evicts events according to
+		`event_drop_policy` (see `MessageStore`) once it's full. The buffer accounting is
+		available from `buffer_stats()`.
+
+		If `filter_events` is true, events are discarded (before being decoded, where possible)
+		unless something is subscribed to them (see `subscribe()` and `on()`), or is currently
+		waiting for them.
+
+		`json_codec` selects the codec used to encode and decode frames (see `json_codec.get_codec()`).
+		By default, orjson or ujson is used if installed, with a fallback to the stdlib `json` module.
+
+		If `lazy_decode` is true, events are returned as `LazyMessage` instances, which only
+		decode the frame once something other than the event `method` (or one of the leading
+		parameters, such as `requestId` or `frameId`) is accessed. Events that are buffered,
+		evicted, or rejected by the filters in `filter_funcs` without their payload being
+		looked at are therefore never decoded.
+
+		Tabs are created and closed with `Target` domain commands, sent over a websocket
+		connected to the browser endpoint. If `flatten_sessions` is true, that websocket is
+		also used for the tabs themselves, rather than opening one per tab. Each tab is then a
+		flattened `Target` session multiplexed over the browser socket, and received frames
+		are routed to their tab by `sessionId`.
+
+		The remaining calls to the DevTools HTTP endpoints (`/json`, `/json/version`) go through
+		a persistent `requests.Session`, so the connection is reused, and time out after
+		`http_timeout` seconds.
+
+		Startup waits for chromium to announce that its DevTools endpoint is listening,
+		for up to `startup_timeout` seconds, rather than polling the endpoint on a fixed interval.
+
+		The transport is safe to use from several threads at once, as long as each thread
+		uses its own tab. Command ids are allocated atomically, only one thread reads or writes a
+		socket at a time, and connecting or closing tabs is serialized.
+
+		If `debug_pipe` is true, chromium is launched with `--remote-debugging-pipe` rather than
+		a debug port, and the transport talks to it over a pair of pipes instead of websockets.
+		There is then no TCP or HTTP involved at all, and no debug port has to be allocated.
+		The pipe is a browser-level connection, so this implies `flatten_sessions`. It is not
+		supported on windows.
+
+		If `wire_trace` is not None, it's called as `wire_trace(direction, tab_key, frame)` with
+		every raw frame sent ("send") or received ("recv"). See `wire_trace.WireTrace` for a
+		sink that records the frames, truncated to a maximum size.
+
+		The manager can be used as a context manager, which closes all the tabs and shuts
+		down chromium on exit (see `close_all()`).
+
 		"""
 
-		if port is None:
-			port = 9222 + (os.getpid() & 0x3FFF)
-			if port > 65530:
-				port -= 5000
-			while port in ACTIVE_PORTS:
-				port += 1
+		if debug_pipe:
+			assert port is None, "A debug port cannot be used with debug_pipe!"
+			assert not sys.platform.startswith("win"), "debug_pipe is not supported on windows!"
+			flatten_sessions = True
+		else:
+			with ACTIVE_PORTS_LOCK:
+				if port is None:
+					port = 9222 + (os.getpid() & 0x3FFF)
+					if port > 65530:
+						port -= 5000
+					while port in ACTIVE_PORTS:
+						port += 1
 
-		if port in ACTIVE_PORTS:
-			raise cr_exceptions.ReusedPortError("Attempting to start chromium using a already-in-use debug port (%s, %s)!" % (port, ACTIVE_PORTS))
+				if port in ACTIVE_PORTS:
+					raise cr_exceptions.ReusedPortError("Attempting to start chromium using a already-in-use debug port (%s, %s)!" % (port, ACTIVE_PORTS))
 
-		ACTIVE_PORTS.add(port)
+				ACTIVE_PORTS.add(port)
 
 		self.binary             = binary
 		self.host               = host
@@ -78,11 +470,55 @@ class ChromeExecutionManager():
 		self.msg_id             = 0
 		self.websocket_timeout  = websocket_timeout
 		self.additional_options = additional_options
+		self.use_reader_thread  = use_reader_thread
+		self.event_buffer_size  = event_buffer_size
+		self.event_drop_policy  = event_drop_policy
+		self.filter_events      = filter_events
+		self.codec              = get_codec(json_codec)
+		self.lazy_decode        = lazy_decode
+		self.flatten_sessions   = flatten_sessions
+		self.http_timeout       = http_timeout
+		self.http               = requests.Session()
+		self.startup_timeout    = startup_timeout
+		self.debug_pipe         = debug_pipe
+		self.wire_trace         = wire_trace
+		self.pipe               = None
 
 		self.tablist = None
 		self.soclist = {}
 		self.tab_id_map = {}
 
+		# Index of the browser's targets, keyed by target id. The entries are in the same
+		# format as the `/json` listing (see `_target_meta()`).
+		self.targets = {}
+
+		# Browser contexts of the tabs created in a separate (isolated) context, keyed by tab
+		# key. See `create_browser_context()`.
+		self.tab_contexts = {}
+
+		# State for the flattened session mode. `browser_key` is the key for the browser
+		# connection itself, and `sessions` maps tab keys to their target session id.
+		self.browser_key  = uuid.uuid4()
+		self.sessions     = {}
+		self.session_tabs = {}
+
+		# State for the threaded reader mode.
+		# `_pending` maps outstanding command IDs to a (tab_key, future) tuple.
+		self.readers        = {}
+		self.reader_errors  = {}
+		self._pending       = {}
+		self._pending_lock  = threading.Lock()
+
+		# Locking for concurrent use from multiple threads. Each socket has a send lock and a
+		# receive lock (see `_socket_locks()`), and connecting and closing tabs is serialized by
+		# `_connect_lock`. Everything else is either a single dict operation, or has its own lock.
+		self.socket_locks     = {}
+		self._msg_id_lock     = threading.Lock()
+		self._connect_lock    = threading.RLock()
+		self._targets_lock    = threading.Lock()
+
+		self.messages = {}
+
 		self.log = logging.getLogger("Main.ChromeController.ExecutionManager")
 
 
@@ -91,19 +527,153 @@ class ChromeExecutionManager():
 		# We retry starting chromium a few times, because it's either brittle
 		# or sometimes takes more then 10 seconds to start.
 		# Not sure which.
-		for x in range(999):
-			try:
-				self._launch_process(self.binary, self.port, base_tab_key, additional_options)
-				break
-			except cr_exceptions.ChromeConnectFailure:
-				if x > 3:
-					raise
+		self.cr_proc = None
+		try:
+			for x in range(999):
+				try:
+					self._launch_process(self.binary, self.port, base_tab_key, additional_options)
+					break
+				except cr_exceptions.ChromeConnectFailure:
+					# Don't leave the failed instance running.
+					_release_chromium(self.cr_proc, self.pipe)
+					if x > 3:
+						raise
+		except Exception:
+			_release_chromium(self.cr_proc, self.pipe, self.http, self.port)
+			raise
+
+		# Tears down chromium if the manager is dropped without being closed, so the process
+		# and the debug port don't outlive it until the next full garbage collection.
+		self._finalizer = weakref.finalize(self, _release_chromium, self.cr_proc, self.pipe, self.http, self.port)
 
 		# self.log.info("Connecting to %s:%s", self.host, self.port)
 		# self.connect(base_tab_key)
 
+	def _new_message_store(self, tab_key=None):
+		# Nothing consumes browser-level events unless it asks for them, so they're always filtered.
+		filter_events = self.filter_events or tab_key == self.browser_key
+		return MessageStore(capacity=self.event_buffer_size, drop_policy=self.event_drop_policy, filter_events=filter_events)
+
+	def __get_message_store(self, tab_key):
+		store = self.messages.get(tab_key)
+		if store is None:
+			# setdefault(), so threads racing to create the store all get the same one.
+			store = self.messages.setdefault(tab_key, self._new_message_store(tab_key))
+		return store
+
+	def _next_msg_id(self):
+		with self._msg_id_lock:
+			sent_id = self.msg_id
+			self.msg_id += 1
+		return sent_id
 
-		self.messages = {}
+	def _shares_socket(self, tab_key):
+		'''
+		Return true if tab `tab_key` talks over a socket shared with other tabs (i.e. the browser socket).
+		'''
+		return self.flatten_sessions and (tab_key in self.sessions or tab_key == self.browser_key)
+
+	def _socket_locks(self, tab_key):
+		'''
+		Return the `(send_lock, recv_lock)` 2-tuple for the socket tab `tab_key` talks over.
+
+		Flattened sessions all share the browser socket, and therefore its locks.
+		'''
+		if tab_key in self.sessions:
+			tab_key = self.browser_key
+		locks = self.socket_locks.get(tab_key)
+		if locks is None:
+			locks = self.socket_locks.setdefault(tab_key, (threading.Lock(), threading.Lock()))
+		return locks
+
+	def subscribe(self, tab_key, methods):
+		'''
+		Keep the events with a method in `methods` for tab `tab_key`, so they can be
+		retrieved with `recv_filtered()` later, even if nothing is waiting on them when
+		they arrive. This is only needed if the transport was created with `filter_events=True`.
+
+		Returns a `Subscription`, which can be closed (or used as a context manager)
+		to remove the subscription.
+		'''
+		return self.__get_message_store(tab_key).subscribe(methods)
+
+	def on(self, tab_key, method, callback):
+		'''
+		Call `callback(message)` for every event with method `method` received by tab `tab_key`.
+
+		In threaded mode, the callback is called from the reader thread. Otherwise, it
+		is called from whatever call happens to be reading the socket when the event
+		is received. Callbacks therefore shouldn't block, or call into the transport.
+
+		Returns a `Subscription`, which can be closed to remove the callback.
+		'''
+		return self.__get_message_store(tab_key).add_callback(method, callback)
+
+	def _decode_frame(self, tab_key, frame, keycheck=None):
+		'''
+		Decode a raw frame received from tab `tab_key`.
+
+		Returns None if the frame is an event that the tab's message store (and
+		`keycheck`, if passed) has no use for. If `tab_key` is None, the frame is
+		always decoded.
+		'''
+		method = _peek_method(frame)
+		if method is not None and method != "Runtime.consoleAPICalled" and tab_key is not None:
+			methods = getattr(keycheck, 'methods', None)
+			if keycheck is None or (methods is not None and method not in methods):
+				if not self.messages[tab_key].admit(method):
+					return None
+
+		if method is not None and self.lazy_decode:
+			return LazyMessage.from_event(frame, self.codec.loads, method)
+
+		return self.codec.loads(frame)
+
+	def _route_frame(self, tab_key, frame, keycheck=None):
+		'''
+		Decode a raw frame received on the socket for tab `tab_key`, and work out which
+		tab it belongs to.
+
+		Return value is a 2-tuple of `(owner, message)`. Without flattened sessions, `owner`
+		is always `tab_key`. Otherwise, it's the tab with the frame's `sessionId`, or
+		`browser_key` for frames without one. `message` is None if the frame was discarded.
+		'''
+		if self.wire_trace is not None:
+			self.wire_trace("recv", tab_key, frame)
+
+		if not self.flatten_sessions:
+			return tab_key, self._decode_frame(tab_key, frame, keycheck)
+
+		session_id = _peek_session(frame)
+		if session_id is not None and session_id in self.session_tabs:
+			owner = self.session_tabs[session_id]
+			return owner, self._decode_frame(owner, frame, keycheck if owner == tab_key else None)
+
+		message = self._decode_frame(None, frame)
+		if 'sessionId' not in message:
+			return self.browser_key, message
+
+		owner = self.session_tabs.get(message['sessionId'])
+		if owner is None:
+			# Stragglers for a session that has since been closed.
+			self.log.debug("Discarding message for unknown session %s", message['sessionId'])
+			return None, None
+		return owner, message
+
+	def _dispatch_frame(self, tab_key, frame):
+		owner, message = self._route_frame(tab_key, frame)
+		if message is not None:
+			self._dispatch(owner, message)
+
+	def buffer_stats(self, tab_key=None):
+		'''
+		Return the event buffer accounting (see `MessageStore.stats()`) for the tab
+		`tab_key`, or a dict of the accounting for every tab, keyed by tab key, if
+		`tab_key` is None.
+		'''
+		if tab_key is not None:
+			return self.messages[tab_key].stats()
+		return {key : store.stats() for key, store in list(self.messages.items())}
 
 	def _launch_process(self, binary, dbg_port, base_tab_key, additional_options):
 
@@ -118,7 +688,7 @@ class ChromeExecutionManager():
 
 		argv = [
 				binary,
-				'--remote-debugging-port={dbg_port}'.format(dbg_port=dbg_port),
+				'--remote-debugging-pipe' if self.debug_pipe else '--remote-debugging-port={dbg_port}'.format(dbg_port=dbg_port),
 				'--enable-features=NetworkService',
 			]
 		if self.headless:
@@ -140,29 +710,67 @@ class ChromeExecutionManager():
 			from . import exit_handler
 			preexec_fn = exit_handler.on_parent_exit('SIGTERM')
 
+		if self.debug_pipe:
+			# Chromium reads commands from fd 3, and writes to fd 4.
+			cmd_read, cmd_write   = os.pipe()
+			resp_read, resp_write = os.pipe()
+			preexec_fn = _pipe_preexec(preexec_fn, cmd_read, resp_write)
+
 		self.cr_proc = subprocess.Popen(argv,
 										stdin         = open(os.path.devnull, "r"),
 										stdout        = subprocess.PIPE,
-										stderr        = subprocess.PIPE,
+										stderr        = subprocess.STDOUT,
 										creationflags = creationflags,
 										preexec_fn    = preexec_fn,
+										# The pipe fds are moved into place by `preexec_fn`, which
+										# runs before everything else is closed.
+										close_fds     = True,
+										pass_fds      = (3, 4) if self.debug_pipe else (),
 									)
 
 		self.log.debug("Spawned process: %s, PID: %s", self.cr_proc, self.cr_proc.pid)
-		for x in range(100):
+
+		self.output_reader = _OutputReader(self.cr_proc.stdout)
+		self.output_reader.start()
+		self.process_monitor = _ProcessMonitor(self.cr_proc)
+		self.process_monitor.start()
+
+		if self.debug_pipe:
+			os.close(cmd_read)
+			os.close(resp_write)
+			self.pipe = _PipeConnection(resp_read, cmd_write, self.websocket_timeout)
+			self.__start_pipe()
+			return
+
+		timeout_at = time.time() + self.startup_timeout
+		if not self.output_reader.listening.wait(timeout=self.startup_timeout):
+			self.log.warning("Chromium did not announce its DevTools endpoint within %s seconds.", self.startup_timeout)
+		elif self.output_reader.devtools_url:
+			self.log.debug("Chromium DevTools endpoint listening at %s", self.output_reader.devtools_url)
+
+		# The endpoint should be up by now, but fall back to polling it
+		# (with a short backoff) in case the announcement was missed.
+		delay = 0.05
+		while 1:
 			try:
 				self.tablist = self.fetch_tablist()
 
 				if not self.tablist:
 					raise cr_exceptions.ChromeStartupException("No tabs in started chromium?")
 
+				self.targets = {tab['id'] : tab for tab in self.tablist}
+
 				# self.tab_id_map[base_tab_key] = self.tablist[0]['id']
 				# print("Tab base key:", base_tab_key, self.tablist[0]['id'])
 				return
 			except cr_exceptions.ChromeConnectFailure as e:
-				if x > 8:
+				if self.process_monitor.exited.is_set() or time.time() > timeout_at:
+					self.log.error("Chromium failed to start. Output:")
+					for line in self.output_reader.output().split("\n"):
+						self.log.error("	%s", line)
 					raise e
-				time.sleep(2)
+				time.sleep(delay)
+				delay = min(delay * 2, 1)
 
 	def __close_internal_linux(self):
 		self.log.debug("Sending sigint to chromium")
@@ -248,7 +856,9 @@ class ChromeExecutionManager():
 		after the remote chromium instance is shut down will have unknown effects.
 
 		Note that if you are rapidly creating and destroying ChromeController instances,
-		you may need to *explicitly* call this before destruction.
+		you should *explicitly* call this (or `close_all()`, or use the manager as a context
+		manager) rather than relying on the finalizer, which only runs once the manager
+		has been garbage collected.
 		'''
 		if self.cr_proc:
 			try:
@@ -260,43 +870,43 @@ class ChromeExecutionManager():
 				for line in traceback.format_exc().split("\n"):
 					self.log.error(line)
 
-
-
-		ACTIVE_PORTS.discard(self.port)
+		self._finalizer()
 
 
 	def check_process_ded(self):
-		self.cr_proc.poll()
-		if self.cr_proc.returncode != None:
-			try:
-				stdout, stderr = self.cr_proc.communicate()
-				raise cr_exceptions.ChromeDiedError("Chromium process died unexpectedly! Don't know "
-					"how to continue!\n	Chromium stdout: {}\n	Chromium stderr: {}".format(stdout.decode("utf-8"), stderr.decode("utf-8")))
-			except ValueError:
-				# The communcation pipes can go away if the process has exited.
-				# If so, ignore the resulting error.
-				raise cr_exceptions.ChromeDiedError("Chromium process died unexpectedly! Don't know how to continue!")
-
-	def _get_tab_idx_for_key(self, tab_key):
-
-		if tab_key not in self.tab_id_map:
-			return None
+		'''
+		Raise a `ChromeDiedError` (with chromium's output) if the chromium process has exited.
 
-		cr_tab_id = self.tab_id_map[tab_key]['id']
+		This only checks a flag set by the process monitor thread, so it's cheap enough to
+		call on every command.
+		'''
+		if self.process_monitor.exited.is_set():
+			# The process has exited, so the output reader will hit EOF shortly.
+			self.output_reader.join(timeout=1)
+			raise cr_exceptions.ChromeDiedError("Chromium process died unexpectedly! Don't know "
+				"how to continue!\n	Chromium output: {}".format(self.output_reader.output()))
 
-		for idx, tab_dat in enumerate(self.tablist):
-			if tab_dat['id'] == cr_tab_id:
-				return idx
+	def __start_pipe(self):
+		'''
+		Fetch the initial target listing over the debugging pipe. Unlike the debug port, commands
+		written to the pipe wait there until chromium is ready for them, so there's nothing to poll.
+		'''
+		try:
+			self.tablist = self.fetch_tablist()
+		except (cr_exceptions.ChromeCommunicationsError, cr_exceptions.ChromeResponseNotReceived) as e:
+			self.log.error("Chromium failed to start. Output:")
+			for line in self.output_reader.output().split("\n"):
+				self.log.error("	%s", line)
+			self.close_websockets()
+			self.messages.pop(self.browser_key, None)
+			self.reader_errors.pop(self.browser_key, None)
+			self.cr_proc.kill()
+			raise cr_exceptions.ChromeConnectFailure("Failed to talk to chromium over the debugging pipe (%s)" % (e, ))
 
-		self.log.error("Missing tab %s from tab list!", tab_key)
-		self.log.error("Corresponding cr tab id: %s!", cr_tab_id)
-		for tab_key, cr_tab_id in self.tab_id_map.items():
-			self.log.error("Tab pair %s -> %s", tab_key, cr_tab_id['id'])
-		self.log.error("Chromium tabs (%s):", len(self.tablist))
-		for tab in self.tablist:
-			self.log.error("	cr tab id: %s", tab['id'])
+		if not self.tablist:
+			raise cr_exceptions.ChromeStartupException("No tabs in started chromium?")
 
-		raise cr_exceptions.ChromeTabNotFoundError("Tab with ID %s (cr ID: %s) not found!" % (tab_key, cr_tab_id['id']))
+		self.targets = {tab['id'] : tab for tab in self.tablist}
 
 	def _get_cr_tab_meta_for_key(self, tab_key):
 		if tab_key not in self.tab_id_map:
@@ -310,20 +920,43 @@ class ChromeExecutionManager():
 		self.host and self.port.  Each tab has it's own websocket
 		endpoint.
 
+		With flattened sessions, the tab is instead attached as a session
+		on the (shared) browser websocket.
+
+		The browser websocket is connected first, if it isn't already, as
+		tabs are created and closed with `Target` commands sent over it.
+
+		This is safe to call from several threads at once. Only one connection is made,
+		and the other callers return once it's up.
+
 		"""
 
-		assert self.tablist is not None
+		with self._connect_lock:
+			sock = self.soclist.get(tab_key)
+			if sock is not None and sock.connected is True:
+				return
+			self.__connect(tab_key)
 
-		tab_idx = self._get_tab_idx_for_key(tab_key)
+	def __connect(self, tab_key):
+		if self.browser_key not in self.soclist:
+			self.__connect_to_browser()
+		if tab_key == self.browser_key:
+			return
 
-		if not self.tablist:
-			self.tablist = self.fetch_tablist()
+		if self.flatten_sessions:
+			self.__connect_session(tab_key)
+			return
+
+		assert self.tablist is not None
+
+		cr_tab_meta = self._get_cr_tab_meta_for_key(tab_key)
+		if cr_tab_meta is not None and cr_tab_meta['id'] not in self.targets:
+			raise cr_exceptions.ChromeTabNotFoundError("Tab with ID %s (cr ID: %s) not found!" % (tab_key, cr_tab_meta['id']))
 
 		for fails in range(9999):
 			try:
-				# If we're one past the end of the tablist, we need to create a new tab
-				if tab_idx is None:
-					self.log.debug("Creating new tab (%s active)", len(self.tablist))
+				if tab_key not in self.tab_id_map:
+					self.log.debug("Creating new tab (%s active)", len(self.tab_id_map))
 					self.__create_new_tab(tab_key)
 
 				self.__connect_to_tab(tab_key)
@@ -333,8 +966,7 @@ class ChromeExecutionManager():
 				if fails > 6:
 					self.log.error("Failed to fetch tab websocket URL after %s retries. Aborting!", fails)
 					raise e
-				self.log.info("Tab may not have started yet (%s tabs active). Recreating.", len(self.tablist))
-				# self.log.info("Tag: %s", self.tablist[tab_idx])
+				self.log.info("Tab may not have started yet (%s tabs active). Recreating.", len(self.tab_id_map))
 
 
 				# For reasons I don't understand, sometimes a new tab doesn't get a websocket
@@ -347,29 +979,82 @@ class ChromeExecutionManager():
 		return "<ChromeExecutionManager for tabs \n%s\n>" % pprint.pformat(self.tab_id_map)
 
 	def pprint_tablist(self):
-		self.log.info("Tablist type: %s", type(self.tablist))
-		for line in pprint.pformat(list(enumerate(self.tablist))).split("\n"):
+		self.log.info("Targets (%s):", len(self.targets))
+		for line in pprint.pformat(list(self.targets.values())).split("\n"):
 			self.log.info("	%s", line)
 
-	def __create_new_tab(self, tab_key, start_at_url=None):
-		url = "http://%s:%s/json/new" % (self.host, self.port)
-		if start_at_url:
-			url += "?%s" % (start_at_url, )
-		try:
-			requests.get(url)
-			self.tablist = self.fetch_tablist()
-			known_tabs = list(self.tab_id_map.values())
-			for tab in self.tablist:
+	def _target_meta(self, target_info):
+		'''
+		Convert a `Target.TargetInfo` into the format of the entries returned by the `/json` endpoint.
 
-				# Glom onto the first tab in the tablist that's not known.
-				if tab['id'] not in [tmp['id'] for tmp in known_tabs]:
-					self.log.debug("New tab created with ID: '%s'", tab['id'])
-					self.tab_id_map[tab_key] = tab
-					return
+		Targets have no `webSocketDebuggerUrl` when using the debugging pipe.
+		'''
+		meta = {
+				'id'                   : target_info['targetId'],
+				'type'                 : target_info.get('type', 'page'),
+				'title'                : target_info.get('title', ''),
+				'url'                  : target_info.get('url', ''),
+			}
+		if not self.debug_pipe:
+			meta['webSocketDebuggerUrl'] = "ws://%s:%s/devtools/page/%s" % (self.host, self.port, target_info['targetId'])
+		return meta
+
+	def _index_target(self, target_info):
+		meta = self._target_meta(target_info)
+		with self._targets_lock:
+			entry = self.targets.setdefault(meta['id'], meta)
+			if entry is not meta:
+				# Update in place, so `tab_id_map` sees the change too.
+				entry.update(meta)
+		return entry
+
+	def _on_target_event(self, message):
+		params = message['params']
+		if message['method'] == "Target.targetDestroyed":
+			self.targets.pop(params['targetId'], None)
+		else:
+			self._index_target(params['targetInfo'])
 
+	def __create_new_tab(self, tab_key, start_at_url=None):
+		self.log.debug("Creating new target (%s active)", len(self.tab_id_map))
+		params = {"url" : start_at_url or "about:blank"}
+		if tab_key in self.tab_contexts:
+			params["browserContextId"] = self.tab_contexts[tab_key]
+		ret = self.__browser_command("Target.createTarget", **params)
+
+		self.log.debug("New tab created with ID: '%s'", ret['targetId'])
+		self.tab_id_map[tab_key] = self._index_target({'targetId' : ret['targetId'], 'type' : 'page', 'url' : start_at_url or "about:blank"})
+
+	def __close_target(self, tab_key):
+		cr_tab_id = self.tab_id_map.pop(tab_key)['id']
+		self.targets.pop(cr_tab_id, None)
+		self.__browser_command("Target.closeTarget", targetId=cr_tab_id)
+
+	def __dispose_tab_context(self, tab_key):
+		context_id = self.tab_contexts.pop(tab_key, None)
+		if context_id is not None and context_id not in self.tab_contexts.values():
+			self.log.debug("Disposing of browser context %s", context_id)
+			self.__browser_command("Target.disposeBrowserContext", browserContextId=context_id)
+
+	def create_browser_context(self, tab_key):
+		'''
+		Create a new browser context for the (not yet created) tab `tab_key`.
 
-		except requests.exceptions.ConnectionError:
-			raise cr_exceptions.ChromeConnectFailure("Failed to create a new tab in remote chromium!")
+		A browser context is the equivalent of an incognito profile. Its tabs have their
+		own cookies, cache and storage, isolated from those of the default context and
+		of every other context, while still living in the same browser process.
+
+		Return value is the context id. The context is disposed of (along with its cookies)
+		when the last tab in it is closed.
+		'''
+		with self._connect_lock:
+			assert tab_key not in self.tab_id_map, "Tab %s already exists, so it cannot be moved to a new browser context!" % (tab_key, )
+			if self.browser_key not in self.soclist:
+				self.__connect_to_browser()
+			ret = self.__browser_command("Target.createBrowserContext")
+			self.tab_contexts[tab_key] = ret['browserContextId']
+		self.log.debug("Created browser context %s for tab %s", ret['browserContextId'], tab_key)
+		return ret['browserContextId']
 
 	def __connect_to_tab(self, tab_key):
 		assert tab_key not in self.soclist
@@ -377,7 +1062,7 @@ class ChromeExecutionManager():
 		cr_tab_meta = self._get_cr_tab_meta_for_key(tab_key)
 
 		if not 'webSocketDebuggerUrl' in cr_tab_meta:
-			raise cr_exceptions.ChromeConnectFailure("Tab %s has no 'webSocketDebuggerUrl' (%s)" % (tab_key, self.tablist))
+			raise cr_exceptions.ChromeConnectFailure("Tab %s has no 'webSocketDebuggerUrl' (%s)" % (tab_key, cr_tab_meta))
 
 		wsurl = cr_tab_meta['webSocketDebuggerUrl']
 
@@ -389,27 +1074,173 @@ class ChromeExecutionManager():
 		except (socket.timeout, websocket.WebSocketTimeoutException):
 			raise cr_exceptions.ChromeCommunicationsError("Could not connect to remote chromium.")
 
-	def __close_tab(self, tab_key, timeout=None):
+		if self.use_reader_thread:
+			self.__start_reader(tab_key)
 
-		# traceback.print_stack()
+	def __connect_to_browser(self):
+		'''
+		Connect to the browser websocket, and start tracking the browser's targets.
 
-		cr_tab_id = self.tab_id_map[tab_key]['id']
+		The target index is seeded from the `/json` listing fetched at startup, and is
+		then kept up to date by the `Target.targetCreated`, `Target.targetInfoChanged` and
+		`Target.targetDestroyed` events, as well as by the tabs we create and close ourselves.
 
-		url = "http://%s:%s/json/close/%s" % (self.host, self.port, cr_tab_id)
-		requests.get(url, timeout=timeout)
+		With `debug_pipe`, the debugging pipe takes the place of the browser websocket.
+		'''
+		if self.debug_pipe:
+			self.log.info("Using debugging pipe as browser connection")
+			self.soclist[self.browser_key] = self.pipe
+		else:
+			response = self._http_get("/json/version", "Failed to fetch browser websocket URL from remote chromium!")
+
+			wsurl = self.codec.loads(response.text).get('webSocketDebuggerUrl')
+			if not wsurl:
+				raise cr_exceptions.ChromeConnectFailure("Browser has no 'webSocketDebuggerUrl' (%s)" % (response.text, ))
+
+			try:
+				self.log.info("Setting up browser websocket connection")
+				self.soclist[self.browser_key] = websocket.create_connection(wsurl)
+				self.soclist[self.browser_key].settimeout(self.websocket_timeout)
+
+			except (socket.timeout, websocket.WebSocketTimeoutException):
+				raise cr_exceptions.ChromeCommunicationsError("Could not connect to remote chromium.")
+
+		# The callback only holds a weak reference to us, so the manager isn't kept alive by
+		# a reference cycle through its own message store.
+		callback = _weak_callback(self._on_target_event)
+		store = self.__get_message_store(self.browser_key)
+		for method in ("Target.targetCreated", "Target.targetInfoChanged", "Target.targetDestroyed"):
+			store.add_callback(method, callback)
+
+		if self.use_reader_thread:
+			self.__start_reader(self.browser_key)
+
+		self.__browser_command("Target.setDiscoverTargets", discover=True)
+
+	def __browser_command(self, command, **params):
+		ret = self.synchronous_command(command, tab_key=self.browser_key, **params)
+		if not ret or 'error' in ret:
+			raise cr_exceptions.ChromeCommunicationsError("%s failed: %s" % (command, ret))
+		return ret['result']
+
+	def __connect_session(self, tab_key):
+		'''
+		Attach tab `tab_key` as a flattened session on the browser websocket, creating the
+		tab first, if needed.
+		'''
+		assert tab_key not in self.sessions
+
+		if tab_key not in self.tab_id_map:
+			self.__create_new_tab(tab_key)
+
+		ret = self.__browser_command("Target.attachToTarget", targetId=self.tab_id_map[tab_key]['id'], flatten=True)
+
+		self.log.info("Attached tab %s as session %s", tab_key, ret['sessionId'])
+		self.sessions[tab_key] = ret['sessionId']
+		self.session_tabs[ret['sessionId']] = tab_key
+		self.soclist[tab_key] = self.soclist[self.browser_key]
+		self.__get_message_store(tab_key)
+
+	def __start_reader(self, tab_key):
+		self.__get_message_store(tab_key)
+		self.reader_errors.pop(tab_key, None)
+
+		reader = _SocketReader(
+				name       = "ChromeController reader for tab %s" % (tab_key, ),
+				sock       = self.soclist[tab_key],
+				# The reader thread outlives any reference to us, so it mustn't keep us alive.
+				on_frame   = _weak_callback(self._dispatch_frame, tab_key),
+				on_error   = _weak_callback(self._reader_failed, tab_key),
+			)
+		self.readers[tab_key] = reader
+		reader.start()
+
+	def __stop_reader(self, tab_key):
+		reader = self.readers.pop(tab_key, None)
+		if reader:
+			reader.stop()
+
+	def _dispatch(self, tab_key, message):
+		'''
+		Route a message decoded by a reader thread. Responses to commands someone is
+		waiting on complete that command's future, everything else goes to the tab's
+		message store (which hands it to a matching waiter, if there is one).
+		'''
+		self._check_console_log(message)
+
+		if 'id' in message:
+			with self._pending_lock:
+				pending = self._pending.get(message['id'])
+			if pending:
+				dummy_key, future = pending
+				future.set_result(message)
+				return
+
+		self.__get_message_store(tab_key).put(message)
+
+	def _reader_failed(self, tab_key, exc):
+		self.log.error("Reader thread for tab %s failed: %s", tab_key, exc)
+		self.reader_errors[tab_key] = exc
+
+		# With flattened sessions, every tab is on the browser socket.
+		failed_keys = {tab_key}
+		if tab_key == self.browser_key:
+			failed_keys.update(self.sessions.keys())
+
+		with self._pending_lock:
+			failed = [msg_id for msg_id, (pending_key, dummy_future) in self._pending.items() if pending_key in failed_keys]
+			failed = [self._pending.pop(msg_id)[1] for msg_id in failed]
+		for future in failed:
+			future.set_exception(cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+				" remote chromium instance dead?"))
+
+		for key in failed_keys:
+			if key in self.messages:
+				self.messages[key].fail_waiters(cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+						" remote chromium instance dead?"))
+
+	def __check_reader(self, tab_key):
+		if tab_key in self.sessions:
+			tab_key = self.browser_key
+		if tab_key in self.reader_errors:
+			raise cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
+				" remote chromium instance dead? (%s)" % (self.reader_errors[tab_key], ))
 
-		# Delete the now-removed tab from the tab map
-		self.tab_id_map.pop(tab_key)
+	def __close_tab(self, tab_key):
 
-		self.log.info("Closing websocket connecton %s (%s)", tab_key, len(self.soclist))
-		self.soclist.pop(tab_key, None)
+		# traceback.print_stack()
+
+		self.__close_target(tab_key)
+
+		if tab_key in self.sessions:
+			session_id = self.sessions.pop(tab_key)
+			self.session_tabs.pop(session_id, None)
+			self.log.info("Dropping session %s", session_id)
+			self.soclist.pop(tab_key, None)
+		else:
+			self.log.info("Closing websocket connecton %s (%s)", tab_key, len(self.soclist))
+			self.__stop_reader(tab_key)
+			sock = self.soclist.pop(tab_key, None)
+			if sock:
+				sock.close()
+
+	def __drop_tab_state(self, tab_key):
+		'''
+		Discard the per-tab bookkeeping for the closed tab `tab_key`.
 
-		self.tablist = self.fetch_tablist()
-		return self.tablist
+		This isn't done by `__close_tab()`, as a tab being recreated by `connect()` keeps
+		its message store (and therefore any subscriptions and callbacks).
+		'''
+		self.messages.pop(tab_key, None)
+		self.socket_locks.pop(tab_key, None)
+		self.reader_errors.pop(tab_key, None)
 
 	def close_tab(self, tab_key):
 		self.log.info("Closing tab %s (cr ID: %s)", tab_key, self.tab_id_map[tab_key]['id'])
-		self.__close_tab(tab_key)
+		with self._connect_lock:
+			self.__close_tab(tab_key)
+			self.__dispose_tab_context(tab_key)
+			self.__drop_tab_state(tab_key)
 
 		# If we've closed all the chrome tabs, shut down the interface.
 		if not len(self.tab_id_map):
@@ -422,6 +1253,7 @@ class ChromeExecutionManager():
 		for tab_key in list(self.tab_id_map.keys()):
 			self.log.info("Closing tab %s (cr ID: %s)", tab_key, self.tab_id_map[tab_key]['id'])
 			self.__close_tab(tab_key)
+		self.tab_contexts = {}
 
 		self.log.info("All tabs are closed. Closing chromium!")
 		self.close_websockets()
@@ -431,32 +1263,47 @@ class ChromeExecutionManager():
 		""" Close websocket connection to remote browser."""
 		self.log.info("Websocket Teardown called")
 		for key in list(self.soclist.keys()):
+			self.__stop_reader(key)
 			if self.soclist[key]:
 				self.soclist[key].close()
 			self.soclist.pop(key)
 
 
+	def _http_get(self, path, message):
+		'''
+		GET `path` from the DevTools HTTP endpoint, over the persistent HTTP session.
+
+		Connection failures and timeouts are raised as a `ChromeConnectFailure` with the error `message`.
+		'''
+		try:
+			return self.http.get("http://%s:%s%s" % (self.host, self.port, path), timeout=self.http_timeout)
+		except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+			raise cr_exceptions.ChromeConnectFailure(message)
+
 	def fetch_tablist(self):
 		"""Connect to host:port and request list of tabs
 			 return list of dicts of data about open tabs."""
+		if self.debug_pipe:
+			# There's no HTTP endpoint, so ask the browser itself.
+			ret = self.__browser_command("Target.getTargets")
+			return [self._target_meta(target_info) for target_info in ret['targetInfos']]
+
 		# find websocket endpoint
-		try:
-			response = requests.get("http://%s:%s/json" % (self.host, self.port))
-		except requests.exceptions.ConnectionError:
-			raise cr_exceptions.ChromeConnectFailure("Failed to fetch configuration json from browser!")
+		response = self._http_get("/json", "Failed to fetch configuration json from browser!")
 
-		tablist = json.loads(response.text)
+		tablist = self.codec.loads(response.text)
 
 		return tablist
 
 	def __check_open_socket(self, tab_key):
 		# self.log.info("__check_open_socket -> %s", tab_key)
+		if self.use_reader_thread:
+			self.__check_reader(tab_key)
 		if not tab_key in self.soclist:
 			self.connect(tab_key=tab_key)
 		if self.soclist[tab_key].connected is not True:
 			self.connect(tab_key=tab_key)
-		if not tab_key in self.messages:
-			self.messages[tab_key] = []
+		self.__get_message_store(tab_key)
 
 
 	def synchronous_command(self, command, tab_key, **params):
@@ -465,19 +1312,69 @@ class ChromeExecutionManager():
 		remote chrome instance, returning the response from the chrome instance.
 
 		"""
-		self.log.debug("Synchronous_command to tab %s (%s):", tab_key, self._get_cr_tab_meta_for_key(tab_key))
-		self.log.debug("	command: '%s'", command)
-		self.log.debug("	params:  '%s'", params)
-		self.log.debug("	tab_key:  '%s'", tab_key)
+		debug = self.log.isEnabledFor(logging.DEBUG)
+		if debug:
+			self.log.debug("Synchronous_command to tab %s (%s):", tab_key, self._get_cr_tab_meta_for_key(tab_key))
+			self.log.debug("	command: '%s'", command)
+			self.log.debug("	params:  '%s'", _short_repr(params))
+			self.log.debug("	tab_key:  '%s'", tab_key)
 
 		send_id = self.send(command=command, tab_key=tab_key, params=params)
 		resp = self.recv(message_id=send_id, tab_key=tab_key)
 
-		self.log.debug("	Response: '%s'", str(resp).encode("ascii", 'ignore').decode("ascii"))
+		if debug:
+			self.log.debug("	Response: '%s'", _short_repr(resp))
 
 		# self.log.debug("	resolved tab idx %s:", self.tab_id_map[tab_key])
 		return resp
 
+	def batch_command(self, commands, tab_key, timeout=30):
+		'''
+		Pipeline a batch of commands to the remote chrome instance.
+
+		`commands` is a sequence of `(command, params)` 2-tuples, where `params` is
+		either a dict of command parameters or None.
+
+		All the commands are written to the socket before any response is waited on,
+		so the entire batch costs roughly one round trip, rather than one per command.
+		Chromium processes commands for a tab in order, so the semantics are the same as
+		issuing each command with `synchronous_command()`.
+
+		Return value is a list of the responses, in the same order as `commands`.
+		'''
+		sent_ids = [self.send(command=command, tab_key=tab_key, params=params) for command, params in commands]
+
+		# The timeout is for the batch as a whole, not for each command in it.
+		timeout_at = time.time() + timeout
+
+		if self.use_reader_thread:
+			responses = []
+			try:
+				for sent_id in sent_ids:
+					responses.append(self.recv(message_id=sent_id, tab_key=tab_key, timeout=max(timeout_at - time.time(), 0)))
+				return responses
+			finally:
+				# If a response times out, nothing is going to wait on the rest of the batch.
+				for sent_id in sent_ids[len(responses):]:
+					self.discard_response(tab_key, sent_id)
+
+		waiting   = set(sent_ids)
+		responses = {}
+
+		# Responses never have a method, so this can't match any event.
+		@filter_funcs.for_methods()
+		def check_func(message):
+			if not message:
+				return False
+			return message.get('id') in waiting
+
+		while waiting:
+			resp = self.recv_filtered(check_func, tab_key, max(timeout_at - time.time(), 0), message="batch_command()")
+			waiting.discard(resp['id'])
+			responses[resp['id']] = resp
+
+		return [responses[sent_id] for sent_id in sent_ids]
+
 	def send(self, command, tab_key, params=None):
 		'''
 		Send command `command` with optional parameters `params` to the
@@ -490,43 +1387,122 @@ class ChromeExecutionManager():
 		'''
 		self.__check_open_socket(tab_key)
 
-		sent_id = self.msg_id
+		sent_id = self._next_msg_id()
 
 		command = {
-				"id": self.msg_id,
+				"id": sent_id,
 				"method": command,
 			}
 
 		if params:
 			command["params"] = params
-		navcom = json.dumps(command)
+		if tab_key in self.sessions:
+			command["sessionId"] = self.sessions[tab_key]
+		navcom = self.codec.dumps(command)
+
+		# In threaded mode, the future has to exist before the command goes out, as the
+		# reader thread can receive the response before we get around to waiting on it.
+		if self.use_reader_thread:
+			with self._pending_lock:
+				self._pending[sent_id] = (tab_key, concurrent.futures.Future())
 
+		if self.wire_trace is not None:
+			self.wire_trace("send", tab_key, navcom)
 
-		# self.log.debug("		Sending: '%s'", navcom)
+		send_lock, dummy_recv_lock = self._socket_locks(tab_key)
 		try:
-			self.soclist[tab_key].send(navcom)
+			with send_lock:
+				self.soclist[tab_key].send(navcom)
 		except (socket.timeout, websocket.WebSocketTimeoutException):
+			self.__discard_pending(sent_id)
 			raise cr_exceptions.ChromeCommunicationsError("Failure sending command to chromium.")
 		except websocket.WebSocketConnectionClosedException:
+			self.__discard_pending(sent_id)
 			raise cr_exceptions.ChromeCommunicationsError("Websocket appears to have been closed. Is the"
 				" remote chromium instance dead?")
 
-
-		self.msg_id += 1
 		return sent_id
 
 
-	def ___recv(self, tab_key, timeout=None):
+	def __discard_pending(self, message_id):
+		with self._pending_lock:
+			self._pending.pop(message_id, None)
+
+	def discard_response(self, tab_key, message_id):
+		'''
+		Drop the response to the command `message_id` sent to tab `tab_key`, for a command
+		whose response nothing is going to wait on, whether or not it has been received yet.
+		'''
+		self.__discard_pending(message_id)
+		self.__get_message_store(tab_key).ignore_id(message_id)
+
+	def __recv_future(self, tab_key, message_id, timeout):
+		'''
+		Wait for the response to command `message_id` to be delivered by the reader thread.
 
+		Returns None if the command was not sent in threaded mode (and therefore has no future).
+		'''
+		with self._pending_lock:
+			pending = self._pending.get(message_id)
+		if not pending:
+			return None
+
+		dummy_key, future = pending
+		try:
+			return future.result(timeout=timeout)
+		except concurrent.futures.TimeoutError:
+			raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv() (message id %s)" % (message_id, ))
+		finally:
+			self.__discard_pending(message_id)
+
+	# How long to wait for another tab to finish reading a shared socket, before checking
+	# whether it routed a message for us into our store.
+	SHARED_RECV_WAIT = 0.05
+
+	def ___recv(self, tab_key, timeout=None, keycheck=None):
+		'''
+		Read from the socket for tab `tab_key` until a message for the tab is received (or the read
+		times out, in which case None is returned).
+
+		Only one thread reads a socket at a time. If the socket is shared with other tabs, and
+		another tab is reading it, this doesn't queue up behind it, but instead returns the first
+		message matching `keycheck` that the other reader stored for us (or None).
+		'''
+		dummy_send_lock, recv_lock = self._socket_locks(tab_key)
+		shared = self._shares_socket(tab_key)
+
+		if not recv_lock.acquire(timeout=self.SHARED_RECV_WAIT if shared else -1):
+			return self.messages[tab_key].pop_first(keycheck) if keycheck else None
+
+		try:
+			# Another tab may have received our message while we were waiting for the socket.
+			if shared and keycheck:
+				tmp = self.messages[tab_key].pop_first(keycheck)
+				if tmp is not None:
+					return tmp
+			return self.__recv_locked(tab_key, timeout, keycheck)
+		finally:
+			recv_lock.release()
+
+	def __recv_locked(self, tab_key, timeout, keycheck):
 		try:
 			if timeout:
 				self.soclist[tab_key].settimeout(timeout)
 
-			tmp = self.soclist[tab_key].recv()
-			self.log.debug("		Received: '%s'", tmp)
-
-			decoded = json.loads(tmp)
-			return decoded
+			# Discarded events are skipped, rather then returned as a empty
+			# read, so they don't cost the caller a poll interval each.
+			# Frames for other tabs sharing the socket are stored for them.
+			while 1:
+				tmp = self.soclist[tab_key].recv()
+
+				owner, decoded = self._route_frame(tab_key, tmp, keycheck)
+				if decoded is None:
+					continue
+				if owner != tab_key:
+					self._check_console_log(decoded)
+					self.__get_message_store(owner).put(decoded)
+					continue
+				return decoded
 		except (socket.timeout, websocket.WebSocketTimeoutException):
 			return None
 		except websocket.WebSocketConnectionClosedException:
@@ -535,7 +1511,7 @@ class ChromeExecutionManager():
 		finally:
 			self.soclist[tab_key].settimeout(self.websocket_timeout)
 
-	def __check_console_log(self, message):
+	def _check_console_log(self, message):
 		'''
 		Examine received message to determine if it was the output of a `console.xxx()` call, and
 		optionally output it to stdout.
@@ -592,24 +1568,32 @@ class ChromeExecutionManager():
 
 		Note that the function is defined dynamically, and `message_id` is captured via closure.
 
+		If `keycheck` has a `methods` attribute (see `filter_funcs.for_methods()`), only
+		buffered events with one of those methods are checked against it.
+
 		'''
 
 
 		self.__check_open_socket(tab_key)
 
+		if self.use_reader_thread:
+			return self.__recv_filtered_threaded(keycheck, tab_key, timeout, message)
+
 		# First, check if the message has already been received.
-		for idx in range(len(self.messages[tab_key])):
-			if keycheck(self.messages[tab_key][idx]):
-				return self.messages[tab_key].pop(idx)
+		tmp = self.messages[tab_key].pop_first(keycheck)
+		if tmp is not None:
+			return tmp
 
 		timeout_at = time.time() + timeout
 		while 1:
-			tmp = self.___recv(tab_key)
-			self.__check_console_log(tmp)
+			tmp = self.___recv(tab_key, keycheck=keycheck)
+			self._check_console_log(tmp)
 			if keycheck(tmp):
+				# Matches bypass the store, so its callbacks have to be run here.
+				self.messages[tab_key].dispatch(tmp)
 				return tmp
 			else:
-				self.messages[tab_key].append(tmp)
+				self.messages[tab_key].put(tmp)
 
 			if time.time() > timeout_at:
 				if message:
@@ -619,6 +1603,34 @@ class ChromeExecutionManager():
 			else:
 				time.sleep(0.005)
 
+	def __recv_filtered_threaded(self, keycheck, tab_key, timeout, message):
+		'''
+		`recv_filtered()` for the threaded reader mode. Rather then polling the socket,
+		we register a waiter with the tab's message store, and the reader thread hands
+		us the first matching message as it arrives.
+		'''
+		store = self.messages[tab_key]
+		future = concurrent.futures.Future()
+
+		tmp, waiter = store.pop_first_or_wait(keycheck, future)
+		if waiter is None:
+			return tmp
+
+		try:
+			self.__check_reader(tab_key)
+			return future.result(timeout=timeout)
+		except concurrent.futures.TimeoutError:
+			# The message may have been delivered between timing out and unregistering.
+			if not store.cancel_waiter(waiter):
+				return future.result()
+			if message:
+				raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv_filtered() (%s)" % message)
+			else:
+				raise cr_exceptions.ChromeResponseNotReceived("Failed to receive response in recv_filtered()")
+		except cr_exceptions.ChromeCommunicationsError:
+			store.cancel_waiter(waiter)
+			raise
+
 	def recv_all_filtered(self, keycheck, tab_key, timeout=0.5):
 		'''
 		Receive a all messages matching a filter, using the callable `keycheck` to filter received messages
@@ -649,23 +1661,28 @@ class ChromeExecutionManager():
 
 
 		self.__check_open_socket(tab_key)
+
+		if self.use_reader_thread:
+			time.sleep(timeout)
+			return self.messages[tab_key].pop_all(keycheck)
+
 		# First, check if the message has already been received.
-		ret           = [tmp for tmp in self.messages[tab_key] if keycheck(tmp)]
-		self.messages[tab_key] = [tmp for tmp in self.messages[tab_key] if not keycheck(tmp)]
+		ret = self.messages[tab_key].pop_all(keycheck)
 
 		self.log.debug("Waiting for all messages from the socket")
 		timeout_at = time.time() + timeout
 		while 1:
-			tmp = self.___recv(tab_key, timeout=timeout)
+			tmp = self.___recv(tab_key, timeout=timeout, keycheck=keycheck)
 			if keycheck(tmp):
+				self.messages[tab_key].dispatch(tmp)
 				ret.append(tmp)
 			else:
-				self.messages[tab_key].append(tmp)
+				self.messages[tab_key].put(tmp)
 
 			if time.time() > timeout_at:
 				return ret
 			else:
-				self.log.debug("Sleeping: %s, %s" % (timeout_at, time.time()))
+				self.log.debug("Sleeping: %s, %s", timeout_at, time.time())
 				time.sleep(0.005)
 
 	def recv(self, tab_key, message_id=None, timeout=30):
@@ -683,12 +1700,17 @@ class ChromeExecutionManager():
 
 		self.__check_open_socket(tab_key)
 
-		# First, check if the message has already been received.
-		for idx in range(len(self.messages[tab_key])):
-			if self.messages[tab_key][idx]:
-				if "id" in self.messages[tab_key][idx] and message_id:
-					if self.messages[tab_key][idx]['id'] == message_id:
-						return self.messages[tab_key].pop(idx)
+		if self.use_reader_thread:
+			# Responses to commands we sent are delivered straight to their future.
+			if message_id is not None:
+				resp = self.__recv_future(tab_key, message_id, timeout)
+				if resp is not None:
+					return resp
+		elif message_id is not None:
+			# First, check if the message has already been received.
+			resp = self.messages[tab_key].pop_id(message_id)
+			if resp is not None:
+				return resp
 
 		# Then spin untill we either have the message,
 		# or have timed out.
@@ -702,13 +1724,18 @@ class ChromeExecutionManager():
 				return message['id'] == message_id
 			return False
 
+		if message_id is not None:
+			# A response to a command never has a method, so this can't match any event.
+			check_func = filter_funcs.for_methods()(check_func)
+
 		return self.recv_filtered(check_func, tab_key, timeout)
 
 	def flush(self, tab_key):
 		'''
 		Flush the pending RX buffer for a specific tab key.
 		'''
-		self.messages[tab_key] = []
+		if tab_key in self.messages:
+			self.messages[tab_key].clear()
 
 
 
@@ -717,28 +1744,31 @@ class ChromeExecutionManager():
 		Return all messages in waiting for the websocket connection.
 		'''
 		self.log.debug("Draining transport")
-		ret = []
-		while len(self.messages[tab_key]):
-			ret.append(self.messages[tab_key].pop(0))
+
+		ret = self.messages[tab_key].drain()
+
+		# The reader thread has already pulled everything off the socket.
+		if self.use_reader_thread:
+			self.log.debug("Drained %s messages", len(ret))
+			return ret
 
 		self.log.debug("Polling socket")
 
 		tmp = self.___recv(tab_key)
 		while tmp is not None:
+			self.messages[tab_key].dispatch(tmp)
 			ret.append(tmp)
 			tmp = self.___recv(tab_key)
 
 		self.log.debug("Drained %s messages", len(ret))
 		return ret
 
-	def __del__(self):
-		self.log.debug("Transport destructor called. Tearing down chromium")
-		try:
-			self.close_chromium()
-		except Exception:
-			pass
+	def __enter__(self):
+		return self
 
-		ACTIVE_PORTS.discard(self.port)
+	def __exit__(self, *args):
+		if self._finalizer.alive:
+			self.close_all()
 
 if __name__ == '__main__':
 	import doctest
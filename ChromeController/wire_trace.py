@@ -0,0 +1,46 @@
+
+import time
+import logging
+import collections
+
+
+class WireTrace(object):
+	'''
+	Record of the raw frames sent to and received from chromium, for debugging.
+
+	Pass an instance as the `wire_trace` parameter of `ChromeExecutionManager` (or
+	`ChromeRemoteDebugInterface`), which then calls it with every frame. Any other callable
+	with the same `(direction, tab_key, frame)` signature can be used as well.
+
+	The last `max_frames` frames are kept in `frames`, as `(timestamp, direction, tab_key, frame)`
+	tuples, where `direction` is either "send" or "recv". Frames longer than `max_frame_size`
+	characters are truncated, so tracing a large `Network.getResponseBody` or screenshot
+	response doesn't keep the whole payload around.
+
+	If `log_frames` is true, each frame is also logged (at DEBUG level) to the
+	`Main.ChromeController.WireTrace` logger.
+	'''
+
+	def __init__(self, max_frames=1000, max_frame_size=1024, log_frames=False):
+		assert max_frame_size > 0, "max_frame_size must be a positive integer"
+		self.max_frame_size = max_frame_size
+		self.log_frames     = log_frames
+		self.frames         = collections.deque(maxlen=max_frames)
+
+		self.log = logging.getLogger("Main.ChromeController.WireTrace")
+
+	def __call__(self, direction, tab_key, frame):
+		if len(frame) > self.max_frame_size:
+			frame = "%s... (%s characters truncated)" % (frame[:self.max_frame_size], len(frame) - self.max_frame_size)
+		self.frames.append((time.time(), direction, tab_key, frame))
+		if self.log_frames:
+			self.log.debug("%s %s: %s", direction, tab_key, frame)
+
+	def clear(self):
+		self.frames.clear()
+
+	def dump(self):
+		'''
+		Return the recorded frames, formatted one per line.
+		'''
+		return "\n".join("%.6f %s %s: %s" % frame for frame in list(self.frames))
@@ -0,0 +1,281 @@
+
+import os
+import queue
+import logging
+import threading
+import collections
+import multiprocessing
+import multiprocessing.connection
+
+from ChromeController import cr_exceptions
+from ChromeController.manager import DEFAULT_TIMEOUT_SECS
+from ChromeController.tab_pool import TabPooledChromium
+
+
+FetchResult = collections.namedtuple("FetchResult", ["job_id", "url", "mode", "result", "error"])
+FetchResult.__doc__ = '''
+Result of a fetch job run by a `ChromiumWorkerPool`.
+
+`result` is the return value of the fetch mode function, or None if the job failed,
+in which case `error` is a string describing the failure.
+'''
+
+
+def _fetch_source(tab, url, **options):
+	return tab.blocking_navigate_and_get_source(url, **options)
+
+def _fetch_rendered(tab, url, timeout=DEFAULT_TIMEOUT_SECS, **options):
+	tab.blocking_navigate(url, timeout=timeout)
+	return tab.get_rendered_page_source(**options)
+
+def _fetch_screenshot(tab, url, timeout=DEFAULT_TIMEOUT_SECS):
+	tab.blocking_navigate(url, timeout=timeout)
+	return tab.take_screeshot()
+
+def _fetch_xhr(tab, url, **options):
+	return tab.xhr_fetch(url, **options)
+
+# Fetch modes, keyed by name. Each is called as `func(tab, url, **options)`.
+FETCH_MODES = {
+		"source"     : _fetch_source,
+		"rendered"   : _fetch_rendered,
+		"screenshot" : _fetch_screenshot,
+		"xhr"        : _fetch_xhr,
+	}
+
+
+def _worker_main(worker_id, args, kwargs, jobs, results, current_job):
+	'''
+	Entry point for the worker processes. Runs jobs from `jobs` in a `TabPooledChromium`
+	until a `None` job is received, and puts a `FetchResult` for each job onto `results`.
+
+	`current_job` holds the id of the job being run (or -1), so the parent can fail
+	the job if the worker crashes.
+	'''
+	log = logging.getLogger("Main.ChromeController.WorkerPool.Worker-%s" % (worker_id, ))
+	pool = None
+
+	try:
+		while True:
+			job = jobs.get()
+			if job is None:
+				break
+
+			job_id, url, mode, options = job
+			current_job.value = job_id
+
+			try:
+				if pool is None:
+					pool = TabPooledChromium(*args, **kwargs)
+				with pool.tab(url=url) as tab:
+					result = FETCH_MODES[mode](tab, url, **options)
+				ret = FetchResult(job_id, url, mode, result, None)
+			except Exception as e:
+				log.exception("Job %s (%s, %s) failed!", job_id, mode, url)
+				ret = FetchResult(job_id, url, mode, None, "%s: %s" % (type(e).__name__, e))
+
+				# Start over with a fresh chromium if it's gone.
+				if pool is not None and isinstance(e, (cr_exceptions.ChromeDiedError, cr_exceptions.ChromeCommunicationsError)):
+					log.warning("Chromium appears to have died. Restarting it.")
+					try:
+						pool.close()
+					except Exception:
+						pass
+					pool = None
+
+			results.put(ret)
+			current_job.value = -1
+
+	finally:
+		if pool is not None:
+			pool.close()
+
+
+class ChromiumWorkerPool(object):
+
+	def __init__(self, *args, workers=None, queue_size=None, **kwargs):
+		'''
+		Create a pool of worker processes, each running its own `TabPooledChromium`, which
+		run fetch jobs submitted with `submit()` (or `map()`).
+
+		Processing the responses (decoding, parsing, etc...) happens in the workers, so it isn't
+		limited to a single core by the GIL.
+
+		`workers` is the number of worker processes (one per CPU, by default). At most `queue_size`
+		jobs (twice the number of workers, by default) can be waiting for a worker, after which
+		`submit()` blocks. Likewise, at most `queue_size` results are buffered for `get_result()`,
+		after which the workers block until the results are consumed.
+
+		Workers that crash are restarted, and the job they were running is returned as failed.
+
+		The worker processes are started with the `spawn` start method, so everything passed
+		through to the `TabPooledChromium()` constructor must be picklable.
+		'''
+		if workers is None:
+			workers = os.cpu_count() or 1
+		if queue_size is None:
+			queue_size = workers * 2
+		assert workers > 0, "workers must be a positive integer"
+		assert queue_size > 0, "queue_size must be a positive integer"
+		assert "dbg_port" not in kwargs, "Each chromium instance needs its own debug port, so dbg_port cannot be specified!"
+
+		self.args         = args
+		self.kwargs       = kwargs
+		self.worker_count = workers
+		self.queue_size   = queue_size
+		self.alive        = True
+		self.restarts     = 0
+
+		self.log = logging.getLogger("Main.ChromeController.WorkerPool")
+
+		self.__ctx          = multiprocessing.get_context("spawn")
+		self.__jobs         = self.__ctx.Queue(maxsize=queue_size)
+		self.__results      = self.__ctx.Queue(maxsize=queue_size)
+		self.__lock         = threading.Lock()
+		self.__next_job     = 0
+		self.__outstanding  = {}
+		self.__workers      = {}
+		self.__started_pid  = os.getpid()
+
+		for worker_id in range(workers):
+			self.__start_worker(worker_id)
+
+		self.__supervisor = threading.Thread(target=self.__supervise, name="ChromeController worker pool supervisor", daemon=True)
+		self.__supervisor.start()
+
+	def __start_worker(self, worker_id):
+		current_job = self.__ctx.Value('q', -1)
+		proc = self.__ctx.Process(
+				target = _worker_main,
+				args   = (worker_id, self.args, self.kwargs, self.__jobs, self.__results, current_job),
+				name   = "ChromeController worker %s" % (worker_id, ),
+				daemon = True,
+			)
+		proc.start()
+		self.__workers[worker_id] = (proc, current_job)
+
+	def __supervise(self):
+		while self.alive:
+			with self.__lock:
+				workers = dict(self.__workers)
+			sentinels = {proc.sentinel : worker_id for worker_id, (proc, dummy_job) in workers.items()}
+			for sentinel in multiprocessing.connection.wait(list(sentinels.keys()), timeout=0.5):
+				if not self.alive:
+					return
+				self.__restart_worker(sentinels[sentinel])
+
+	def __restart_worker(self, worker_id):
+		proc, current_job = self.__workers[worker_id]
+		proc.join()
+		self.log.error("Worker %s exited unexpectedly (exit code %s). Restarting it.", worker_id, proc.exitcode)
+
+		with self.__lock:
+			self.restarts += 1
+			self.__start_worker(worker_id)
+			job = self.__outstanding.get(current_job.value)
+
+		if job is not None:
+			job_id, url, mode, dummy_options = job
+			self.__results.put(FetchResult(job_id, url, mode, None, "Worker crashed while running job (exit code %s)" % (proc.exitcode, )))
+
+	def submit(self, url, mode="source", timeout=None, **options):
+		'''
+		Queue a fetch of `url` with fetch mode `mode` (see `FETCH_MODES`), where `options` are
+		passed through to the fetch mode function. Blocks while the job queue is full, raising
+		`queue.Full` if there's still no room after `timeout` seconds.
+
+		Return value is the job id, which identifies the job's result.
+		'''
+		assert self.alive, "The worker pool has been shut down! Cannot continue!"
+		if self.__started_pid != os.getpid():
+			raise RuntimeError("ChromiumWorkerPool instances are not safe to share across multiple processes.")
+		if mode not in FETCH_MODES:
+			raise ValueError("Unknown fetch mode '%s'. Available modes: %s" % (mode, list(FETCH_MODES.keys())))
+
+		with self.__lock:
+			job_id = self.__next_job
+			self.__next_job += 1
+			job = (job_id, url, mode, options)
+			self.__outstanding[job_id] = job
+
+		try:
+			self.__jobs.put(job, timeout=timeout)
+		except queue.Full:
+			with self.__lock:
+				self.__outstanding.pop(job_id, None)
+			raise
+
+		return job_id
+
+	def get_result(self, timeout=None):
+		'''
+		Return the `FetchResult` for the next job to complete, raising `queue.Empty` if
+		no job completes within `timeout` seconds.
+		'''
+		while True:
+			result = self.__results.get(timeout=timeout)
+			with self.__lock:
+				# A worker that crashed just after finishing a job can have it reported twice.
+				if self.__outstanding.pop(result.job_id, None) is not None:
+					return result
+
+	def pending_count(self):
+		'''
+		Return the number of jobs submitted whose result hasn't been retrieved yet.
+		'''
+		with self.__lock:
+			return len(self.__outstanding)
+
+	def map(self, urls, mode="source", **options):
+		'''
+		Fetch every url in `urls` with mode `mode`, yielding the `FetchResult`s in the order the
+		jobs complete. `urls` can be any iterable, and is consumed as workers become free.
+
+		This must not be mixed with `submit()` calls from other threads.
+		'''
+		pending = 0
+		for url in urls:
+			self.submit(url, mode, **options)
+			pending += 1
+			if pending >= self.queue_size:
+				yield self.get_result()
+				pending -= 1
+
+		while pending:
+			yield self.get_result()
+			pending -= 1
+
+	def close(self, timeout=30):
+		'''
+		Stop the workers (once they've finished the jobs already queued), and shut down their
+		chromium instances. Workers still running after `timeout` seconds are terminated.
+		'''
+		if not self.alive:
+			return
+		self.alive = False
+		self.__supervisor.join()
+
+		for dummy_x in range(len(self.__workers)):
+			try:
+				self.__jobs.put(None, timeout=timeout)
+			except queue.Full:
+				break
+
+		for worker_id, (proc, dummy_job) in self.__workers.items():
+			proc.join(timeout=timeout)
+			if proc.is_alive():
+				self.log.warning("Worker %s did not exit. Terminating it.", worker_id)
+				proc.terminate()
+				proc.join()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __del__(self):
+		try:
+			self.close()
+		except Exception:
+			pass
@@ -0,0 +1,62 @@
+
+'''
+Microbenchmark for the transport command path.
+
+Issues a large number of trivial commands against a live chromium instance,
+and reports the achieved commands per second for each transport mode.
+
+Usage: python3 bench_commands.py [binary] [command_count]
+'''
+
+import sys
+import time
+import logging
+
+import ChromeController
+
+CHROME_BINARY_NAME = "google-chrome"
+COMMAND_COUNT      = 2000
+
+
+def run_commands(cr, count):
+	start = time.time()
+	for dummy_x in range(count):
+		cr.Runtime_evaluate(expression="1 + 1", returnByValue=True)
+	return time.time() - start
+
+
+def bench_mode(binary, count, **kwargs):
+	cr = ChromeController.ChromeRemoteDebugInterface(binary=binary, headless=True, **kwargs)
+	try:
+		# Warm up, so connection setup and the first-command JIT costs
+		# in chromium don't skew the result.
+		run_commands(cr, 50)
+		elapsed = run_commands(cr, count)
+	finally:
+		cr.close()
+
+	return count / elapsed
+
+
+def bench(binary=CHROME_BINARY_NAME, count=COMMAND_COUNT):
+	modes = [
+		("polling",       {}),
+		("reader thread", {"use_reader_thread" : True}),
+	]
+
+	results = []
+	for name, kwargs in modes:
+		rate = bench_mode(binary, count, **kwargs)
+		results.append((name, rate))
+		print("%-16s %10.1f commands/sec" % (name, rate))
+
+	base_name, base_rate = results[0]
+	for name, rate in results[1:]:
+		print("%-16s %10.2fx vs %s" % (name, rate / base_rate, base_name))
+
+
+if __name__ == '__main__':
+	logging.basicConfig(level=logging.WARNING)
+	binary = sys.argv[1] if len(sys.argv) > 1 else CHROME_BINARY_NAME
+	count  = int(sys.argv[2]) if len(sys.argv) > 2 else COMMAND_COUNT
+	bench(binary, count)
@@ -52,6 +52,13 @@ setup(
 	# We need pywin32 on windows for proper process termination.
 	] + win_req,
 
+	# The asyncio interface (AsyncChromeRemoteDebugInterface) needs an async websocket client.
+	extras_require={
+		'async' : ['websockets'],
+		# Faster frame encoding/decoding. Used automatically if installed.
+		'fast'  : ['orjson'],
+	},
+
 	classifiers                   = [
 		"Programming Language :: Python :: 3",
 		"Development Status :: 4 - Beta",
@@ -0,0 +1,53 @@
+import io
+import os
+import base64
+import unittest
+
+from ChromeController import b64_decode
+
+
+class TestB64Decode(unittest.TestCase):
+	def setUp(self):
+		# Use a small slice size, so every payload is decoded in several slices.
+		self.chunk_chars = b64_decode.CHUNK_CHARS
+		b64_decode.CHUNK_CHARS = 8
+
+	def tearDown(self):
+		b64_decode.CHUNK_CHARS = self.chunk_chars
+
+	def payloads(self):
+		for size in range(0, 40):
+			raw = os.urandom(size)
+			yield raw, base64.b64encode(raw).decode("ascii")
+
+	def test_decoded_size_1(self):
+		for raw, data in self.payloads():
+			self.assertEqual(b64_decode.decoded_size(data), len(raw))
+
+	def test_decode_1(self):
+		for raw, data in self.payloads():
+			self.assertEqual(b64_decode.decode(data), raw)
+
+	def test_decode_into_1(self):
+		buf = bytearray(100)
+		for raw, data in self.payloads():
+			written = b64_decode.decode_into(data, buf, offset=5)
+			self.assertEqual(written, len(raw))
+			self.assertEqual(bytes(buf[5:5 + written]), raw)
+		self.assertEqual(len(buf), 100)
+
+	def test_decode_into_grow_1(self):
+		buf = bytearray()
+		raw = os.urandom(30)
+		self.assertEqual(b64_decode.decode_into(base64.b64encode(raw).decode("ascii"), buf), 30)
+		self.assertEqual(bytes(buf), raw)
+
+	def test_decode_into_too_small_1(self):
+		with self.assertRaises(ValueError):
+			b64_decode.decode_into(base64.b64encode(b"0123456789").decode("ascii"), memoryview(bytearray(5)))
+
+	def test_decode_to_file_1(self):
+		for raw, data in self.payloads():
+			fileobj = io.BytesIO()
+			self.assertEqual(b64_decode.decode_to_file(data, fileobj), len(raw))
+			self.assertEqual(fileobj.getvalue(), raw)
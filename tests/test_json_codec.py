@@ -0,0 +1,102 @@
+import json
+import unittest
+
+from ChromeController import json_codec
+from ChromeController import filter_funcs
+
+
+class TestGetCodec(unittest.TestCase):
+	def test_stdlib_1(self):
+		codec = json_codec.get_codec("json")
+		self.assertEqual(codec.name, "json")
+		self.assertEqual(json.loads(codec.dumps({"id" : 1, "method" : "Page.enable"})), {"id" : 1, "method" : "Page.enable"})
+		self.assertEqual(codec.loads('{"id":1,"result":{}}'), {"id" : 1, "result" : {}})
+
+	def test_auto_1(self):
+		codec = json_codec.get_codec()
+		self.assertIn(codec.name, json_codec.CODECS)
+		frame = codec.dumps({"id" : 1, "method" : "Runtime.evaluate", "params" : {"expression" : "☃"}})
+		self.assertIsInstance(frame, str)
+		self.assertEqual(codec.loads(frame)['params']['expression'], "☃")
+
+	def test_passthrough_1(self):
+		codec = json_codec.JsonCodec()
+		self.assertIs(json_codec.get_codec(codec), codec)
+
+	def test_unknown_1(self):
+		with self.assertRaises(ValueError):
+			json_codec.get_codec("not-a-codec")
+
+
+class TestLazyMessage(unittest.TestCase):
+	FRAME = '{"method":"Network.dataReceived","params":{"requestId":"12.3","dataLength":512}}'
+
+	def lazy(self):
+		return json_codec.LazyMessage(self.FRAME, json.loads, {'method' : "Network.dataReceived"})
+
+	def test_envelope_1(self):
+		msg = self.lazy()
+		self.assertEqual(msg['method'], "Network.dataReceived")
+		self.assertIn('method', msg)
+		self.assertNotIn('id', msg)
+		self.assertEqual(msg.get('id'), None)
+		self.assertFalse(msg.is_decoded)
+
+	def test_decode_1(self):
+		msg = self.lazy()
+		self.assertEqual(msg['params']['requestId'], "12.3")
+		self.assertTrue(msg.is_decoded)
+		self.assertEqual(msg, json.loads(self.FRAME))
+		self.assertEqual(dict(msg), json.loads(self.FRAME))
+
+	def test_missing_1(self):
+		msg = self.lazy()
+		with self.assertRaises(KeyError):
+			msg['result']
+		self.assertEqual(msg.get('result', 5), 5)
+
+
+class TestPeekParams(unittest.TestCase):
+	def test_leading_1(self):
+		frame = '{"method":"Network.responseReceived","params":{"requestId":"12.3","loaderId":"AB","timestamp":1.5,"type":"Document","response":{"url":"http://x"},"frameId":"F1"}}'
+		params, complete = json_codec.peek_params(frame, "Network.responseReceived")
+		self.assertEqual(params, {"requestId" : "12.3", "loaderId" : "AB", "timestamp" : 1.5, "type" : "Document"})
+		self.assertFalse(complete)
+
+	def test_complete_1(self):
+		frame = '{"method":"Page.frameStartedLoading","params":{"frameId":"F1"}}'
+		self.assertEqual(json_codec.peek_params(frame, "Page.frameStartedLoading"), ({"frameId" : "F1"}, True))
+		frame = '{"method":"Page.interstitialShown","params":{}}'
+		self.assertEqual(json_codec.peek_params(frame, "Page.interstitialShown"), ({}, True))
+
+	def test_escaped_1(self):
+		frame = '{"method":"Runtime.consoleAPICalled","params":{"type":"log\\"","args":[]}}'
+		self.assertEqual(json_codec.peek_params(frame, "Runtime.consoleAPICalled"), ({}, False))
+
+	def test_unexpected_layout_1(self):
+		frame = '{"method": "Page.loadEventFired", "params": {"timestamp": 5}}'
+		self.assertEqual(json_codec.peek_params(frame, "Page.loadEventFired"), (None, False))
+
+
+class TestLazyFilters(unittest.TestCase):
+	def lazy(self, frame):
+		method = json.loads(frame)['method']
+		return json_codec.LazyMessage.from_event(frame, json.loads, method)
+
+	def test_loader_reject_1(self):
+		msg = self.lazy('{"method":"Network.responseReceived","params":{"requestId":"1","loaderId":"AB","response":{}}}')
+		self.assertFalse(filter_funcs.check_frame_loader_command("Network.responseReceived", "CD")(msg))
+		self.assertFalse(msg.is_decoded)
+		self.assertTrue(filter_funcs.check_frame_loader_command("Network.responseReceived", "AB")(msg))
+
+	def test_load_command_1(self):
+		msg = self.lazy('{"method":"Page.frameStoppedLoading","params":{"frameId":"F1"}}')
+		self.assertTrue(filter_funcs.check_frame_load_command("Page.frameStoppedLoading")(msg))
+		self.assertEqual(filter_funcs.get_param(msg, "frameId"), "F1")
+		self.assertEqual(filter_funcs.get_param(msg, "loaderId"), None)
+		self.assertFalse(msg.is_decoded)
+
+	def test_plain_dict_1(self):
+		msg = {"method" : "Page.frameStoppedLoading", "params" : {"frameId" : "F1"}}
+		self.assertEqual(filter_funcs.get_param(msg, "frameId"), "F1")
+		self.assertEqual(filter_funcs.get_param(msg, "loaderId", 5), 5)
@@ -0,0 +1,294 @@
+import unittest
+import threading
+import concurrent.futures
+
+from ChromeController import filter_funcs
+from ChromeController.message_store import MessageStore
+
+
+def event(method, **params):
+	return {"method" : method, "params" : params}
+
+
+class TestMessageStore(unittest.TestCase):
+	def setUp(self):
+		self.store = MessageStore()
+
+	def test_arrival_order_1(self):
+		msgs = [event("Network.dataReceived", requestId=str(x)) for x in range(10)]
+		for msg in msgs:
+			self.store.put(msg)
+
+		self.assertEqual(len(self.store), 10)
+		self.assertEqual(self.store.drain(), msgs)
+		self.assertEqual(len(self.store), 0)
+
+	def test_ignores_empty_1(self):
+		self.store.put(None)
+		self.store.put({})
+		self.assertEqual(len(self.store), 0)
+
+	def test_pop_id_1(self):
+		self.store.put(event("Page.frameStartedLoading"))
+		self.store.put({"id" : 5, "result" : {}})
+		self.store.put({"id" : 6, "result" : {}})
+
+		self.assertEqual(self.store.pop_id(6), {"id" : 6, "result" : {}})
+		self.assertEqual(self.store.pop_id(6), None)
+		self.assertEqual(self.store.pop_id(0), None)
+		self.assertEqual(len(self.store), 2)
+
+	def test_pop_first_declared_methods_1(self):
+		checked = []
+
+		@filter_funcs.for_methods("Page.loadEventFired")
+		def check(message):
+			checked.append(message)
+			return True
+
+		for x in range(100):
+			self.store.put(event("Network.dataReceived", requestId=str(x)))
+		self.store.put(event("Page.loadEventFired", x=1))
+		self.store.put(event("Page.loadEventFired", x=2))
+
+		self.assertEqual(self.store.pop_first(check), event("Page.loadEventFired", x=1))
+		# Only the bucket for the declared method should have been looked at.
+		self.assertEqual(len(checked), 1)
+		self.assertEqual(len(self.store), 101)
+
+	def test_pop_first_multiple_methods_1(self):
+		self.store.put(event("DOM.documentUpdated"))
+		self.store.put(event("Page.frameNavigated"))
+		self.store.put(event("DOM.childNodeInserted"))
+
+		check = filter_funcs.wait_for_methods(["DOM.childNodeInserted", "Page.frameNavigated"])
+
+		self.assertEqual(self.store.pop_first(check), event("Page.frameNavigated"))
+		self.assertEqual(self.store.pop_first(check), event("DOM.childNodeInserted"))
+		self.assertEqual(self.store.pop_first(check), None)
+		self.assertEqual(self.store.drain(), [event("DOM.documentUpdated")])
+
+	def test_pop_first_undeclared_1(self):
+		self.store.put(event("Network.dataReceived", requestId="1"))
+		self.store.put(event("Network.dataReceived", requestId="2"))
+
+		ret = self.store.pop_first(lambda message: message['params']['requestId'] == "2")
+		self.assertEqual(ret, event("Network.dataReceived", requestId="2"))
+
+	def test_pop_all_1(self):
+		for x in range(5):
+			self.store.put(event("Network.requestWillBeSent", type="Document", requestId=str(x), documentURL="http://x/%s" % x))
+			self.store.put(event("Network.dataReceived", requestId=str(x)))
+
+		ret = self.store.pop_all(filter_funcs.capture_loading_events)
+		self.assertEqual([tmp['params']['requestId'] for tmp in ret], ["0", "1", "2", "3", "4"])
+		self.assertEqual(len(self.store), 5)
+
+	def test_waiter_1(self):
+		future = concurrent.futures.Future()
+		tmp, waiter = self.store.pop_first_or_wait(filter_funcs.check_load_event_fired, future)
+		self.assertEqual(tmp, None)
+
+		self.store.put(event("Network.dataReceived"))
+		self.assertFalse(future.done())
+
+		thread = threading.Thread(target=self.store.put, args=(event("Page.loadEventFired"), ))
+		thread.start()
+		self.assertEqual(future.result(timeout=5), event("Page.loadEventFired"))
+		thread.join()
+
+		# Delivered messages are not buffered.
+		self.assertEqual(self.store.drain(), [event("Network.dataReceived")])
+		self.assertFalse(self.store.cancel_waiter(waiter))
+
+	def test_waiter_buffered_1(self):
+		self.store.put(event("Page.loadEventFired"))
+		tmp, waiter = self.store.pop_first_or_wait(filter_funcs.check_load_event_fired, concurrent.futures.Future())
+		self.assertEqual(tmp, event("Page.loadEventFired"))
+		self.assertEqual(waiter, None)
+
+	def test_waiter_cancel_1(self):
+		future = concurrent.futures.Future()
+		tmp, waiter = self.store.pop_first_or_wait(filter_funcs.check_load_event_fired, future)
+		self.assertTrue(self.store.cancel_waiter(waiter))
+
+		self.store.put(event("Page.loadEventFired"))
+		self.assertFalse(future.done())
+		self.assertEqual(len(self.store), 1)
+
+	def test_fail_waiters_1(self):
+		future = concurrent.futures.Future()
+		self.store.pop_first_or_wait(filter_funcs.check_load_event_fired, future)
+		self.store.fail_waiters(RuntimeError("Lol"))
+		with self.assertRaises(RuntimeError):
+			future.result(timeout=1)
+
+
+class TestBoundedMessageStore(unittest.TestCase):
+	def test_drop_oldest_1(self):
+		store = MessageStore(capacity=3)
+		for x in range(5):
+			store.put(event("Network.dataReceived", requestId=str(x)))
+
+		self.assertEqual([tmp['params']['requestId'] for tmp in store.drain()], ["2", "3", "4"])
+
+		stats = store.stats()
+		self.assertEqual(stats['capacity'], 3)
+		self.assertEqual(stats['retained'], 0)
+		self.assertEqual(stats['peak'], 3)
+		self.assertEqual(stats['dropped'], 2)
+		self.assertEqual(stats['dropped_by_method'], {"Network.dataReceived" : 2})
+
+	def test_responses_not_evicted_1(self):
+		store = MessageStore(capacity=2)
+		store.put({"id" : 1, "result" : {}})
+		for x in range(5):
+			store.put(event("DOM.childNodeInserted", x=x))
+
+		self.assertEqual(store.pop_id(1), {"id" : 1, "result" : {}})
+		self.assertEqual(store.stats()['retained'], 2)
+		self.assertEqual(len(store), 2)
+
+	def test_drop_by_method_1(self):
+		store = MessageStore(capacity=3, drop_policy=["Network.dataReceived", "DOM."])
+		store.put(event("Page.loadEventFired"))
+		store.put(event("DOM.documentUpdated"))
+		store.put(event("Network.dataReceived", requestId="1"))
+
+		# Network.dataReceived goes first, then the DOM domain, then the oldest event.
+		store.put(event("Page.frameNavigated"))
+		self.assertEqual([tmp['method'] for tmp in store.drain()], ["Page.loadEventFired", "DOM.documentUpdated", "Page.frameNavigated"])
+
+		store.put(event("Page.loadEventFired"))
+		store.put(event("DOM.documentUpdated"))
+		store.put(event("Page.frameStartedLoading"))
+		store.put(event("Page.frameNavigated"))
+		self.assertEqual([tmp['method'] for tmp in store.drain()], ["Page.loadEventFired", "Page.frameStartedLoading", "Page.frameNavigated"])
+
+		store.put(event("Page.loadEventFired"))
+		store.put(event("Page.frameStartedLoading"))
+		store.put(event("Page.frameStoppedLoading"))
+		store.put(event("Page.frameNavigated"))
+		self.assertEqual([tmp['method'] for tmp in store.drain()], ["Page.frameStartedLoading", "Page.frameStoppedLoading", "Page.frameNavigated"])
+
+		self.assertEqual(store.stats()['dropped_by_method'], {
+				"Network.dataReceived" : 1,
+				"DOM.documentUpdated"  : 1,
+				"Page.loadEventFired"  : 1,
+			})
+
+	def test_waiter_bypasses_capacity_1(self):
+		store = MessageStore(capacity=1)
+		future = concurrent.futures.Future()
+		store.pop_first_or_wait(filter_funcs.check_load_event_fired, future)
+
+		store.put(event("Network.dataReceived"))
+		store.put(event("Page.loadEventFired"))
+		self.assertEqual(future.result(timeout=1), event("Page.loadEventFired"))
+		self.assertEqual(store.stats()['dropped'], 0)
+
+	def test_bad_policy_1(self):
+		with self.assertRaises(AssertionError):
+			MessageStore(capacity=1, drop_policy="newest")
+
+
+class TestFilteredMessageStore(unittest.TestCase):
+	def setUp(self):
+		self.store = MessageStore(filter_events=True)
+
+	def test_unsubscribed_dropped_1(self):
+		self.assertFalse(self.store.admit("Network.dataReceived"))
+		self.store.put(event("Network.dataReceived"))
+		self.store.put({"id" : 1, "result" : {}})
+
+		self.assertEqual(self.store.drain(), [{"id" : 1, "result" : {}}])
+		self.assertEqual(self.store.stats()['filtered'], 2)
+
+	def test_subscribe_1(self):
+		sub = self.store.subscribe(["Page.loadEventFired"])
+		self.assertTrue(self.store.admit("Page.loadEventFired"))
+		self.store.put(event("Page.loadEventFired"))
+		self.store.put(event("Page.frameNavigated"))
+		self.assertEqual(self.store.drain(), [event("Page.loadEventFired")])
+
+		sub.close()
+		sub.close()
+		self.assertFalse(self.store.admit("Page.loadEventFired"))
+
+	def test_subscribe_nested_1(self):
+		with self.store.subscribe(["Page.loadEventFired"]):
+			with self.store.subscribe(["Page.loadEventFired", "DOM.documentUpdated"]):
+				self.assertTrue(self.store.admit("DOM.documentUpdated"))
+			self.assertFalse(self.store.admit("DOM.documentUpdated"))
+			self.assertTrue(self.store.admit("Page.loadEventFired"))
+		self.assertFalse(self.store.admit("Page.loadEventFired"))
+
+	def test_waiter_admitted_1(self):
+		future = concurrent.futures.Future()
+		tmp, waiter = self.store.pop_first_or_wait(filter_funcs.check_load_event_fired, future)
+		self.assertTrue(self.store.admit("Page.loadEventFired"))
+		self.assertFalse(self.store.admit("Network.dataReceived"))
+
+		self.store.put(event("Page.loadEventFired"))
+		self.assertEqual(future.result(timeout=1), event("Page.loadEventFired"))
+
+		# An undeclared filter could match anything.
+		self.store.pop_first_or_wait(lambda message: False, concurrent.futures.Future())
+		self.assertTrue(self.store.admit("Network.dataReceived"))
+
+	def test_callback_1(self):
+		got = []
+		handle = self.store.add_callback("Network.dataReceived", got.append)
+		self.assertTrue(self.store.admit("Network.dataReceived"))
+
+		self.store.put(event("Network.dataReceived", requestId="1"))
+		self.assertEqual(got, [event("Network.dataReceived", requestId="1")])
+		# Delivered to the callback, but not kept.
+		self.assertEqual(len(self.store), 0)
+		self.assertEqual(self.store.stats()['filtered'], 0)
+
+		handle.close()
+		self.store.put(event("Network.dataReceived", requestId="2"))
+		self.assertEqual(len(got), 1)
+
+	def test_dispatch_1(self):
+		got = []
+		self.store.add_callback("Page.frameNavigated", got.append)
+		self.store.dispatch(event("Page.frameNavigated", frameId="1"))
+		self.store.dispatch({"id" : 3, "result" : {}})
+		self.assertEqual(got, [event("Page.frameNavigated", frameId="1")])
+		# Only the callbacks are run. The message isn't stored.
+		self.assertEqual(len(self.store), 0)
+
+	def test_ignore_id_1(self):
+		# Already buffered: the response is removed.
+		self.store.put({"id" : 3, "result" : {}})
+		self.store.ignore_id(3)
+		self.assertEqual(len(self.store), 0)
+
+		# Not arrived yet: the response is dropped when it is put.
+		self.store.ignore_id(4)
+		self.store.put({"id" : 4, "result" : {}})
+		self.assertEqual(len(self.store), 0)
+
+		# Only the once.
+		self.store.put({"id" : 4, "result" : {}})
+		self.assertEqual(len(self.store), 1)
+
+	def test_callback_exception_1(self):
+		def bad(message):
+			raise RuntimeError("Lol")
+		got = []
+		self.store.add_callback("Page.loadEventFired", bad)
+		self.store.add_callback("Page.loadEventFired", got.append)
+		self.store.put(event("Page.loadEventFired"))
+		self.assertEqual(got, [event("Page.loadEventFired")])
+
+	def test_response_only_filter_1(self):
+		store = MessageStore()
+		store.put(event("Network.dataReceived"))
+		store.put({"id" : 3, "result" : {}})
+
+		check = filter_funcs.for_methods()(lambda message: message.get('id') == 3)
+		self.assertEqual(store.pop_first(check), {"id" : 3, "result" : {}})
+		self.assertEqual(len(store), 1)
@@ -0,0 +1,59 @@
+import unittest
+import time
+
+import ChromeController
+
+from . import testing_server
+
+
+CHROME_BINARY_NAME = "google-chrome"
+
+class TestProcessPool(unittest.TestCase):
+	def setUp(self):
+		self.pool = ChromeController.ChromiumProcessPool(CHROME_BINARY_NAME, pool_size=2, max_uses=2)
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.pool.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def wait_for_idle(self, count, timeout=30):
+		timeout_at = time.time() + timeout
+		while self.pool.idle_count() < count and time.time() < timeout_at:
+			time.sleep(0.1)
+		self.assertEqual(self.pool.idle_count(), count)
+
+	def test_fetch_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+		with self.pool.tab() as tab:
+			resp = tab.blocking_navigate_and_get_source(tgturl)
+
+		self.assertEqual(resp['content'], 'Root OK?')
+		self.assertEqual(resp['binary'], False)
+		self.assertEqual(resp['mimetype'], "text/html")
+
+	def test_refill_1(self):
+		self.wait_for_idle(2)
+
+		tab_1 = self.pool.acquire()
+		tab_2 = self.pool.acquire()
+		self.assertEqual(self.pool.active_count(), 2)
+
+		# The two handed out instances are replaced in the background.
+		self.wait_for_idle(2)
+
+		self.pool.release(tab_1)
+		self.pool.release(tab_2)
+		self.assertEqual(self.pool.active_count(), 0)
+		self.assertEqual(self.pool.idle_count(), 2)
+
+	def test_recycle_1(self):
+		self.wait_for_idle(2)
+
+		for x in range(5):
+			with self.pool.tab() as tab:
+				ret = tab.Runtime_evaluate(expression="{} + 1".format(x), returnByValue=True)
+				self.assertEqual(ret['result']['result']['value'], x + 1)
+
+		self.wait_for_idle(2)
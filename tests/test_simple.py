@@ -1,3 +1,4 @@
+import io
 import unittest
 import socket
 import json
@@ -21,6 +22,43 @@ class TestPlainCreation(unittest.TestCase):
 
 
 
+class TestStreamedFetch(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_stream_1(self):
+		with ChromeController.ChromeContext(binary=CHROME_BINARY_NAME) as cr:
+			with cr.stream_navigate_response_body("http://localhost:{}/binary_ctnt".format(self.mock_server_port), chunk_size=4) as stream:
+				self.assertEqual(stream.status, 200)
+				self.assertEqual(stream.mimetype, "image/jpeg")
+				self.assertEqual(b"".join(stream), b"Binary!\x00\x01\x02\x03")
+				self.assertEqual(stream.size, 11)
+
+	def test_stream_error_1(self):
+		# Grab a port nothing is listening on.
+		sock = socket.socket()
+		sock.bind(("localhost", 0))
+		port = sock.getsockname()[1]
+		sock.close()
+
+		with ChromeController.ChromeContext(binary=CHROME_BINARY_NAME, use_reader_thread=True) as cr:
+			with self.assertRaises(ChromeController.ChromeError):
+				cr.stream_navigate_response_body("http://localhost:{}/".format(port), timeout=TIMEOUT_SECS)
+			# The navigation's response isn't left waiting on.
+			self.assertEqual(cr.transport._pending, {})
+
+	def test_stream_file_1(self):
+		with ChromeController.ChromeContext(binary=CHROME_BINARY_NAME) as cr:
+			fileobj = io.BytesIO()
+			resp = cr.blocking_navigate_and_get_source("http://localhost:{}/redirect/from-1".format(self.mock_server_port), timeout=TIMEOUT_SECS, fileobj=fileobj)
+			self.assertEqual(fileobj.getvalue(), b'Redirect-To-1')
+			self.assertEqual(resp['size'], len(b'Redirect-To-1'))
+			self.assertEqual(resp['binary'], True)
+
 class TestSimpleFetch(unittest.TestCase):
 	def setUp(self):
 
@@ -1,3 +1,5 @@
+import sys
+import time
 import unittest
 import socket
 import json
@@ -192,3 +194,162 @@ class TestChromium(unittest.TestCase):
 			# print("Active tabs from manager:", tab_pool_tabs_1)
 			self.assertLess(len(targets['result']['targetInfos']), 5)
 			self.assertLess(tab_pool_tabs_1, 2)
+
+
+	def test_evict_checked_out_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl) as held:
+			# Fill the pool, evicting the tab we're holding.
+			for x in range(12):
+				with self.cr.tab(url=tgturl, extra_id=x) as tab:
+					tab.get_page_url_title()
+
+			# It's only closed once it's released.
+			resp = held.blocking_navigate_and_get_source(tgturl)
+			self.assertEqual(resp['content'], 'Root OK?')
+
+		self.cr.close_tabs()
+		self.assertEqual(self.cr.active_tabs(), 0)
+
+	def test_evict_checked_out_2(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl) as held:
+			for x in range(30):
+				with self.cr.tab(url=tgturl, extra_id=x) as tab:
+					tab.get_page_url_title()
+
+			# Holding an evicted tab doesn't stop the tabs evicted after it from being closed.
+			time.sleep(1)
+			targets = held.Target_getTargets()
+			pages = [target for target in targets['result']['targetInfos'] if target['type'] == 'page']
+			self.assertLess(len(pages), 15)
+
+class TestPoolStartup(unittest.TestCase):
+	def test_failed_start_1(self):
+		errors = []
+		hook, sys.unraisablehook = sys.unraisablehook, errors.append
+		try:
+			with self.assertRaises(RuntimeError):
+				ChromeController.TabPooledChromium("/nonexistent/chromium")
+		finally:
+			sys.unraisablehook = hook
+		# Tearing down the half constructed pool mustn't fail either.
+		self.assertEqual(errors, [])
+
+class TestRecycledTabs(unittest.TestCase):
+	def setUp(self):
+		self.cr = ChromeController.TabPooledChromium(CHROME_BINARY_NAME, tab_pool_max_size=2, recycle_tabs=True)
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.mock_server.shutdown()
+		self.cr.close()
+
+	def test_recycle_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		for x in range(6):
+			with self.cr.tab(url=tgturl, extra_id=x) as tab:
+				tab.update_headers({"X-Test" : str(x)})
+				resp = tab.blocking_navigate_and_get_source(tgturl)
+				self.assertEqual(resp['content'], 'Root OK?')
+
+		with self.cr.tab(url=tgturl, extra_id="fresh") as tab:
+			targets = tab.Target_getTargets()
+			self.assertLessEqual(len(targets['result']['targetInfos']), 4)
+
+	def test_reset_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl) as tab:
+			tab.blocking_navigate_and_get_source(tgturl)
+			tab.reset_tab()
+			self.assertEqual(tab.get_current_url(), "about:blank")
+
+	def test_reset_other_origins_1(self):
+		url_a = "http://localhost:{}/".format(self.mock_server_port)
+		url_b = "http://127.0.0.1:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=url_a) as tab:
+			tab.blocking_navigate_and_get_source(url_a)
+			tab.Runtime_evaluate(expression="localStorage.setItem('key', 'value')")
+
+			# Storage written by an origin the tab has since navigated away from is cleared too.
+			tab.blocking_navigate_and_get_source(url_b)
+			tab.reset_tab()
+
+			tab.blocking_navigate_and_get_source(url_a)
+			ret = tab.Runtime_evaluate(expression="localStorage.getItem('key')", returnByValue=True)
+			self.assertEqual(ret['result']['result'].get('value'), None)
+
+	def test_reset_navigated_origin_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl) as tab:
+			# The navigation's own events are consumed by `blocking_navigate()`, but its origin is still tracked.
+			tab.blocking_navigate(tgturl)
+			self.assertIn("http://localhost:{}".format(self.mock_server_port), tab.visited_origins)
+			tab.Runtime_evaluate(expression="localStorage.setItem('key', 'value')")
+
+			# Leave the origin, so it's only cleared because it was tracked.
+			tab.Page_navigate(url="about:blank")
+			tab.reset_tab()
+			self.assertEqual(tab.visited_origins, set())
+
+			tab.blocking_navigate(tgturl)
+			ret = tab.Runtime_evaluate(expression="localStorage.getItem('key')", returnByValue=True)
+			self.assertEqual(ret['result']['result'].get('value'), None)
+
+class TestShardedChromium(unittest.TestCase):
+	def setUp(self):
+		self.cr = ChromeController.ShardedTabPooledChromium(CHROME_BINARY_NAME, shards=2)
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.mock_server.shutdown()
+		self.cr.close()
+
+	def test_tab_repeatability_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl) as tab:
+			resp = tab.blocking_navigate_and_get_source(tgturl)
+		self.assertEqual(resp['content'], 'Root OK?')
+
+		with self.cr.tab(url=tgturl) as tab:
+			self.assertEqual(tab.get_current_url(), tgturl)
+
+	def test_recycle_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		shard_id = self.cr.shard_for(url=tgturl)
+		self.assertEqual(sorted(self.cr.shard_ids()), [0, 1])
+
+		self.cr.recycle_shard(shard_id)
+
+		# The key is served by the other shard until the replacement is up.
+		with self.cr.tab(url=tgturl) as tab:
+			resp = tab.blocking_navigate_and_get_source(tgturl)
+		self.assertEqual(resp['content'], 'Root OK?')
+
+class TestIsolatedContexts(unittest.TestCase):
+	def setUp(self):
+		self.cr = ChromeController.TabPooledChromium(CHROME_BINARY_NAME, tab_pool_max_size=2, isolate_contexts=True)
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.mock_server.shutdown()
+		self.cr.close()
+
+	def test_cookie_isolation_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		with self.cr.tab(url=tgturl, extra_id="a") as tab:
+			self.assertIsNotNone(tab.browser_context_id)
+			tab.blocking_navigate_and_get_source(tgturl + "cookie_test")
+			self.assertEqual(len(tab.get_cookies()), 1)
+
+		with self.cr.tab(url=tgturl, extra_id="b") as tab:
+			self.assertEqual(tab.get_cookies(), [])
+
+	def test_context_disposal_1(self):
+		tgturl = "http://localhost:{}/".format(self.mock_server_port)
+		for x in range(4):
+			with self.cr.tab(url=tgturl, extra_id=x) as tab:
+				tab.get_page_url_title()
+
+		self.cr.close_tabs()
+		self.assertEqual(self.cr.chrome_interface.transport.tab_contexts, {})
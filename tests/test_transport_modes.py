@@ -0,0 +1,463 @@
+import os
+import sys
+import socket
+import unittest
+import threading
+import subprocess
+import asyncio
+import websocket
+
+import ChromeController
+import ChromeController.transport
+import ChromeController.filter_funcs
+from . import testing_server
+
+CHROME_BINARY_NAME = "google-chrome"
+TIMEOUT_SECS       = 5
+
+
+class TestReaderThread(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+		self.cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, use_reader_thread=True)
+
+	def tearDown(self):
+		self.cr.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_fetch_1(self):
+		resp = self.cr.blocking_navigate_and_get_source("http://localhost:{}".format(self.mock_server_port), timeout=TIMEOUT_SECS)
+		self.assertEqual(resp['content'], 'Root OK?')
+		self.assertEqual(resp['binary'], False)
+		self.assertEqual(resp['mimetype'], "text/html")
+
+	def test_many_commands_1(self):
+		for x in range(100):
+			ret = self.cr.Runtime_evaluate(expression="{} + 1".format(x), returnByValue=True)
+			self.assertEqual(ret['result']['result']['value'], x + 1)
+
+	def test_multiple_tabs_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+		tab_1 = self.cr.new_tab()
+		tab_2 = self.cr.new_tab()
+
+		resp_1 = tab_1.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS)
+		resp_2 = tab_2.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS)
+		self.assertEqual(resp_1['content'], 'Root OK?')
+		self.assertEqual(resp_2['content'], 'Root OK?')
+
+		tab_1.close()
+		tab_2.close()
+
+
+class TestConcurrentTabs(unittest.TestCase):
+	def run_tabs(self, cr, count=4, commands=50):
+		errors = []
+		def worker(tab):
+			try:
+				for x in range(commands):
+					ret = tab.Runtime_evaluate(expression="{} + 1".format(x), returnByValue=True)
+					self.assertEqual(ret['result']['result']['value'], x + 1)
+			except Exception as e:
+				errors.append(e)
+
+		tabs = [cr.new_tab() for dummy_x in range(count)]
+		threads = [threading.Thread(target=worker, args=(tab, )) for tab in tabs]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		for tab in tabs:
+			tab.close()
+		self.assertEqual(errors, [])
+
+	def test_polling_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+		try:
+			self.run_tabs(cr)
+		finally:
+			cr.close()
+
+	def test_flattened_reader_thread_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, flatten_sessions=True, use_reader_thread=True)
+		try:
+			self.run_tabs(cr)
+		finally:
+			cr.close()
+
+
+class TestAsyncInterface(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+		self.loop = asyncio.new_event_loop()
+
+	def tearDown(self):
+		self.loop.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_fetch_1(self):
+		async def fetch():
+			async with ChromeController.AsyncChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME) as cr:
+				return await cr.blocking_navigate_and_get_source("http://localhost:{}".format(self.mock_server_port), timeout=TIMEOUT_SECS)
+
+		resp = self.loop.run_until_complete(fetch())
+		self.assertEqual(resp['content'], 'Root OK?')
+		self.assertEqual(resp['binary'], False)
+		self.assertEqual(resp['mimetype'], "text/html")
+
+	def test_concurrent_tabs_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+
+		async def fetch():
+			async with ChromeController.AsyncChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME) as cr:
+				tabs = [await cr.new_tab() for x in range(5)]
+				ret = await asyncio.gather(*[tab.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS) for tab in tabs])
+				for tab in tabs:
+					await tab.close()
+				return ret
+
+		resps = self.loop.run_until_complete(fetch())
+		self.assertEqual(len(resps), 5)
+		for resp in resps:
+			self.assertEqual(resp['content'], 'Root OK?')
+
+	def test_gathered_tabs_1(self):
+		async def create():
+			async with ChromeController.AsyncChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME) as cr:
+				tabs = await asyncio.gather(*[cr.new_tab() for x in range(10)])
+				ids = [cr.transport.tab_id_map[tab.tab_id]['id'] for tab in tabs]
+				known = set(cr.transport.targets)
+				for tab in tabs:
+					await tab.close()
+				return ids, known
+
+		ids, known = self.loop.run_until_complete(create())
+		self.assertEqual(len(set(ids)), 10)
+		self.assertTrue(set(ids) <= known)
+
+
+class TestEventCallbacks(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def check_callbacks(self, cr):
+		got = []
+		cr.on("Page.frameNavigated", got.append)
+		cr.Page_navigate(url="http://localhost:{}".format(self.mock_server_port))
+
+		@ChromeController.filter_funcs.for_methods("Page.frameNavigated")
+		def check_func(message):
+			return message['method'] == "Page.frameNavigated"
+
+		# Events handed straight to a waiter still go to the callbacks.
+		message = cr.transport.recv_filtered(check_func, tab_key=cr.tab_id, timeout=TIMEOUT_SECS)
+		self.assertIn(message, got)
+
+	def test_reader_thread_1(self):
+		with ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, use_reader_thread=True) as cr:
+			self.check_callbacks(cr)
+
+	def test_polling_1(self):
+		with ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME) as cr:
+			self.check_callbacks(cr)
+
+
+class TestBatchCommands(unittest.TestCase):
+	def setUp(self):
+		self.cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+
+	def tearDown(self):
+		self.cr.close()
+
+	def test_batch_1(self):
+		rets = self.cr.batch_command([("Runtime.evaluate", {"expression" : "{} * 2".format(x), "returnByValue" : True}) for x in range(20)])
+		self.assertEqual(len(rets), 20)
+		for x, ret in enumerate(rets):
+			self.assertEqual(ret['result']['result']['value'], x * 2)
+
+	def test_batch_error_1(self):
+		with self.assertRaises(ChromeController.ChromeError):
+			self.cr.batch_command([("Page.enable", None), ("Not.aRealCommand", None)])
+
+	def test_batch_timeout_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, use_reader_thread=True)
+		try:
+			never = {"expression" : "new Promise(() => {})", "awaitPromise" : True}
+			with self.assertRaises(ChromeController.ChromeResponseNotReceived):
+				cr.transport.batch_command([("Runtime.evaluate", never), ("Runtime.evaluate", {"expression" : "1"})], tab_key=cr.tab_id, timeout=0.5)
+			# Nothing is left waiting on the rest of the batch.
+			self.assertEqual(cr.transport._pending, {})
+		finally:
+			cr.close()
+
+
+class TestPeekMethod(unittest.TestCase):
+	def test_event_1(self):
+		self.assertEqual(ChromeController.transport._peek_method('{"method":"Network.dataReceived","params":{}}'), "Network.dataReceived")
+
+	def test_not_event_1(self):
+		self.assertEqual(ChromeController.transport._peek_method('{"id":5,"result":{}}'), None)
+		self.assertEqual(ChromeController.transport._peek_method('{"params":{},"method":"Page.loadEventFired"}'), None)
+		# Only chromium's compact layout is peeked (as by `json_codec.peek_params()`). Anything
+		# else is decoded to find out what it is.
+		self.assertEqual(ChromeController.transport._peek_method('{"method": "Page.loadEventFired", "params": {}}'), None)
+		self.assertEqual(ChromeController.transport._peek_method(''), None)
+		self.assertEqual(ChromeController.transport._peek_method(b'{"method":"Page.loadEventFired"}'), None)
+
+
+class TestFlattenedSessions(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+		self.cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, flatten_sessions=True)
+
+	def tearDown(self):
+		self.cr.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_fetch_1(self):
+		resp = self.cr.blocking_navigate_and_get_source("http://localhost:{}".format(self.mock_server_port), timeout=TIMEOUT_SECS)
+		self.assertEqual(resp['content'], 'Root OK?')
+
+	def test_multiple_tabs_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+		tab_1 = self.cr.new_tab()
+		tab_2 = self.cr.new_tab()
+
+		# Every tab shares the one browser socket.
+		self.assertIs(self.cr.transport.soclist[tab_1.tab_id], self.cr.transport.soclist[tab_2.tab_id])
+
+		resp_1 = tab_1.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS)
+		resp_2 = tab_2.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS)
+		self.assertEqual(resp_1['content'], 'Root OK?')
+		self.assertEqual(resp_2['content'], 'Root OK?')
+
+		tab_1.close()
+		tab_2.close()
+
+
+class TestDebugPipe(unittest.TestCase):
+	def setUp(self):
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+		self.cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, debug_pipe=True, use_reader_thread=True)
+
+	def tearDown(self):
+		self.cr.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_fetch_1(self):
+		self.assertEqual(self.cr.transport.port, None)
+		resp = self.cr.blocking_navigate_and_get_source("http://localhost:{}".format(self.mock_server_port), timeout=TIMEOUT_SECS)
+		self.assertEqual(resp['content'], 'Root OK?')
+
+	def test_multiple_tabs_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+		tab_1 = self.cr.new_tab()
+
+		self.assertIs(self.cr.transport.soclist[tab_1.tab_id], self.cr.transport.pipe)
+
+		resp_1 = tab_1.blocking_navigate_and_get_source(tgturl, timeout=TIMEOUT_SECS)
+		self.assertEqual(resp_1['content'], 'Root OK?')
+
+		tab_1.close()
+
+
+class TestPipeConnection(unittest.TestCase):
+	def setUp(self):
+		cmd_read, cmd_write = os.pipe()
+		resp_read, resp_write = os.pipe()
+		self.remote_read, self.remote_write = cmd_read, resp_write
+		self.conn = ChromeController.transport._PipeConnection(resp_read, cmd_write, timeout=1)
+
+	def tearDown(self):
+		self.conn.close()
+		os.close(self.remote_read)
+		os.close(self.remote_write)
+
+	def test_frames_1(self):
+		self.conn.send('{"id":1,"method":"Target.getTargets"}')
+		self.assertEqual(os.read(self.remote_read, 1024), b'{"id":1,"method":"Target.getTargets"}\0')
+
+		# Frames can be split across (or share) reads.
+		os.write(self.remote_write, b'{"id":1,"result":{}}\0{"id":2,')
+		self.assertEqual(self.conn.recv(), '{"id":1,"result":{}}')
+		os.write(self.remote_write, b'"result":{}}\0')
+		self.assertEqual(self.conn.recv(), '{"id":2,"result":{}}')
+
+	def test_timeout_1(self):
+		self.conn.settimeout(0.1)
+		with self.assertRaises(socket.timeout):
+			self.conn.recv()
+
+	def test_closed_1(self):
+		os.close(self.remote_write)
+		self.remote_write = os.open(os.devnull, os.O_WRONLY)
+		with self.assertRaises(websocket.WebSocketConnectionClosedException):
+			self.conn.recv()
+		self.assertFalse(self.conn.connected)
+
+	def test_close_while_reading_1(self):
+		self.conn.settimeout(None)
+		errors = []
+		def reader():
+			try:
+				self.conn.recv()
+			except Exception as e:
+				errors.append(e)
+		thread = threading.Thread(target=reader)
+		thread.start()
+
+		# The reader is woken up, rather than left blocked on a closed descriptor.
+		self.conn.close()
+		thread.join(timeout=TIMEOUT_SECS)
+		self.assertFalse(thread.is_alive())
+		self.assertEqual([type(e) for e in errors], [websocket.WebSocketConnectionClosedException])
+		with self.assertRaises(websocket.WebSocketConnectionClosedException):
+			self.conn.send('{"id":1,"method":"Target.getTargets"}')
+
+	def test_preexec_fds_1(self):
+		cmd_read, cmd_write = os.pipe()
+		resp_read, resp_write = os.pipe()
+		try:
+			proc = subprocess.Popen([sys.executable, "-c", "import os; print(sorted(int(fd) for fd in os.listdir('/proc/self/fd')))"],
+					stdout     = subprocess.PIPE,
+					preexec_fn = ChromeController.transport._pipe_preexec(None, cmd_read, resp_write),
+					pass_fds   = (3, 4),
+				)
+			out, dummy_err = proc.communicate(timeout=TIMEOUT_SECS)
+		finally:
+			for fd in (cmd_read, cmd_write, resp_read, resp_write):
+				os.close(fd)
+
+		# Only the standard streams and the two pipe ends are inherited. Anything else is the
+		# descriptor `listdir()` itself has open.
+		fds = eval(out)
+		self.assertEqual(fds[:5], [0, 1, 2, 3, 4])
+		self.assertLessEqual(len(fds), 6)
+
+
+class TestPeekSession(unittest.TestCase):
+	def test_session_1(self):
+		self.assertEqual(ChromeController.transport._peek_session('{"id":5,"result":{},"sessionId":"AB12"}'), "AB12")
+		self.assertEqual(ChromeController.transport._peek_session('{"method":"Page.loadEventFired","params":{"timestamp":1},"sessionId":"AB12"}'), "AB12")
+
+	def test_no_session_1(self):
+		self.assertEqual(ChromeController.transport._peek_session('{"id":5,"result":{}}'), None)
+		self.assertEqual(ChromeController.transport._peek_session('{"method":"Target.detachedFromTarget","params":{"sessionId":"AB12"}}'), None)
+		self.assertEqual(ChromeController.transport._peek_session(''), None)
+
+
+class TestTargetIndex(unittest.TestCase):
+	def setUp(self):
+		self.cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+
+	def tearDown(self):
+		self.cr.close()
+
+	def test_tab_lifecycle_1(self):
+		tab = self.cr.new_tab()
+		cr_tab_id = self.cr.transport.tab_id_map[tab.tab_id]['id']
+		self.assertIn(cr_tab_id, self.cr.transport.targets)
+
+		tab.close()
+		self.assertNotIn(cr_tab_id, self.cr.transport.targets)
+		self.assertNotIn(tab.tab_id, self.cr.transport.tab_id_map)
+
+	def test_tab_state_1(self):
+		tab = self.cr.new_tab()
+		tab.get_page_url_title()
+		sock = self.cr.transport.soclist[tab.tab_id]
+
+		tab.close()
+		# Nothing is left behind for the closed tab.
+		self.assertFalse(sock.connected)
+		self.assertNotIn(tab.tab_id, self.cr.transport.soclist)
+		self.assertNotIn(tab.tab_id, self.cr.transport.messages)
+		self.assertNotIn(tab.tab_id, self.cr.transport.socket_locks)
+
+
+class TestOutputReader(unittest.TestCase):
+	def reader(self, script):
+		proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+		reader = ChromeController.transport._OutputReader(proc.stdout)
+		reader.start()
+		self.addCleanup(proc.wait)
+		return reader
+
+	def test_listening_1(self):
+		reader = self.reader("import sys; print('noise', flush=True); sys.stderr.write('DevTools listening on ws://127.0.0.1:9222/devtools/browser/x\\n')")
+		self.assertTrue(reader.listening.wait(TIMEOUT_SECS))
+		self.assertEqual(reader.devtools_url, "ws://127.0.0.1:9222/devtools/browser/x")
+		reader.join(TIMEOUT_SECS)
+		self.assertEqual(reader.output(), "noise\nDevTools listening on ws://127.0.0.1:9222/devtools/browser/x")
+
+	def test_exited_1(self):
+		reader = self.reader("print('failed')")
+		self.assertTrue(reader.listening.wait(TIMEOUT_SECS))
+		self.assertEqual(reader.devtools_url, None)
+		reader.join(TIMEOUT_SECS)
+		self.assertEqual(reader.output(), "failed")
+
+	def test_startup_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+		try:
+			self.assertTrue(cr.transport.output_reader.listening.is_set())
+			self.assertTrue(cr.transport.output_reader.devtools_url.startswith("ws://"))
+		finally:
+			cr.close()
+
+class TestProcessMonitor(unittest.TestCase):
+	def test_exited_1(self):
+		proc = subprocess.Popen([sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE)
+		monitor = ChromeController.transport._ProcessMonitor(proc)
+		monitor.start()
+		self.assertFalse(monitor.exited.wait(0.2))
+		proc.stdin.close()
+		self.assertTrue(monitor.exited.wait(TIMEOUT_SECS))
+		self.assertEqual(proc.returncode, 0)
+
+	def test_died_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+		try:
+			cr.transport.cr_proc.kill()
+			self.assertTrue(cr.transport.process_monitor.exited.wait(TIMEOUT_SECS))
+			with self.assertRaises(ChromeController.ChromeDiedError):
+				cr.get_page_url_title()
+		finally:
+			cr.transport.close_websockets()
+			cr.transport.close_chromium()
+
+class TestLifecycle(unittest.TestCase):
+	def test_context_manager_1(self):
+		with ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME) as cr:
+			cr.get_page_url_title()
+			proc = cr.transport.cr_proc
+			port = cr.transport.port
+		self.assertIsNotNone(proc.poll())
+		self.assertNotIn(port, ChromeController.transport.ACTIVE_PORTS)
+
+	def test_finalizer_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME)
+		proc = cr.transport.cr_proc
+		port = cr.transport.port
+		del cr
+		# No garbage collection pass is needed for the transport to be torn down.
+		self.assertIsNotNone(proc.wait(timeout=TIMEOUT_SECS))
+		self.assertNotIn(port, ChromeController.transport.ACTIVE_PORTS)
+
+	def test_finalizer_reader_thread_1(self):
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, use_reader_thread=True)
+		cr.get_page_url_title()
+		finalizer = cr.transport._finalizer
+		proc = cr.transport.cr_proc
+		del cr
+		# The reader threads must not keep the transport alive.
+		self.assertFalse(finalizer.alive)
+		self.assertIsNotNone(proc.wait(timeout=TIMEOUT_SECS))
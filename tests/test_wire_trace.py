@@ -0,0 +1,50 @@
+import unittest
+import logging
+
+import ChromeController
+from ChromeController import wire_trace
+
+CHROME_BINARY_NAME = "google-chrome"
+
+
+class TestWireTrace(unittest.TestCase):
+	def test_record_1(self):
+		trace = wire_trace.WireTrace()
+		trace("send", "tab", '{"id":1,"method":"Page.enable"}')
+		trace("recv", "tab", '{"id":1,"result":{}}')
+		self.assertEqual([frame[1:] for frame in trace.frames], [
+				("send", "tab", '{"id":1,"method":"Page.enable"}'),
+				("recv", "tab", '{"id":1,"result":{}}'),
+			])
+		self.assertEqual(len(trace.dump().split("\n")), 2)
+
+	def test_truncate_1(self):
+		trace = wire_trace.WireTrace(max_frame_size=10)
+		trace("recv", "tab", "x" * 1000)
+		self.assertEqual(trace.frames[0][3], "x" * 10 + "... (990 characters truncated)")
+
+	def test_max_frames_1(self):
+		trace = wire_trace.WireTrace(max_frames=3)
+		for x in range(10):
+			trace("send", "tab", str(x))
+		self.assertEqual([frame[3] for frame in trace.frames], ["7", "8", "9"])
+		trace.clear()
+		self.assertEqual(trace.dump(), "")
+
+	def test_log_1(self):
+		trace = wire_trace.WireTrace(log_frames=True)
+		with self.assertLogs("Main.ChromeController.WireTrace", level=logging.DEBUG) as logs:
+			trace("send", "tab", "frame")
+		self.assertEqual(len(logs.output), 1)
+
+	def test_transport_1(self):
+		trace = ChromeController.WireTrace()
+		cr = ChromeController.ChromeRemoteDebugInterface(binary=CHROME_BINARY_NAME, wire_trace=trace)
+		try:
+			trace.clear()
+			cr.Runtime_evaluate(expression="1 + 1")
+			directions = [frame[1] for frame in trace.frames]
+			self.assertIn("send", directions)
+			self.assertIn("recv", directions)
+		finally:
+			cr.close()
@@ -0,0 +1,43 @@
+import unittest
+import queue
+
+import ChromeController
+
+from . import testing_server
+
+
+CHROME_BINARY_NAME = "google-chrome"
+
+class TestWorkerPool(unittest.TestCase):
+	def setUp(self):
+		self.pool = ChromeController.ChromiumWorkerPool(CHROME_BINARY_NAME, workers=2, queue_size=2)
+		self.mock_server_port, self.mock_server, self.mock_server_thread = testing_server.start_server(self, {})
+
+	def tearDown(self):
+		self.pool.close()
+		self.mock_server.shutdown()
+		self.mock_server_thread.join()
+
+	def test_fetch_1(self):
+		tgturl = "http://localhost:{}".format(self.mock_server_port)
+		job_id = self.pool.submit(tgturl)
+		result = self.pool.get_result(timeout=60)
+
+		self.assertEqual(result.job_id, job_id)
+		self.assertEqual(result.error, None)
+		self.assertEqual(result.result['content'], 'Root OK?')
+		self.assertEqual(self.pool.pending_count(), 0)
+
+	def test_map_1(self):
+		tgturls = ["http://localhost:{}/?{}".format(self.mock_server_port, x) for x in range(6)]
+		results = list(self.pool.map(tgturls))
+
+		self.assertEqual(sorted(result.url for result in results), sorted(tgturls))
+		for result in results:
+			self.assertEqual(result.error, None)
+
+	def test_bad_mode_1(self):
+		with self.assertRaises(ValueError):
+			self.pool.submit("http://localhost:{}".format(self.mock_server_port), mode="not-a-mode")
+		with self.assertRaises(queue.Empty):
+			self.pool.get_result(timeout=0.1)